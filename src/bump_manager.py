@@ -6,6 +6,7 @@ import math
 import time
 import subprocess
 import json
+from collections import deque
 
 try:
     from mutagen import File as _mutagen_file
@@ -86,7 +87,7 @@ class BumpManager:
         self._music_queue = []   # list[int] indices into music_files
 
         # Unified bump queue (complete bumps: script + chosen music + chosen outro).
-        self._bump_queue = []  # list[dict]
+        self._bump_queue = deque()  # deque[dict]; drawn from the left
         # 0 means "auto" (build as many complete bumps as feasible).
         self._bump_queue_size = 0
 
@@ -172,7 +173,7 @@ class BumpManager:
         self.outro_sounds = out
         # Clear transient queue so the next bump queue rebuild reselects.
         self._outro_queue = []
-        self._bump_queue = []
+        self._bump_queue = deque()
 
     def _norm_path_key(self, path: str) -> str:
         try:
@@ -979,7 +980,7 @@ class BumpManager:
         - Queue size is capped by the bottleneck component count.
         - Selection favors the least-exposed components (random among ties).
         """
-        self._bump_queue = []
+        self._bump_queue = deque()
 
         if not self.bump_scripts:
             return
@@ -1610,6 +1611,10 @@ class BumpManager:
         except Exception:
             self._last_bump_queue_stats = None
 
+    def has_bumps(self) -> bool:
+        """True when a bump can be served (a queued item or at least one script)."""
+        return bool(self._bump_queue) or bool(self.bump_scripts)
+
     def get_random_bump(self):
         """
         Returns {'script': dict, 'audio': str} or None
@@ -1621,7 +1626,7 @@ class BumpManager:
             return None
 
         try:
-            item = self._bump_queue.pop(0)
+            item = self._bump_queue.popleft()
         except Exception:
             return None
 
@@ -1863,7 +1868,7 @@ class BumpManager:
             self._script_exposure_seeded_last_changed = False
 
         # Scripts inventory changed; rebuild complete-bump queue lazily.
-        self._bump_queue = []
+        self._bump_queue = deque()
                     
     def _parse_bump_file(self, filepath):
         try:
@@ -3026,7 +3031,7 @@ class BumpManager:
             self.seed_initial_music_exposure_scores(initial_score=1.0)
         except Exception:
             self._music_exposure_seeded_last_changed = False
-        self._bump_queue = []
+        self._bump_queue = deque()
 
     def scan_bump_videos(
         self,
@@ -12,6 +12,9 @@ import shutil
 import tempfile
 import threading
 import datetime
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QPushButton, QFileDialog, QTreeWidget, 
@@ -20,15 +23,15 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QDockWidget, QFrame, QSizePolicy, QToolButton, QStyle, QGridLayout,
                                QStyleOptionButton, QStyleOptionToolButton, QStylePainter, QStyleOptionSlider,
                                QLineEdit, QProgressBar, QDialog, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
-                               QAbstractButton)
-from PySide6.QtCore import Qt, QTimer, QSize, Signal, QPropertyAnimation, QEasingCurve, QRect, QEvent, QObject, QThread, Slot, QPoint, QEventLoop, QFileSystemWatcher
-from PySide6.QtGui import QAction, QActionGroup, QIcon, QFont, QFontDatabase, QColor, QPalette, QPixmap, QPainter, QBrush, QLinearGradient, QRadialGradient, QPen, QPainterPath, QImage, QKeySequence, QShortcut, QCursor, QGuiApplication
-from PySide6.QtCore import QUrl
+                               QAbstractButton, QListView, QButtonGroup)
+from PySide6.QtCore import Qt, QTimer, QSize, Signal, QPropertyAnimation, QEasingCurve, QRect, QEvent, QObject, QThread, Slot, QPoint, QEventLoop, QFileSystemWatcher, QStringListModel
+from PySide6.QtGui import QAction, QActionGroup, QIcon, QFont, QFontDatabase, QColor, QPalette, QPixmap, QPainter, QBrush, QLinearGradient, QRadialGradient, QPen, QPainterPath, QImage, QFontMetrics, QStaticText, QKeySequence, QShortcut, QCursor, QGuiApplication
+from PySide6.QtCore import QUrl, SLOT
 
 from player_backend import MpvPlayer, MpvAudioPlayer
 from PySide6.QtCore import QAbstractNativeEventFilter
 from keep_awake import KeepAwakeInhibitor
-from playlist_manager import PlaylistManager, VIDEO_EXTENSIONS, natural_sort_key
+from playlist_manager import PlaylistManager, VIDEO_EXTENSIONS, natural_sort_key, annotate_display_names, strip_display_names
 from ui_styles import DARK_THEME
 
 from services import playlist_io
@@ -37,11 +40,83 @@ from services import playlist_io
 from services import web_mode_paths
 
 
+# platform.system() never changes at runtime; mount probing consults it on every call.
+_PLATFORM = (platform.system() or '').lower()
+_IS_WIN = _PLATFORM.startswith('win')
+_IS_MAC = _PLATFORM == 'darwin'
+
 THEME_COLOR = "#0e1a77"
 
 # White strokes are intentionally transparent so the global background gradient shows through.
 WHITE_STROKE_ALPHA = 0
 
+# Controls bar background. Installed once; fullscreen overlay mode only flips the
+# `overlay` dynamic property so toggling doesn't re-parse the stylesheet.
+_CONTROLS_QSS = """
+#controls_widget, #controls_widget QWidget { background-color: #1a1a1a; }
+#controls_widget[overlay="true"], #controls_widget[overlay="true"] QWidget { background-color: rgba(26, 26, 26, 200); }
+"""
+
+# Volume slider style; THEME_COLOR is constant so format it once at import.
+_VOL_SLIDER_QSS = f"""
+    QSlider::groove:horizontal {{
+        border: 1px solid #444;
+        height: 10px;
+        background: #333;
+        margin: 0px;
+        border-radius: 5px;
+    }}
+    QSlider::sub-page:horizontal {{
+        background: {THEME_COLOR};
+        border-radius: 5px;
+    }}
+    QSlider::add-page:horizontal {{
+        background: #555;
+        border-radius: 5px;
+    }}
+    QSlider::handle:horizontal {{
+        width: 24px;
+        height: 24px;
+        margin: -7px 0;
+        background: white;
+        border: none;
+        border-radius: 12px;
+    }}
+"""
+
+# Custom menu bar plus the top-right mode buttons (tagged with the `mode` property).
+_MENU_BAR_QSS = f"""
+    * {{
+        background-color: #2b2b2b;
+        border-bottom: 2px solid #1a1a1a;
+    }}
+    QPushButton[mode="true"] {{
+        color: #e0e0e0;
+        background: transparent;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 5px 12px;
+        border: 1px solid transparent;
+        border-radius: 4px;
+    }}
+    QPushButton[mode="true"]:hover {{
+        background: #444;
+    }}
+    QPushButton[mode="true"]:checked {{
+        background: {THEME_COLOR};
+        border-color: {THEME_COLOR};
+    }}
+"""
+
+# (minutes, label) choices offered by the sleep timer dropdown.
+_SLEEP_DURATIONS = (
+    (30, "30 Minutes"),
+    (60, "1 Hour"),
+    (90, "1.5 Hours"),
+    (120, "2 Hours"),
+    (180, "3 Hours"),
+)
+
 
 class _WinFullscreenKeyFilter(QAbstractNativeEventFilter):
     """Windows-only key hook to toggle fullscreen on F.
@@ -60,7 +135,7 @@ class _WinFullscreenKeyFilter(QAbstractNativeEventFilter):
 
     def nativeEventFilter(self, eventType, message):
         try:
-            if not sys.platform.startswith('win'):
+            if not _IS_WIN:
                 return False, 0
             if eventType not in ('windows_generic_MSG', 'windows_dispatcher_MSG'):
                 return False, 0
@@ -92,24 +167,100 @@ class _WinFullscreenKeyFilter(QAbstractNativeEventFilter):
             return False, 0
 
 
+class _WinPowerEventFilter(QAbstractNativeEventFilter):
+    """Windows-only hook for system suspend/resume (WM_POWERBROADCAST).
+
+    Lets the sleep timer freeze its countdown before suspend and re-arm its
+    deadline on wake.
+    """
+
+    WM_POWERBROADCAST = 0x0218
+    PBT_APMSUSPEND = 0x0004
+    PBT_APMRESUMESUSPEND = 0x0007
+    PBT_APMRESUMEAUTOMATIC = 0x0012
+
+    def __init__(self, main_window):
+        super().__init__()
+        self._mw = main_window
+
+    def nativeEventFilter(self, eventType, message):
+        try:
+            if eventType not in ('windows_generic_MSG', 'windows_dispatcher_MSG'):
+                return False, 0
+
+            from ctypes import wintypes
+
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message != self.WM_POWERBROADCAST:
+                return False, 0
+
+            event = int(msg.wParam)
+            if event == self.PBT_APMSUSPEND:
+                self._mw._on_system_suspend()
+            elif event in (self.PBT_APMRESUMESUSPEND, self.PBT_APMRESUMEAUTOMATIC):
+                QTimer.singleShot(0, self._mw._on_system_resume)
+        except Exception:
+            pass
+        # Never consume power notifications.
+        return False, 0
+
+
+class _WinDeviceChangeFilter(QAbstractNativeEventFilter):
+    """Windows-only hook for volume arrival/removal (WM_DEVICECHANGE).
+
+    Drops the cached drive letters and volume labels so autodetect sees hotplugged drives.
+    """
+
+    WM_DEVICECHANGE = 0x0219
+    DBT_DEVICEARRIVAL = 0x8000
+    DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+    def nativeEventFilter(self, eventType, message):
+        try:
+            if eventType not in ('windows_generic_MSG', 'windows_dispatcher_MSG'):
+                return False, 0
+
+            from ctypes import wintypes
+
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message != self.WM_DEVICECHANGE:
+                return False, 0
+
+            if int(msg.wParam) in (self.DBT_DEVICEARRIVAL, self.DBT_DEVICEREMOVECOMPLETE):
+                _windows_cache_bust()
+        except Exception:
+            pass
+        return False, 0
+
+
 class BumpImageView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pixmap = None
         self._mode = 'default'
         self._percent = None
+        # (target w, h, dpr) -> pre-scaled copy of _pixmap; one entry is enough.
+        self._scaled_key = None
+        self._scaled = None
+        # (vw, vh, iw, ih, mode, percent) -> target QRect from the last paint.
+        self._target_key = None
+        self._target = None
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
 
     def clear(self):
         self._pixmap = None
         self._mode = 'default'
         self._percent = None
+        self._scaled_key = None
+        self._scaled = None
         self.update()
 
     def set_image(self, pixmap: QPixmap, *, mode: str = 'default', percent: float | None = None):
         self._pixmap = pixmap if (pixmap is not None and not pixmap.isNull()) else None
         self._mode = str(mode or 'default')
         self._percent = percent
+        self._scaled_key = None
+        self._scaled = None
         self.update()
 
     def _compute_target_rect(self, vw: int, vh: int, iw: int, ih: int):
@@ -191,20 +342,61 @@ class BumpImageView(QWidget):
         vh = int(self.height())
         iw = int(self._pixmap.width())
         ih = int(self._pixmap.height())
-        target = self._compute_target_rect(vw, vh, iw, ih)
+        key = (vw, vh, iw, ih, self._mode, self._percent)
+        if key != self._target_key:
+            self._target_key = key
+            self._target = self._compute_target_rect(vw, vh, iw, ih)
+        target = self._target
         if target.isNull() or target.width() <= 0 or target.height() <= 0:
             return
 
+        # Natural size: plain blit. Otherwise smooth-scale once per target size
+        # and blit the cached copy, so repaints never filter pixels again.
+        pm = self._pixmap
+        if target.width() != iw or target.height() != ih:
+            try:
+                dpr = float(self.devicePixelRatioF())
+            except Exception:
+                dpr = 1.0
+            key = (target.width(), target.height(), dpr)
+            if self._scaled_key != key or self._scaled is None:
+                scaled = self._pixmap.scaled(
+                    int(round(target.width() * dpr)),
+                    int(round(target.height() * dpr)),
+                    Qt.IgnoreAspectRatio,
+                    Qt.SmoothTransformation,
+                )
+                scaled.setDevicePixelRatio(dpr)
+                self._scaled_key = key
+                self._scaled = scaled
+            pm = self._scaled
+
         p = QPainter(self)
         try:
-            p.setRenderHint(QPainter.SmoothPixmapTransform, True)
-            p.drawPixmap(target, self._pixmap)
+            p.drawPixmap(target.topLeft(), pm)
         finally:
             p.end()
 
 
-def _derive_theme_hsl():
-    base = QColor(THEME_COLOR)
+_BUMP_FONT_CACHE = {}
+
+
+def _bump_font(family, px) -> QFont:
+    """Return a shared QFont for bump text so font matching runs once per (family, px)."""
+    key = (family, px)
+    font = _BUMP_FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = QFont(str(family), int(px))
+        except Exception:
+            font = QFont("Arial", 28, QFont.Bold)
+        _BUMP_FONT_CACHE[key] = font
+    return font
+
+
+@lru_cache(maxsize=1)
+def _derive_theme_hsl(theme_color: str):
+    base = QColor(theme_color)
     h, s, l, _a = base.getHsl()
     if h < 0:
         h = 220
@@ -222,6 +414,29 @@ def _with_theme_hue(h: int, s: int, l: int, deg_delta: int, *, sat_delta: int =
     return c
 
 
+@lru_cache(maxsize=1)
+def _theme_gradient_stops(theme_color: str):
+    """(stop, QColor) pairs for the chunky linear gradient, built once per theme color.
+
+    Hard-ish transitions: each color band ends with a stop nearly on top of the next.
+    """
+    h, s, l = _derive_theme_hsl(theme_color)
+    c1 = _with_theme_hue(h, s, l, -25, sat_delta=45, light_delta=18)
+    c2 = _with_theme_hue(h, s, l, 35, sat_delta=35, light_delta=10)
+    c3 = _with_theme_hue(h, s, l, 85, sat_delta=25, light_delta=0)
+    c4 = _with_theme_hue(h, s, l, 160, sat_delta=15, light_delta=-8)
+    c5 = _with_theme_hue(h, s, l, 245, sat_delta=30, light_delta=8)
+    c6 = _with_theme_hue(h, s, l, 310, sat_delta=35, light_delta=6)
+    return (
+        (0.00, c1), (0.14, c1),
+        (0.141, c2), (0.30, c2),
+        (0.301, c3), (0.50, c3),
+        (0.501, c4), (0.70, c4),
+        (0.701, c5), (0.86, c5),
+        (0.861, c6), (1.00, c6),
+    )
+
+
 def _find_controls_gradient_anchor(widget: QWidget) -> QWidget:
     """Find the widget whose coordinate system defines the shared gradient.
 
@@ -250,26 +465,35 @@ def _find_controls_gradient_anchor(widget: QWidget) -> QWidget:
 
 
 def _make_alpha_outline_mask(icon_img: QImage, thickness: int) -> QImage:
-    """Return an ARGB image where alpha is an outline ring around the icon alpha."""
+    """Return an ARGB image where alpha is an outline ring around the icon alpha.
+
+    icon_img must already be Format_ARGB32_Premultiplied (callers convert once).
+    """
     t = max(1, int(thickness))
     src = icon_img
-    if src.format() != QImage.Format_ARGB32_Premultiplied:
-        src = src.convertToFormat(QImage.Format_ARGB32_Premultiplied)
 
     w = src.width()
     h = src.height()
+
+    # Square dilation is separable: spread horizontally, then spread that
+    # vertically. 2*(2t+1) blits instead of (2t+1)^2.
+    row = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+    row.fill(Qt.transparent)
+    p = QPainter(row)
+    try:
+        for dx in range(-t, t + 1):
+            p.drawImage(dx, 0, src)
+    finally:
+        p.end()
+
     outline = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
     outline.fill(Qt.transparent)
 
     p = QPainter(outline)
     try:
         p.setRenderHint(QPainter.Antialiasing, False)
-        # Dilate alpha by drawing multiple offsets.
         for dy in range(-t, t + 1):
-            for dx in range(-t, t + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                p.drawImage(dx, dy, src)
+            p.drawImage(0, dy, row)
 
         # Subtract original alpha to leave only the ring.
         p.setCompositionMode(QPainter.CompositionMode_DestinationOut)
@@ -280,137 +504,203 @@ def _make_alpha_outline_mask(icon_img: QImage, thickness: int) -> QImage:
     return outline
 
 
+# Outline masks keyed by (icon cacheKey, w, h, thickness). Icons and their sizes
+# are fixed per button, so the dilation runs once instead of on every repaint.
+_OUTLINE_MASK_CACHE = {}
+_OUTLINE_MASK_CACHE_MAX = 64
+
+
+def _icon_outline_mask(icon: QIcon, size: QSize, outline_px: int):
+    key = (icon.cacheKey(), size.width(), size.height(), int(outline_px))
+    mask = _OUTLINE_MASK_CACHE.get(key)
+    if mask is None:
+        pm = icon.pixmap(size)
+        if pm.isNull():
+            return None
+        img = pm.toImage()
+        if img.format() != QImage.Format_ARGB32_Premultiplied:
+            img.convertTo(QImage.Format_ARGB32_Premultiplied)
+        mask = _make_alpha_outline_mask(img, outline_px)
+        if len(_OUTLINE_MASK_CACHE) >= _OUTLINE_MASK_CACHE_MAX:
+            _OUTLINE_MASK_CACHE.clear()
+        _OUTLINE_MASK_CACHE[key] = mask
+    return mask
+
+
 def _draw_gradient_outlined_icon(painter: QPainter, widget: QWidget, icon: QIcon, rect: QRect, outline_px: int):
     if icon.isNull() or rect.isNull():
         return
-    pm = icon.pixmap(rect.size())
-    if pm.isNull():
+    outline_mask = _icon_outline_mask(icon, rect.size(), outline_px)
+    if outline_mask is None:
         return
 
-    img = pm.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
-    outline_mask = _make_alpha_outline_mask(img, outline_px)
-
     # Build a gradient-colored image aligned to the widget coordinate system.
-    colored = QImage(rect.width(), rect.height(), QImage.Format_ARGB32_Premultiplied)
+    # The scratch buffer lives on the widget and is reused while the size holds.
+    colored = getattr(widget, '_icon_scratch', None)
+    if colored is None or colored.width() != rect.width() or colored.height() != rect.height():
+        colored = QImage(rect.width(), rect.height(), QImage.Format_ARGB32_Premultiplied)
+        try:
+            widget._icon_scratch = colored
+        except Exception:
+            pass
     colored.fill(Qt.transparent)
     gp = QPainter(colored)
     try:
+        # Tint the mask: lay down the outline alpha, then let the gradient
+        # replace color only where that alpha exists.
+        gp.drawImage(0, 0, outline_mask)
+        gp.setCompositionMode(QPainter.CompositionMode_SourceIn)
         # Translate so that filling "rect" samples the right slice of the shared gradient.
         gp.translate(-rect.x(), -rect.y())
         _fill_rect_with_shared_modern_gradient(gp, widget, rect)
-        gp.resetTransform()
-
-        gp.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-        gp.drawImage(0, 0, outline_mask)
     finally:
         gp.end()
 
     painter.drawImage(rect.topLeft(), colored)
 
 
+# Stroked text pixmaps, LRU-evicted. Keyed by everything that affects the pixels,
+# including where the gradient anchor sits relative to the text rect.
+_TEXT_PIXMAP_CACHE = OrderedDict()
+_TEXT_PIXMAP_CACHE_MAX = 128
+
+
 def _draw_gradient_outlined_text(painter: QPainter, widget: QWidget, rect: QRect, text: str, font: QFont, outline_px: int):
     text = (text or "").strip()
     if not text or rect.isNull():
         return
 
-    painter.save()
-    try:
-        painter.setFont(font)
+    # Use the shared gradient as the pen brush.
+    anchor = _find_controls_gradient_anchor(widget)
+    if anchor is None:
+        return
 
-        fm = painter.fontMetrics()
-        elided = fm.elidedText(text, Qt.ElideRight, rect.width())
-        w = fm.horizontalAdvance(elided)
-        h = fm.height()
+    # The anchor is always `widget` or one of its ancestors, so a single
+    # parent-chain walk gives its origin in widget coordinates.
+    if anchor is widget:
+        anchor_rect = widget.rect()
+    else:
+        try:
+            anchor_rect = QRect(widget.mapFrom(anchor, QPoint(0, 0)), anchor.size())
+        except Exception:
+            anchor_rect = widget.rect()
 
-        x = rect.center().x() - w // 2
-        y = rect.top() + (rect.height() + fm.ascent() - fm.descent()) // 2
+    fm = QFontMetrics(font)
+    # Elide before keying so differently-long inputs that render alike share an entry.
+    elided = fm.elidedText(text, Qt.ElideRight, rect.width())
+    pen_w = max(1, int(outline_px))
+    # The stroke straddles the glyph outline, so leave room around the rect.
+    pad = pen_w
+    try:
+        dpr = float(widget.devicePixelRatioF())
+    except Exception:
+        dpr = 1.0
+    rel_anchor = anchor_rect.translated(-rect.x(), -rect.y())
+    key = (
+        elided, font.toString(), rect.width(), rect.height(), pen_w, THEME_COLOR, dpr,
+        rel_anchor.x(), rel_anchor.y(), rel_anchor.width(), rel_anchor.height(),
+    )
+
+    pm = _TEXT_PIXMAP_CACHE.get(key)
+    if pm is not None:
+        _TEXT_PIXMAP_CACHE.move_to_end(key)
+    else:
+        w = fm.horizontalAdvance(elided)
+        x = pad + rect.width() // 2 - w // 2
+        y = pad + (rect.height() + fm.ascent() - fm.descent()) // 2
 
         path = QPainterPath()
         path.addText(QPoint(x, y), font, elided)
 
-        # Use the shared gradient as the pen brush.
-        anchor = _find_controls_gradient_anchor(widget)
-        if anchor is None:
-            return
+        grad = QLinearGradient(rel_anchor.translated(pad, pad).topLeft(), rel_anchor.translated(pad, pad).bottomRight())
+        # Same stops as the shared fill.
+        for stop, color in _theme_gradient_stops(THEME_COLOR):
+            grad.setColorAt(stop, color)
 
-        try:
-            anchor_tl = widget.mapFromGlobal(anchor.mapToGlobal(QPoint(0, 0)))
-            anchor_br = widget.mapFromGlobal(anchor.mapToGlobal(QPoint(anchor.width(), anchor.height())))
-            anchor_rect = QRect(anchor_tl, anchor_br)
-        except Exception:
-            anchor_rect = widget.rect()
+        full_w = rect.width() + 2 * pad
+        full_h = rect.height() + 2 * pad
+        pm = QPixmap(max(1, int(round(full_w * dpr))), max(1, int(round(full_h * dpr))))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        tp = QPainter(pm)
+        try:
+            tp.setRenderHint(QPainter.Antialiasing)
+            pen = QPen(QBrush(grad), pen_w)
+            pen.setJoinStyle(Qt.RoundJoin)
+            pen.setCapStyle(Qt.RoundCap)
+            tp.setPen(pen)
+            tp.setBrush(Qt.NoBrush)
+            tp.drawPath(path)
+        finally:
+            tp.end()
 
-        h0, s0, l0 = _derive_theme_hsl()
-        grad = QLinearGradient(anchor_rect.topLeft(), anchor_rect.bottomRight())
-        # Keep this aligned with the shared stops.
-        c1 = _with_theme_hue(h0, s0, l0, -25, sat_delta=45, light_delta=18)
-        c2 = _with_theme_hue(h0, s0, l0, 35, sat_delta=35, light_delta=10)
-        c3 = _with_theme_hue(h0, s0, l0, 85, sat_delta=25, light_delta=0)
-        c4 = _with_theme_hue(h0, s0, l0, 160, sat_delta=15, light_delta=-8)
-        c5 = _with_theme_hue(h0, s0, l0, 245, sat_delta=30, light_delta=8)
-        c6 = _with_theme_hue(h0, s0, l0, 310, sat_delta=35, light_delta=6)
-        grad.setColorAt(0.00, c1)
-        grad.setColorAt(0.14, c1)
-        grad.setColorAt(0.141, c2)
-        grad.setColorAt(0.30, c2)
-        grad.setColorAt(0.301, c3)
-        grad.setColorAt(0.50, c3)
-        grad.setColorAt(0.501, c4)
-        grad.setColorAt(0.70, c4)
-        grad.setColorAt(0.701, c5)
-        grad.setColorAt(0.86, c5)
-        grad.setColorAt(0.861, c6)
-        grad.setColorAt(1.00, c6)
-
-        pen = QPen(QBrush(grad), max(1, int(outline_px)))
-        pen.setJoinStyle(Qt.RoundJoin)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(path)
-    finally:
-        painter.restore()
+        _TEXT_PIXMAP_CACHE[key] = pm
+        while len(_TEXT_PIXMAP_CACHE) > _TEXT_PIXMAP_CACHE_MAX:
+            _TEXT_PIXMAP_CACHE.popitem(last=False)
 
+    painter.drawPixmap(rect.x() - pad, rect.y() - pad, pm)
 
-def _fill_rect_with_shared_modern_gradient(painter: QPainter, widget: QWidget, target_rect: QRect):
-    """Fill a rect with the shared chunky gradient spanning the whole controls bar."""
-    anchor = _find_controls_gradient_anchor(widget)
-    if anchor is None:
-        return
 
-    try:
-        anchor_tl = widget.mapFromGlobal(anchor.mapToGlobal(QPoint(0, 0)))
-        anchor_br = widget.mapFromGlobal(anchor.mapToGlobal(QPoint(anchor.width(), anchor.height())))
-        anchor_rect = QRect(anchor_tl, anchor_br)
-    except Exception:
-        anchor_rect = widget.rect()
+# Pre-rendered gradients keyed by (w, h, dpr, THEME_COLOR). Only a handful of
+# anchor sizes are live at once (window background, controls bar); resizes add
+# new keys, so the caches are simply dropped when they grow past a few entries.
+_SHARED_GRADIENT_CACHE = {}
+_BACKGROUND_GRADIENT_CACHE = {}
+_GRADIENT_CACHE_MAX = 4
+
+
+def _cached_gradient_pixmap(cache, render, w: int, h: int, dpr: float,
+                            soft_render=None, soft_scale: float = 0.5) -> QPixmap:
+    """Return the pre-rendered gradient for (w, h, dpr), rendering it on a miss.
+
+    render paints at full resolution. soft_render, if given, paints a layer with no
+    hard edges (the blobs) into an image soft_scale the size, smoothly scaled up over
+    it; the banded linear stops must stay full-res to line up with the controls bar.
+    """
+    key = (w, h, dpr, THEME_COLOR)
+    pm = cache.get(key)
+    if pm is None:
+        if len(cache) >= _GRADIENT_CACHE_MAX:
+            cache.clear()
+        full_w = max(1, int(round(w * dpr)))
+        full_h = max(1, int(round(h * dpr)))
+        soft = None
+        if soft_render is not None:
+            lo_w = max(1, int(round(full_w * soft_scale)))
+            lo_h = max(1, int(round(full_h * soft_scale)))
+            soft = QImage(lo_w, lo_h, QImage.Format_ARGB32_Premultiplied)
+            soft.fill(Qt.transparent)
+            p = QPainter(soft)
+            try:
+                p.scale(lo_w / float(w), lo_h / float(h))
+                soft_render(p, QRect(0, 0, w, h))
+            finally:
+                p.end()
+        pm = QPixmap(full_w, full_h)
+        pm.fill(Qt.transparent)
+        p = QPainter(pm)
+        try:
+            p.scale(dpr, dpr)
+            render(p, QRect(0, 0, w, h))
+            if soft is not None:
+                p.setRenderHint(QPainter.SmoothPixmapTransform)
+                p.drawImage(QRect(0, 0, w, h), soft)
+        finally:
+            p.end()
+        pm.setDevicePixelRatio(dpr)
+        cache[key] = pm
+    return pm
+
 
-    h, s, l = _derive_theme_hsl()
+def _render_shared_modern_gradient(painter: QPainter, anchor_rect: QRect):
+    h, s, l = _derive_theme_hsl(THEME_COLOR)
 
     # Base gradient (chunky portions with hard-ish transitions)
     grad = QLinearGradient(anchor_rect.topLeft(), anchor_rect.bottomRight())
-    c1 = _with_theme_hue(h, s, l, -25, sat_delta=45, light_delta=18)
-    c2 = _with_theme_hue(h, s, l, 35, sat_delta=35, light_delta=10)
-    c3 = _with_theme_hue(h, s, l, 85, sat_delta=25, light_delta=0)
-    c4 = _with_theme_hue(h, s, l, 160, sat_delta=15, light_delta=-8)
-    c5 = _with_theme_hue(h, s, l, 245, sat_delta=30, light_delta=8)
-    c6 = _with_theme_hue(h, s, l, 310, sat_delta=35, light_delta=6)
+    for stop, color in _theme_gradient_stops(THEME_COLOR):
+        grad.setColorAt(stop, color)
 
-    # Hard stop pairs: two stops nearly at the same position.
-    grad.setColorAt(0.00, c1)
-    grad.setColorAt(0.14, c1)
-    grad.setColorAt(0.141, c2)
-    grad.setColorAt(0.30, c2)
-    grad.setColorAt(0.301, c3)
-    grad.setColorAt(0.50, c3)
-    grad.setColorAt(0.501, c4)
-    grad.setColorAt(0.70, c4)
-    grad.setColorAt(0.701, c5)
-    grad.setColorAt(0.86, c5)
-    grad.setColorAt(0.861, c6)
-    grad.setColorAt(1.00, c6)
-
-    painter.fillRect(target_rect, QBrush(grad))
+    painter.fillRect(anchor_rect, QBrush(grad))
 
     # Layer "blobs" (larger and with sharper falloff for chunkier variation).
     aw = max(1, anchor_rect.width())
@@ -421,12 +711,51 @@ def _fill_rect_with_shared_modern_gradient(painter: QPainter, widget: QWidget, t
         (QPoint(anchor_rect.left() + int(aw * 0.88), anchor_rect.top() + int(ah * 0.35)), int(aw * 0.52), 280),
     ]
     for center, radius_px, hue_delta in blobs:
-        rg = QRadialGradient(center, float(max(10, radius_px)))
+        radius = max(10, radius_px)
+        rg = QRadialGradient(center, float(radius))
         blob = _with_theme_hue(h, s, l, hue_delta, sat_delta=55, light_delta=24, alpha=220)
         rg.setColorAt(0.0, blob)
         rg.setColorAt(0.62, blob)  # flatter center
         rg.setColorAt(1.0, _with_theme_hue(h, s, l, hue_delta, sat_delta=0, light_delta=0, alpha=0))
-        painter.fillRect(target_rect, QBrush(rg))
+        # Fully transparent past the radius, so only the blob's bounding square needs filling.
+        bounds = QRect(center.x() - radius, center.y() - radius, 2 * radius, 2 * radius)
+        painter.fillRect(bounds.intersected(anchor_rect), QBrush(rg))
+
+
+def _fill_rect_with_shared_modern_gradient(painter: QPainter, widget: QWidget, target_rect: QRect):
+    """Fill a rect with the shared chunky gradient spanning the whole controls bar.
+
+    The gradient is rendered once per anchor size and each caller blits its slice.
+    """
+    anchor = _find_controls_gradient_anchor(widget)
+    if anchor is None:
+        return
+
+    # The anchor is always `widget` or one of its ancestors, so a single
+    # parent-chain walk gives its origin in widget coordinates.
+    if anchor is widget:
+        anchor_rect = widget.rect()
+    else:
+        try:
+            anchor_rect = QRect(widget.mapFrom(anchor, QPoint(0, 0)), anchor.size())
+        except Exception:
+            anchor_rect = widget.rect()
+
+    try:
+        dpr = float(widget.devicePixelRatioF())
+    except Exception:
+        dpr = 1.0
+    pm = _cached_gradient_pixmap(
+        _SHARED_GRADIENT_CACHE, _render_shared_modern_gradient,
+        max(1, anchor_rect.width()), max(1, anchor_rect.height()), dpr,
+    )
+
+    painter.save()
+    try:
+        painter.setClipRect(target_rect, Qt.IntersectClip)
+        painter.drawPixmap(anchor_rect.topLeft(), pm)
+    finally:
+        painter.restore()
 
 
 def _paint_shared_modern_gradient(painter: QPainter, widget: QWidget, fill_rect: QRect, radius: int):
@@ -436,48 +765,40 @@ def _paint_shared_modern_gradient(painter: QPainter, widget: QWidget, fill_rect:
     """
     painter.save()
     try:
-        clip = QPainterPath()
-        clip.addRoundedRect(fill_rect, radius, radius)
-        painter.setClipPath(clip)
+        if radius <= 1:
+            # Corners this small are invisible; a rect clip skips the path entirely.
+            painter.setClipRect(fill_rect)
+        else:
+            # The clip path only depends on geometry; keep the last one on the widget.
+            key = (fill_rect.x(), fill_rect.y(), fill_rect.width(), fill_rect.height(), radius)
+            cached = getattr(widget, '_clip_path_cache', None)
+            if cached is not None and cached[0] == key:
+                clip = cached[1]
+            else:
+                clip = QPainterPath()
+                clip.addRoundedRect(fill_rect, radius, radius)
+                try:
+                    widget._clip_path_cache = (key, clip)
+                except Exception:
+                    pass
+            painter.setClipPath(clip)
         _fill_rect_with_shared_modern_gradient(painter, widget, fill_rect)
     finally:
         painter.restore()
 
 
-def _paint_modern_background(painter: QPainter, widget: QWidget):
-    """Paint the same chunky gradient style as a full background."""
-    if widget is None:
-        return
-
-    h, s, l = _derive_theme_hsl()
-    r = widget.rect()
-    if r.isNull():
-        return
-
+def _render_modern_background(painter: QPainter, r: QRect):
     # Base gradient with hard-ish transitions.
     grad = QLinearGradient(r.topLeft(), r.bottomRight())
-    c1 = _with_theme_hue(h, s, l, -25, sat_delta=45, light_delta=18)
-    c2 = _with_theme_hue(h, s, l, 35, sat_delta=35, light_delta=10)
-    c3 = _with_theme_hue(h, s, l, 85, sat_delta=25, light_delta=0)
-    c4 = _with_theme_hue(h, s, l, 160, sat_delta=15, light_delta=-8)
-    c5 = _with_theme_hue(h, s, l, 245, sat_delta=30, light_delta=8)
-    c6 = _with_theme_hue(h, s, l, 310, sat_delta=35, light_delta=6)
-
-    grad.setColorAt(0.00, c1)
-    grad.setColorAt(0.14, c1)
-    grad.setColorAt(0.141, c2)
-    grad.setColorAt(0.30, c2)
-    grad.setColorAt(0.301, c3)
-    grad.setColorAt(0.50, c3)
-    grad.setColorAt(0.501, c4)
-    grad.setColorAt(0.70, c4)
-    grad.setColorAt(0.701, c5)
-    grad.setColorAt(0.86, c5)
-    grad.setColorAt(0.861, c6)
-    grad.setColorAt(1.00, c6)
+    for stop, color in _theme_gradient_stops(THEME_COLOR):
+        grad.setColorAt(stop, color)
 
     painter.fillRect(r, QBrush(grad))
 
+
+def _render_modern_background_blobs(painter: QPainter, r: QRect):
+    h, s, l = _derive_theme_hsl(THEME_COLOR)
+
     # Blobs for chunkier variation.
     aw = max(1, r.width())
     ah = max(1, r.height())
@@ -487,12 +808,35 @@ def _paint_modern_background(painter: QPainter, widget: QWidget):
         (QPoint(r.left() + int(aw * 0.88), r.top() + int(ah * 0.35)), int(aw * 0.58), 280),
     ]
     for center, radius_px, hue_delta in blobs:
-        rg = QRadialGradient(center, float(max(10, radius_px)))
+        radius = max(10, radius_px)
+        rg = QRadialGradient(center, float(radius))
         blob = _with_theme_hue(h, s, l, hue_delta, sat_delta=55, light_delta=24, alpha=210)
         rg.setColorAt(0.0, blob)
         rg.setColorAt(0.62, blob)
         rg.setColorAt(1.0, _with_theme_hue(h, s, l, hue_delta, sat_delta=0, light_delta=0, alpha=0))
-        painter.fillRect(r, QBrush(rg))
+        # Fully transparent past the radius, so only the blob's bounding square needs filling.
+        bounds = QRect(center.x() - radius, center.y() - radius, 2 * radius, 2 * radius)
+        painter.fillRect(bounds.intersected(r), QBrush(rg))
+
+
+def _paint_modern_background(painter: QPainter, widget: QWidget):
+    """Paint the same chunky gradient style as a full background."""
+    if widget is None:
+        return
+
+    r = widget.rect()
+    if r.isNull():
+        return
+
+    try:
+        dpr = float(widget.devicePixelRatioF())
+    except Exception:
+        dpr = 1.0
+    pm = _cached_gradient_pixmap(
+        _BACKGROUND_GRADIENT_CACHE, _render_modern_background,
+        r.width(), r.height(), dpr, soft_render=_render_modern_background_blobs,
+    )
+    painter.drawPixmap(r.topLeft(), pm)
 
 
 class GradientBackgroundWidget(QWidget):
@@ -505,12 +849,44 @@ class GradientBackgroundWidget(QWidget):
             painter.end()
 
 
+def _make_sleep_clock():
+    """Return a seconds clock that only advances while the system is awake.
+
+    The sleep timer should ignore time spent suspended. time.monotonic() already
+    behaves that way on Linux (CLOCK_MONOTONIC) and macOS, but on Windows it keeps
+    counting through sleep; QueryUnbiasedInterruptTime does not.
+    """
+    if _IS_WIN:
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            query = ctypes.windll.kernel32.QueryUnbiasedInterruptTime
+            query.argtypes = [ctypes.POINTER(ctypes.c_ulonglong)]
+            query.restype = wintypes.BOOL
+            ticks = ctypes.c_ulonglong()
+
+            def _clock():
+                query(ctypes.byref(ticks))
+                return ticks.value / 10_000_000.0  # 100ns units
+
+            if query(ctypes.byref(ticks)):
+                return _clock
+        except Exception:
+            pass
+    return time.monotonic
+
+
+_sleep_clock = _make_sleep_clock()
+
+
+@lru_cache(maxsize=1)
 def _get_user_settings_path() -> str:
     home = os.path.expanduser("~")
-    if platform.system().lower().startswith("win"):
+    if _IS_WIN:
         base = os.getenv("APPDATA") or os.path.join(home, "AppData", "Roaming")
         cfg_dir = os.path.join(base, "SleepyShows")
-    elif platform.system().lower() == "darwin":
+    elif _IS_MAC:
         cfg_dir = os.path.join(home, "Library", "Application Support", "SleepyShows")
     else:
         xdg = os.getenv("XDG_CONFIG_HOME")
@@ -590,6 +966,16 @@ class Spinner(QWidget):
         size = (self._radius + self._line_width) * 2
         self.setFixedSize(size, size)
 
+        # Geometry and pen are fixed for the spinner's lifetime.
+        pad = self._line_width
+        self._arc_rect = QRect(pad, pad, size - 2 * pad, size - 2 * pad)
+        # Repaint only the arc plus the half-pen (and AA pixel) it spills over.
+        grow = self._line_width // 2 + 1
+        self._dirty_rect = self._arc_rect.adjusted(-grow, -grow, grow, grow)
+        self._pen = QPen(QColor(255, 255, 255, 220))
+        self._pen.setWidth(self._line_width)
+        self._pen.setCapStyle(Qt.RoundCap)
+
     def start(self):
         if not self._timer.isActive():
             self._timer.start()
@@ -602,26 +988,19 @@ class Spinner(QWidget):
 
     def _tick(self):
         self._angle = (self._angle + 30) % 360
-        self.update()
+        if self.isVisible():
+            self.update(self._dirty_rect)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-
-        pen = painter.pen()
-        pen.setWidth(self._line_width)
-        pen.setColor(QColor(255, 255, 255, 220))
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         painter.setBrush(Qt.NoBrush)
 
-        pad = self._line_width
-        rect = QRect(pad, pad, self.width() - 2 * pad, self.height() - 2 * pad)
-
         # Draw an arc segment to look like a spinner.
         span_deg = 280
         start_deg = -self._angle
-        painter.drawArc(rect, int(start_deg * 16), int(-span_deg * 16))
+        painter.drawArc(self._arc_rect, int(start_deg * 16), int(-span_deg * 16))
 
 
 class ToggleSwitch(QAbstractButton):
@@ -695,11 +1074,11 @@ class TriStrokeButton(QPushButton):
             inner_inset = max(1, gradient_w)
             inner_rect = outer_rect.adjusted(inner_inset, inner_inset, -inner_inset, -inner_inset)
 
+            # Both rounded rects in one path: with the default odd-even fill rule
+            # the inner one punches the hole, so no boolean path op is needed.
             ring = QPainterPath()
             ring.addRoundedRect(outer_rect, self._radius, self._radius)
-            cutout = QPainterPath()
-            cutout.addRoundedRect(inner_rect, max(1, self._radius - gradient_w), max(1, self._radius - gradient_w))
-            ring = ring.subtracted(cutout)
+            ring.addRoundedRect(inner_rect, max(1, self._radius - gradient_w), max(1, self._radius - gradient_w))
 
             painter.save()
             try:
@@ -729,6 +1108,12 @@ class TriStrokeToolButton(QToolButton):
         super().__init__(*args, **kwargs)
         self._radius = int(radius)
         self._stroke = int(stroke)
+        # Icon pixmap for the TextUnderIcon layout, rebuilt when icon or size changes.
+        self._icon_pm_key = None
+        self._icon_pm = None
+        # Laid-out label for the same layout, re-prepared only when text, width or font change.
+        self._static_text_key = None
+        self._static_text = None
         self.setAttribute(Qt.WA_StyledBackground, False)
         self.setCursor(Qt.PointingHandCursor)
 
@@ -749,11 +1134,11 @@ class TriStrokeToolButton(QToolButton):
             inner_inset = max(1, gradient_w)
             inner_rect = outer_rect.adjusted(inner_inset, inner_inset, -inner_inset, -inner_inset)
 
+            # Both rounded rects in one path: with the default odd-even fill rule
+            # the inner one punches the hole, so no boolean path op is needed.
             ring = QPainterPath()
             ring.addRoundedRect(outer_rect, self._radius, self._radius)
-            cutout = QPainterPath()
-            cutout.addRoundedRect(inner_rect, max(1, self._radius - gradient_w), max(1, self._radius - gradient_w))
-            ring = ring.subtracted(cutout)
+            ring.addRoundedRect(inner_rect, max(1, self._radius - gradient_w), max(1, self._radius - gradient_w))
 
             painter.save()
             try:
@@ -772,14 +1157,27 @@ class TriStrokeToolButton(QToolButton):
                 icon_x = content.center().x() - icon_size.width() // 2
                 icon_y = content.top() + 9  # slightly higher, keep icon/text spacing
                 icon_rect = QRect(icon_x, icon_y, icon_size.width(), icon_size.height())
-                icon_pm = self.icon().pixmap(icon_size)
-                painter.drawPixmap(icon_rect.topLeft(), icon_pm)
+                icon = self.icon()
+                pm_key = (icon.cacheKey(), icon_size.width(), icon_size.height())
+                if self._icon_pm_key != pm_key:
+                    self._icon_pm_key = pm_key
+                    self._icon_pm = icon.pixmap(icon_size)
+                painter.drawPixmap(icon_rect.topLeft(), self._icon_pm)
 
                 text = self.text() or ""
                 text_rect = QRect(content.left(), icon_y + icon_size.height() + 4, content.width(), content.bottom() - (icon_y + icon_size.height() + 4))
                 painter.setPen(QColor(255, 255, 255))
-                fm = painter.fontMetrics()
-                painter.drawText(text_rect, Qt.AlignHCenter | Qt.AlignTop, fm.elidedText(text, Qt.ElideRight, text_rect.width()))
+                font = painter.font()
+                st_key = (text, text_rect.width(), font.key())
+                if self._static_text_key != st_key:
+                    self._static_text_key = st_key
+                    fm = QFontMetrics(font)
+                    st = QStaticText(fm.elidedText(text, Qt.ElideRight, text_rect.width()))
+                    st.setTextFormat(Qt.PlainText)
+                    st.prepare(painter.transform(), font)
+                    self._static_text = st
+                st_w = int(self._static_text.size().width())
+                painter.drawStaticText(text_rect.center().x() - st_w // 2, text_rect.top(), self._static_text)
             else:
                 opt = QStyleOptionToolButton()
                 opt.initFrom(self)
@@ -797,19 +1195,66 @@ class TriStrokeToolButton(QToolButton):
             painter.end()
 
 
+_BUMP_IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif')
+_BUMP_AUDIO_FX_EXTS = ('.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.opus', '.webm', '.mp4')
+
+
+def _count_files_with_exts(folder, exts) -> int:
+    """Recursively count files under folder whose lowercased name ends with one of exts."""
+    folder = str(folder or '')
+    if not folder or not os.path.isdir(folder):
+        return 0
+
+    def _walk(path):
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            yield from _walk(e.path)
+                        elif e.name.lower().endswith(exts):
+                            yield 1
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+    return sum(_walk(folder))
+
+
+# Settings panel styles, parsed once for the panel instead of per child widget.
+_SETTINGS_PANEL_QSS = f"""
+    QLabel[role="title"] {{ font-size: 28px; font-weight: bold; color: white; }}
+    QLabel[role="setting"] {{ font-size: 16px; color: white; }}
+    QLabel[role="info"] {{ font-size: 14px; color: #e0e0e0; }}
+    QLineEdit {{ background: #333; color: white; padding: 6px 10px; border: 1px solid #111; border-radius: 4px; }}
+    QLineEdit:focus {{ border: 1px solid {THEME_COLOR}; }}
+"""
+
+
 class BumpsModeWidget(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        # Folder counts run off the UI thread; back-to-back refresh_status calls
+        # collapse into one count via this debounce timer.
+        self._count_generation = 0
+        self._count_timer = QTimer(self)
+        self._count_timer.setSingleShot(True)
+        self._count_timer.setInterval(150)
+        self._count_timer.timeout.connect(self._start_folder_count)
         self.setup_ui()
 
     def setup_ui(self):
+        # One sheet for the whole panel; children opt in via the 'role' property.
+        self.setStyleSheet(_SETTINGS_PANEL_QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(15)
 
         title = QLabel("Settings")
-        title.setStyleSheet("font-size: 28px; font-weight: bold; color: white;")
+        title.setProperty('role', 'title')
         layout.addWidget(title)
 
         self.btn_clear_history = QPushButton("Clear Viewing History…")
@@ -823,11 +1268,11 @@ class BumpsModeWidget(QWidget):
             row.setSpacing(10)
 
             lbl = QLabel(label_text)
-            lbl.setStyleSheet("font-size: 16px; color: white;")
+            lbl.setProperty('role', 'setting')
 
             btn = ToggleSwitch()
             btn.setChecked(bool(initial_checked))
-            btn.toggled.connect(lambda checked: on_toggle(bool(checked)))
+            btn.toggled.connect(on_toggle)
 
             row.addWidget(btn)
             row.addWidget(lbl)
@@ -838,13 +1283,13 @@ class BumpsModeWidget(QWidget):
         self.btn_startup_crickets, self.lbl_startup_crickets = add_toggle_row(
             "Startup cricket sound",
             getattr(self.main_window, "startup_crickets_enabled", True),
-            lambda checked: self.main_window.set_startup_crickets_enabled(checked),
+            self.main_window.set_startup_crickets_enabled,
         )
 
         self.btn_normalize_audio, self.lbl_normalize_audio = add_toggle_row(
             "Normalize volume",
             getattr(self.main_window, "normalize_audio_enabled", False),
-            lambda checked: self.main_window.set_normalize_audio_enabled(checked),
+            self.main_window.set_normalize_audio_enabled,
         )
 
         initial_web_mode = (
@@ -864,15 +1309,11 @@ class BumpsModeWidget(QWidget):
         web_files_row.setSpacing(10)
 
         web_files_lbl = QLabel("Web Files Root:")
-        web_files_lbl.setStyleSheet("font-size: 16px; color: white;")
+        web_files_lbl.setProperty('role', 'setting')
 
         self.input_web_files_root = QLineEdit()
         self.input_web_files_root.setText(str(getattr(self.main_window, 'web_files_root', '') or ''))
         self.input_web_files_root.setPlaceholderText("/mnt/shows  (or \\\\10.0.0.210\\shows on Windows)")
-        self.input_web_files_root.setStyleSheet(
-            "QLineEdit { background: #333; color: white; padding: 6px 10px; border: 1px solid #111; border-radius: 4px; }"
-            "QLineEdit:focus { border: 1px solid #0e1a77; }"
-        )
 
         def _commit_web_files_root():
             try:
@@ -891,15 +1332,11 @@ class BumpsModeWidget(QWidget):
         inter_row.setSpacing(10)
 
         inter_lbl = QLabel("Interludes Folder:")
-        inter_lbl.setStyleSheet("font-size: 16px; color: white;")
+        inter_lbl.setProperty('role', 'setting')
 
         self.input_interludes_dir = QLineEdit()
         self.input_interludes_dir.setText(str(getattr(self.main_window, '_interstitials_dir', '') or ''))
         self.input_interludes_dir.setPlaceholderText("Auto-detected: Sleepy Shows Data/TV Vibe/interludes")
-        self.input_interludes_dir.setStyleSheet(
-            "QLineEdit { background: #333; color: white; padding: 6px 10px; border: 1px solid #111; border-radius: 4px; }"
-            "QLineEdit:focus { border: 1px solid #0e1a77; }"
-        )
 
         def _commit_interludes_dir():
             try:
@@ -922,7 +1359,7 @@ class BumpsModeWidget(QWidget):
         layout.addLayout(inter_row)
 
         self.lbl_interludes = QLabel("Interludes: (not set)")
-        self.lbl_interludes.setStyleSheet("font-size: 14px; color: #e0e0e0;")
+        self.lbl_interludes.setProperty('role', 'info')
         layout.addWidget(self.lbl_interludes)
 
         # Auto-config external drive name
@@ -931,15 +1368,11 @@ class BumpsModeWidget(QWidget):
         drive_row.setSpacing(10)
 
         drive_lbl = QLabel("Auto-Config External Drive Name:")
-        drive_lbl.setStyleSheet("font-size: 16px; color: white;")
+        drive_lbl.setProperty('role', 'setting')
 
         self.input_auto_drive = QLineEdit()
         self.input_auto_drive.setText(str(getattr(self.main_window, 'auto_config_volume_label', 'T7') or 'T7'))
         self.input_auto_drive.setPlaceholderText("T7")
-        self.input_auto_drive.setStyleSheet(
-            "QLineEdit { background: #333; color: white; padding: 6px 10px; border: 1px solid #111; border-radius: 4px; }"
-            "QLineEdit:focus { border: 1px solid #0e1a77; }"
-        )
 
         def _commit_drive_name():
             try:
@@ -954,7 +1387,7 @@ class BumpsModeWidget(QWidget):
         layout.addLayout(drive_row)
 
         info = QLabel("Global bumps play between episodes.")
-        info.setStyleSheet("font-size: 14px; color: #e0e0e0;")
+        info.setProperty('role', 'info')
         layout.addWidget(info)
 
         self.btn_scripts = QPushButton("Reload Local Bump Scripts")
@@ -962,7 +1395,7 @@ class BumpsModeWidget(QWidget):
         layout.addWidget(self.btn_scripts)
 
         self.lbl_scripts = QLabel("Scripts: 0")
-        self.lbl_scripts.setStyleSheet("font-size: 16px; color: white;")
+        self.lbl_scripts.setProperty('role', 'setting')
         layout.addWidget(self.lbl_scripts)
 
         layout.addSpacing(10)
@@ -972,7 +1405,7 @@ class BumpsModeWidget(QWidget):
         layout.addWidget(self.btn_music)
 
         self.lbl_music = QLabel("Music: 0")
-        self.lbl_music.setStyleSheet("font-size: 16px; color: white;")
+        self.lbl_music.setProperty('role', 'setting')
         layout.addWidget(self.lbl_music)
 
         layout.addSpacing(10)
@@ -982,7 +1415,7 @@ class BumpsModeWidget(QWidget):
         layout.addWidget(self.btn_images)
 
         self.lbl_images = QLabel("Images: (not set)")
-        self.lbl_images.setStyleSheet("font-size: 14px; color: #e0e0e0;")
+        self.lbl_images.setProperty('role', 'info')
         layout.addWidget(self.lbl_images)
 
         layout.addSpacing(10)
@@ -992,30 +1425,12 @@ class BumpsModeWidget(QWidget):
         layout.addWidget(self.btn_audio_fx)
 
         self.lbl_audio_fx = QLabel("Audio FX: (not set)")
-        self.lbl_audio_fx.setStyleSheet("font-size: 14px; color: #e0e0e0;")
+        self.lbl_audio_fx.setProperty('role', 'info')
         layout.addWidget(self.lbl_audio_fx)
 
         layout.addStretch(1)
 
     def refresh_status(self):
-        def _count_files(folder, exts):
-            try:
-                folder = str(folder or '')
-                if not folder or not os.path.isdir(folder):
-                    return 0
-                exts_l = {str(e).lower() for e in (exts or set())}
-                n = 0
-                for root, _, files in os.walk(folder):
-                    for f in files:
-                        if os.path.splitext(f)[1].lower() in exts_l:
-                            n += 1
-                return int(n)
-            except Exception:
-                return 0
-
-        image_exts = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif'}
-        audio_exts = {'.mp3', '.flac', '.wav', '.ogg', '.m4a', '.aac', '.opus', '.webm', '.mp4'}
-
         try:
             scripts_n = len(self.main_window.playlist_manager.bump_manager.bump_scripts)
         except Exception:
@@ -1029,19 +1444,7 @@ class BumpsModeWidget(QWidget):
         self.lbl_scripts.setText(f"Scripts: {scripts_n}")
         self.lbl_music.setText(f"Music: {music_n}")
 
-        try:
-            img_dir = getattr(self.main_window, 'bump_images_dir', None)
-            img_n = _count_files(img_dir, image_exts)
-            self.lbl_images.setText(f"Images: {img_n}")
-        except Exception:
-            pass
-
-        try:
-            fx_dir = getattr(self.main_window, 'bump_audio_fx_dir', None)
-            fx_n = _count_files(fx_dir, audio_exts)
-            self.lbl_audio_fx.setText(f"Audio FX: {fx_n}")
-        except Exception:
-            pass
+        self._count_timer.start()
 
         try:
             inter_dir = str(getattr(self.main_window, '_interstitials_dir', '') or '').strip()
@@ -1079,6 +1482,34 @@ class BumpsModeWidget(QWidget):
         except Exception:
             pass
 
+    def _start_folder_count(self):
+        """Count bump images / audio FX off the UI thread and update the labels when done."""
+        img_dir = getattr(self.main_window, 'bump_images_dir', None)
+        fx_dir = getattr(self.main_window, 'bump_audio_fx_dir', None)
+        self._count_generation += 1
+        gen = self._count_generation
+
+        def _worker():
+            img_n = _count_files_with_exts(img_dir, _BUMP_IMAGE_EXTS)
+            fx_n = _count_files_with_exts(fx_dir, _BUMP_AUDIO_FX_EXTS)
+
+            def _apply():
+                # A newer refresh superseded this one.
+                if gen != self._count_generation:
+                    return
+                try:
+                    self.lbl_images.setText(f"Images: {img_n}")
+                    self.lbl_audio_fx.setText(f"Audio FX: {fx_n}")
+                except Exception:
+                    pass
+
+            try:
+                QTimer.singleShot(0, self, _apply)
+            except Exception:
+                pass
+
+        threading.Thread(target=_worker, daemon=True).start()
+
 
 def _next_shuffle_mode(mode):
     order = ['off', 'standard', 'season']
@@ -1088,6 +1519,12 @@ def _next_shuffle_mode(mode):
         i = 0
     return order[(i + 1) % len(order)]
 
+
+def _fmt_time(s) -> str:
+    m, s = divmod(int(s), 60)
+    h, m = divmod(m, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m:02d}:{s:02d}"
+
 # --- Path Helpers ---
 def get_asset_path(filename):
     # Resolves asset path whether running as script or frozen exe
@@ -1103,6 +1540,22 @@ def get_asset_path(filename):
     return path
 
 
+_ASSET_PIXMAP_CACHE = {}
+
+
+def _asset_pixmap(filename) -> QPixmap:
+    """Return an assets/ image, decoded once per process.
+
+    Hands out a copy: QPixmap copies are implicitly shared, so this is cheap and a
+    caller modifying its pixmap can't alter the cached one.
+    """
+    pm = _ASSET_PIXMAP_CACHE.get(filename)
+    if pm is None:
+        pm = QPixmap(get_asset_path(filename))
+        _ASSET_PIXMAP_CACHE[filename] = pm
+    return QPixmap(pm)
+
+
 def _darker_hex(hex_color: str, factor: float = 0.5) -> str:
     """Return a darker hex color (factor in [0..1], where 0.5 is 50% darker)."""
     try:
@@ -1143,7 +1596,7 @@ class StartupLoadingScreen(QWidget):
         self.logo = QLabel()
         self.logo.setAlignment(Qt.AlignCenter)
         self.logo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self._logo_pm = QPixmap(get_asset_path("sleepy-shows-logo.png"))
+        self._logo_pm = _asset_pixmap("sleepy-shows-logo.png")
         layout.addWidget(self.logo, 0, Qt.AlignHCenter)
 
         self.progress_bar = QProgressBar()
@@ -1304,10 +1757,10 @@ def get_local_playlists_dir() -> str:
     try:
         if getattr(sys, 'frozen', False):
             home = os.path.expanduser('~')
-            if platform.system().lower().startswith('win'):
+            if _IS_WIN:
                 base = os.getenv('APPDATA') or os.path.join(home, 'AppData', 'Roaming')
                 root = os.path.join(base, 'SleepyShows')
-            elif platform.system().lower() == 'darwin':
+            elif _IS_MAC:
                 root = os.path.join(home, 'Library', 'Application Support', 'SleepyShows')
             else:
                 xdg = os.getenv('XDG_CONFIG_HOME')
@@ -1478,24 +1931,58 @@ def migrate_playlists_to_global_interludes(*, playlists_dir: str | None = None)
     return int(changed)
 
 
-def _windows_iter_drive_roots():
+# GetDriveTypeW results worth probing for a volume label. Optical drives and
+# missing roots are skipped; removable drives only beyond A:/B:, since asking a
+# floppy controller for its label can spin it up or stall.
+_WIN_DRIVE_REMOVABLE = 2
+_WIN_PROBE_DRIVE_TYPES = frozenset((
+    3,  # DRIVE_FIXED (includes most USB SSDs, e.g. the T7)
+    4,  # DRIVE_REMOTE
+    6,  # DRIVE_RAMDISK
+))
+
+
+@lru_cache(maxsize=1)
+def _windows_drive_roots_cached():
     try:
         import ctypes
         from ctypes import wintypes
 
-        # Bitmask of drives, where bit 0 = A:, bit 1 = B:, etc.
-        get_logical_drives = ctypes.windll.kernel32.GetLogicalDrives
-        get_logical_drives.restype = wintypes.DWORD
-        mask = int(get_logical_drives())
+        kernel32 = ctypes.windll.kernel32
+        get_strings = kernel32.GetLogicalDriveStringsW
+        get_strings.argtypes = [wintypes.DWORD, wintypes.LPWSTR]
+        get_strings.restype = wintypes.DWORD
+        get_type = kernel32.GetDriveTypeW
+        get_type.argtypes = [wintypes.LPCWSTR]
+        get_type.restype = wintypes.UINT
+
+        # NUL-separated list of present roots, e.g. "C:\\<NUL>D:\\<NUL><NUL>";
+        # a too-small buffer reports the required size instead.
+        buf = ctypes.create_unicode_buffer(256)
+        n = int(get_strings(len(buf) - 1, buf))
+        if n > len(buf) - 1:
+            buf = ctypes.create_unicode_buffer(n + 1)
+            n = int(get_strings(len(buf) - 1, buf))
+
+        roots = []
+        for drive in buf[:n].split('\x00'):
+            if not drive:
+                continue
+            t = int(get_type(drive))
+            if t in _WIN_PROBE_DRIVE_TYPES or (t == _WIN_DRIVE_REMOVABLE and drive[:1].upper() not in ('A', 'B')):
+                roots.append(drive)
+        return tuple(roots)
+    except Exception:
+        return ()
+
 
-        for i in range(26):
-            if mask & (1 << i):
-                letter = chr(ord('A') + i)
-                yield f"{letter}:\\"
-    except Exception:
-        return
+def _windows_iter_drive_roots():
+    # Drive letters and labels only change on hotplug; _WinDeviceChangeFilter
+    # calls _windows_cache_bust() then, so every detector can share one lookup.
+    return iter(_windows_drive_roots_cached())
 
 
+@lru_cache(maxsize=32)
 def _windows_volume_label(drive_root):
     try:
         import ctypes
@@ -1538,20 +2025,25 @@ def _windows_volume_label(drive_root):
         return ""
 
 
+def _windows_cache_bust():
+    """Forget cached drive letters / volume labels (a volume arrived or went away)."""
+    _windows_drive_roots_cached.cache_clear()
+    _windows_volume_label.cache_clear()
+
+
 def _iter_mount_roots_for_label(label):
     """Yield potential mount roots for a volume label across OSes."""
     label = (label or "").strip()
     if not label:
         return
 
-    system = platform.system().lower()
-    if system == 'windows':
+    if _IS_WIN:
         for drive_root in _windows_iter_drive_roots() or []:
             if _windows_volume_label(drive_root).lower() == label.lower():
                 yield drive_root
         return
 
-    if system == 'darwin':
+    if _IS_MAC:
         candidate = os.path.join('/Volumes', label)
         if os.path.isdir(candidate):
             yield candidate
@@ -1601,20 +2093,20 @@ def _volume_label_is_mounted(label: str) -> bool:
 
 def _iter_mount_roots_fallback():
     """Yield mount roots to probe when label-based detection is unavailable."""
-    system = platform.system().lower()
-    if system == 'windows':
+    if _IS_WIN:
         for drive_root in _windows_iter_drive_roots() or []:
             yield drive_root
         return
 
-    if system == 'darwin':
+    if _IS_MAC:
         base = '/Volumes'
         if os.path.isdir(base):
             try:
-                for name in os.listdir(base):
-                    p = os.path.join(base, name)
-                    if os.path.isdir(p):
-                        yield p
+                with os.scandir(base) as it:
+                    for entry in it:
+                        # Skip symlinks: /Volumes/Macintosh HD links to "/".
+                        if entry.is_dir(follow_symlinks=False):
+                            yield entry.path
             except Exception:
                 pass
         return
@@ -1634,43 +2126,231 @@ def _iter_mount_roots_fallback():
         if not os.path.isdir(base):
             continue
         try:
-            for name in os.listdir(base):
-                p = os.path.join(base, name)
-                if os.path.isdir(p) and p not in seen:
-                    seen.add(p)
-                    yield p
+            # Real mount points only; DirEntry.is_dir(follow_symlinks=False) answers
+            # from the directory listing (d_type) without a stat per child.
+            with os.scandir(base) as it:
+                for entry in it:
+                    p = entry.path
+                    if p not in seen and entry.is_dir(follow_symlinks=False):
+                        seen.add(p)
+                        yield p
         except Exception:
             continue
 
 
+# Autodetect probes hit the same mount roots and folders many times per run
+# (every detector re-checks "Sleepy Shows Data" / "TV Vibe"). Detectors accept
+# an optional probe_cache dict, created per run, so each filesystem answer is
+# fetched once; with probe_cache=None they behave exactly as before.
+def _isdir_cached(path, probe_cache=None):
+    if probe_cache is None:
+        return os.path.isdir(path)
+    key = ('isdir', path)
+    v = probe_cache.get(key)
+    if v is None:
+        v = os.path.isdir(path)
+        probe_cache[key] = v
+    return v
+
+
+def _mount_roots_for_label_cached(volume_label, probe_cache=None):
+    if probe_cache is None:
+        return _iter_mount_roots_for_label(volume_label) or []
+    key = ('mounts', volume_label)
+    roots = probe_cache.get(key)
+    if roots is None:
+        roots = list(_iter_mount_roots_for_label(volume_label) or [])
+        probe_cache[key] = roots
+    return roots
+
+
+def _mount_roots_fallback_cached(probe_cache=None):
+    if probe_cache is None:
+        return _iter_mount_roots_fallback() or []
+    key = ('mounts', None)
+    roots = probe_cache.get(key)
+    if roots is None:
+        roots = list(_iter_mount_roots_fallback() or [])
+        probe_cache[key] = roots
+    return roots
+
+
+def _roots_to_probe(mount_root, probe_cache=None):
+    """Return the roots to search on a mount: "Sleepy Shows Data" first (if present), then the mount itself."""
+    if not mount_root or not _isdir_cached(mount_root, probe_cache):
+        return []
+    roots = []
+    # Prefer the new top-level folder if present, but keep backward compatibility.
+    data_root = os.path.join(mount_root, 'Sleepy Shows Data')
+    if _isdir_cached(data_root, probe_cache):
+        roots.append(data_root)
+    roots.append(mount_root)
+    return roots
+
+
+# Mount probing is I/O-bound (isdir/scandir on slow media), so several roots can
+# overlap their latency on threads; keep it small to avoid thrashing spinning disks.
+_MOUNT_PROBE_MAX_WORKERS = 4
+
+
+def _map_mount_roots(probe, mount_roots, merge, is_complete):
+    """Probe mount_roots (up to 4 concurrently) and merge(probe(root)) in root order.
+
+    Merges run on the calling thread in mount_roots order, so "first root wins"
+    needs no lock. As soon as is_complete() holds after a merge, roots not yet
+    started are cancelled and this returns without waiting on slower mounts.
+    """
+    roots = list(mount_roots or [])
+    if is_complete():
+        return
+    if len(roots) <= 1:
+        for r in roots:
+            merge(probe(r))
+        return
+    ex = ThreadPoolExecutor(max_workers=min(_MOUNT_PROBE_MAX_WORKERS, len(roots)))
+    futures = [ex.submit(probe, r) for r in roots]
+    try:
+        order = {f: i for i, f in enumerate(futures)}
+        done = {}
+        next_i = 0
+        for fut in as_completed(futures):
+            done[order[fut]] = fut
+            # Merge the completed prefix only; a later root can't win over an earlier one.
+            while next_i in done:
+                merge(done.pop(next_i).result())
+                next_i += 1
+                if is_complete():
+                    return
+    finally:
+        for fut in futures:
+            fut.cancel()
+        ex.shutdown(wait=False)
+
+
+# Extensions without the leading dot, so a DirEntry name can be tested with one slice.
+_VIDEO_EXTS_NO_DOT = frozenset(e.lstrip('.') for e in VIDEO_EXTENSIONS)
+# Entries a show-folder probe may look at before giving up. Episode folders show
+# a video within a handful of entries; this only bounds degenerate mounts.
+_SHOW_PROBE_MAX_ENTRIES = 256
+
+
 def _looks_like_show_folder(folder_path):
     """Fast check: find at least one video file within a few directory levels."""
     if not folder_path or not os.path.isdir(folder_path):
         return False
-    base_depth = folder_path.rstrip(os.sep).count(os.sep)
 
-    try:
-        for root, dirs, files in os.walk(folder_path):
-            depth = root.rstrip(os.sep).count(os.sep) - base_depth
-            if depth >= 3:
-                # Don't descend deeper than 3 levels.
-                dirs[:] = []
-
-            for f in files:
-                ext = os.path.splitext(f)[1].lower()
-                if ext in VIDEO_EXTENSIONS:
-                    return True
-        return False
-    except Exception:
-        return False
+    # Iterative scandir walk: DirEntry carries the type from the directory read,
+    # so no per-entry stat, and we stop at the first video file.
+    stack = [(folder_path, 0)]
+    budget = _SHOW_PROBE_MAX_ENTRIES
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    budget -= 1
+                    if budget < 0:
+                        return False
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Don't descend deeper than 3 levels.
+                            if depth < 3:
+                                stack.append((entry.path, depth + 1))
+                            continue
+                    except OSError:
+                        continue
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot + 1:].lower() in _VIDEO_EXTS_NO_DOT:
+                        return True
+        except OSError:
+            continue
+    return False
 
 
-def auto_detect_default_show_sources(volume_label='T7'):
+def _looks_like_show_folder_cached(folder_path, probe_cache=None):
+    if probe_cache is None:
+        return _looks_like_show_folder(folder_path)
+    key = ('show?', folder_path)
+    v = probe_cache.get(key)
+    if v is None:
+        v = _looks_like_show_folder(folder_path)
+        probe_cache[key] = v
+    return v
+
+
+# Folder name patterns to probe per show, relative to a mount (or data) root.
+# Built once at import: os.path.join of plain names is already normalized, so
+# probes only need to prepend a normalized root (see _norm_root_prefix).
+_SHOW_PATTERNS = (
+    # (display, (relative paths to probe))
+    ("King of the Hill", (
+        # Preferred layout
+        os.path.join('Shows', 'King of the Hill', 'Episodes'),
+        os.path.join('Shows', 'King of the Hill', 'King of the Hill'),
+        os.path.join('Shows', 'King of the Hill'),
+        os.path.join('King of the Hill', 'Episodes'),
+        # Older/fallback layouts
+        os.path.join('King of the Hill', 'King of the Hill'),
+        os.path.join('King of the Hill'),
+    )),
+    ("Bob's Burgers", (
+        # Preferred layout (note: "Episodesl" per user)
+        os.path.join('Shows', "Bob's Burgers", 'Episodesl'),
+        os.path.join('Shows', "Bob's Burgers", 'Episodes'),
+        os.path.join('Shows', "Bob's Burgers", "Bob's Burgers"),
+        os.path.join('Shows', "Bob's Burgers", "Bob's Burgersl"),
+        os.path.join('Shows', "Bob's Burgers"),
+        os.path.join('Shows', "Bob's Burgersl"),
+        os.path.join('Shows', 'Bobs Burgers', 'Episodesl'),
+        os.path.join('Shows', 'Bobs Burgers', 'Episodes'),
+        os.path.join('Shows', 'Bobs Burgers', 'Bobs Burgers'),
+        os.path.join('Shows', 'Bobs Burgers'),
+        os.path.join("Bob's Burgers", 'Episodesl'),
+        # Common fallback in case of spelling differences
+        os.path.join("Bob's Burgers", 'Episodes'),
+        # Older/fallback layouts
+        os.path.join("Bob's Burgers", "Bob's Burgers"),
+        os.path.join("Bob's Burgers", "Bob's Burgersl"),
+        os.path.join("Bob's Burgers"),
+        os.path.join("Bob's Burgersl"),
+        os.path.join('Bobs Burgers', 'Episodesl'),
+        os.path.join('Bobs Burgers', 'Episodes'),
+        os.path.join('Bobs Burgers', 'Bobs Burgers'),
+        os.path.join('Bobs Burgers'),
+    )),
+    ("Squidbillies", (
+        os.path.join('Shows', 'Squidbillies', 'Episodes'),
+        os.path.join('Shows', 'Squidbillies'),
+        os.path.join('Squidbillies', 'Episodes'),
+        os.path.join('Squidbillies'),
+    )),
+    ("Aqua Teen Hunger Force", (
+        os.path.join('Shows', 'Aqua Teen Hunger Force', 'Episodes'),
+        os.path.join('Shows', 'Aqua Teen Hunger Force'),
+        os.path.join('Aqua Teen Hunger Force', 'Episodes'),
+        os.path.join('Aqua Teen Hunger Force'),
+        # Common abbreviation fallback
+        os.path.join('Shows', 'ATHF', 'Episodes'),
+        os.path.join('Shows', 'ATHF'),
+        os.path.join('ATHF', 'Episodes'),
+        os.path.join('ATHF'),
+    )),
+)
+
+
+def _norm_root_prefix(root):
+    """Return normpath(root) with exactly one trailing separator, ready for `prefix + rel`."""
+    root_n = os.path.normpath(root)
+    return root_n if root_n.endswith(os.sep) else root_n + os.sep
+
+
+def auto_detect_default_show_sources(volume_label='T7', probe_cache=None):
     """Best-effort detection for known show folders on an external drive.
 
     Returns a list of folder paths suitable to pass to PlaylistManager.add_source().
     """
-    show_folders = auto_detect_show_folders(volume_label=volume_label)
+    show_folders = auto_detect_show_folders(volume_label=volume_label, probe_cache=probe_cache)
     if show_folders:
         # Preserve stable ordering.
         ordered = []
@@ -1685,94 +2365,27 @@ def auto_detect_default_show_sources(volume_label='T7'):
         return ordered
 
     # Backward-compatible fallback (should be rare; kept for safety)
-    # Folder name patterns to try, relative to a mount root.
-    show_patterns = [
-        # (display, [relative paths to probe])
-        ("King of the Hill", [
-            # Preferred layout
-            os.path.join('Shows', 'King of the Hill', 'Episodes'),
-            os.path.join('Shows', 'King of the Hill', 'King of the Hill'),
-            os.path.join('Shows', 'King of the Hill'),
-            os.path.join('King of the Hill', 'Episodes'),
-            # Older/fallback layouts
-            os.path.join('King of the Hill', 'King of the Hill'),
-            os.path.join('King of the Hill'),
-        ]),
-        ("Bob's Burgers", [
-            # Preferred layout (note: "Episodesl" per user)
-            os.path.join('Shows', "Bob's Burgers", 'Episodesl'),
-            os.path.join('Shows', "Bob's Burgers", 'Episodes'),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgersl"),
-            os.path.join('Shows', "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgersl"),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodesl'),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodes'),
-            os.path.join('Shows', 'Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Shows', 'Bobs Burgers'),
-            os.path.join("Bob's Burgers", 'Episodesl'),
-            # Common fallback in case of spelling differences
-            os.path.join("Bob's Burgers", 'Episodes'),
-            # Older/fallback layouts
-            os.path.join("Bob's Burgers", "Bob's Burgers"),
-            os.path.join("Bob's Burgers", "Bob's Burgersl"),
-            os.path.join("Bob's Burgers"),
-            os.path.join("Bob's Burgersl"),
-            os.path.join('Bobs Burgers', 'Episodesl'),
-            os.path.join('Bobs Burgers', 'Episodes'),
-            os.path.join('Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Bobs Burgers'),
-        ]),
-        ("Squidbillies", [
-            os.path.join('Shows', 'Squidbillies', 'Episodes'),
-            os.path.join('Shows', 'Squidbillies'),
-            os.path.join('Squidbillies', 'Episodes'),
-            os.path.join('Squidbillies'),
-        ]),
-        ("Aqua Teen Hunger Force", [
-            os.path.join('Shows', 'Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Shows', 'Aqua Teen Hunger Force'),
-            os.path.join('Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Aqua Teen Hunger Force'),
-            # Common abbreviation fallback
-            os.path.join('Shows', 'ATHF', 'Episodes'),
-            os.path.join('Shows', 'ATHF'),
-            os.path.join('ATHF', 'Episodes'),
-            os.path.join('ATHF'),
-        ]),
-    ]
-
     found = []
     checked = set()
 
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return
-
-        # Prefer the new top-level folder if present, but keep backward compatibility.
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
-            for _, rels in show_patterns:
+        for root in _roots_to_probe(mount_root, probe_cache):
+            prefix = _norm_root_prefix(root)
+            for _, rels in _SHOW_PATTERNS:
                 for rel in rels:
-                    candidate = os.path.join(root, rel)
-                    norm = os.path.normpath(candidate)
+                    norm = prefix + rel
                     if norm in checked:
                         continue
                     checked.add(norm)
-                    if os.path.isdir(norm) and _looks_like_show_folder(norm):
+                    if _looks_like_show_folder_cached(norm, probe_cache):
                         found.append(norm)
 
     # Prefer the named volume, but fall back to scanning mount points.
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         probe_mount(mount_root)
 
     if not found:
-        for mount_root in _iter_mount_roots_fallback() or []:
+        for mount_root in _mount_roots_fallback_cached(probe_cache):
             probe_mount(mount_root)
 
     # De-dupe while keeping order.
@@ -1785,159 +2398,120 @@ def auto_detect_default_show_sources(volume_label='T7'):
     return unique
 
 
-def auto_detect_show_folders(volume_label='T7'):
+def auto_detect_show_folders(volume_label='T7', probe_cache=None):
     """Return best-effort mapping of show name -> episodes folder path."""
-    show_patterns = [
-        ("King of the Hill", [
-            os.path.join('Shows', 'King of the Hill', 'Episodes'),
-            os.path.join('Shows', 'King of the Hill', 'King of the Hill'),
-            os.path.join('Shows', 'King of the Hill'),
-            os.path.join('King of the Hill', 'Episodes'),
-            os.path.join('King of the Hill', 'King of the Hill'),
-            os.path.join('King of the Hill'),
-        ]),
-        ("Bob's Burgers", [
-            os.path.join('Shows', "Bob's Burgers", 'Episodesl'),
-            os.path.join('Shows', "Bob's Burgers", 'Episodes'),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgersl"),
-            os.path.join('Shows', "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgersl"),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodesl'),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodes'),
-            os.path.join('Shows', 'Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Shows', 'Bobs Burgers'),
-            os.path.join("Bob's Burgers", 'Episodesl'),
-            os.path.join("Bob's Burgers", 'Episodes'),
-            os.path.join("Bob's Burgers", "Bob's Burgers"),
-            os.path.join("Bob's Burgers", "Bob's Burgersl"),
-            os.path.join("Bob's Burgers"),
-            os.path.join("Bob's Burgersl"),
-            os.path.join('Bobs Burgers', 'Episodesl'),
-            os.path.join('Bobs Burgers', 'Episodes'),
-            os.path.join('Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Bobs Burgers'),
-        ]),
-        ("Squidbillies", [
-            os.path.join('Shows', 'Squidbillies', 'Episodes'),
-            os.path.join('Shows', 'Squidbillies'),
-            os.path.join('Squidbillies', 'Episodes'),
-            os.path.join('Squidbillies'),
-        ]),
-        ("Aqua Teen Hunger Force", [
-            os.path.join('Shows', 'Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Shows', 'Aqua Teen Hunger Force'),
-            os.path.join('Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Aqua Teen Hunger Force'),
-            # Common abbreviation fallback
-            os.path.join('Shows', 'ATHF', 'Episodes'),
-            os.path.join('Shows', 'ATHF'),
-            os.path.join('ATHF', 'Episodes'),
-            os.path.join('ATHF'),
-        ]),
-    ]
-
     found = {}
-    checked = set()
 
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return
+        # Results for this mount only; mounts are probed concurrently and merged in order.
+        found_here = {}
+        try:
+            for root in _roots_to_probe(mount_root, probe_cache):
+                prefix = _norm_root_prefix(root)
+                for show_name, rels in _SHOW_PATTERNS:
+                    # First match wins. `found` only holds merges from earlier roots,
+                    # so a show already there can't be won by this one.
+                    if show_name in found_here or show_name in found:
+                        continue
+                    for rel in rels:
+                        norm = prefix + rel
+                        if _looks_like_show_folder_cached(norm, probe_cache):
+                            found_here[show_name] = norm
+                            break
+        except Exception:
+            pass
+        return found_here
 
-        # Prefer the new top-level folder if present, but keep backward compatibility.
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
+    def merge(found_here):
+        for show_name, path in found_here.items():
+            found.setdefault(show_name, path)
 
-        for root in roots_to_probe:
-            for show_name, rels in show_patterns:
-                # First match wins.
-                if show_name in found:
-                    continue
-                for rel in rels:
-                    candidate = os.path.join(root, rel)
-                    norm = os.path.normpath(candidate)
-                    if norm in checked:
-                        continue
-                    checked.add(norm)
-                    if os.path.isdir(norm) and _looks_like_show_folder(norm):
-                        found[show_name] = norm
-                        break
+    def all_found():
+        return len(found) >= len(_SHOW_PATTERNS)
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
-        probe_mount(mount_root)
+    def probe_all(mount_roots):
+        roots = list(mount_roots)
+        if not roots:
+            return
+        # Usually the first root has every show (other label matches are often
+        # the same drive mounted elsewhere), so only fan out when it doesn't.
+        merge(probe_mount(roots[0]))
+        _map_mount_roots(probe_mount, roots[1:], merge, all_found)
+
+    label_roots = list(_mount_roots_for_label_cached(volume_label, probe_cache))
+    probe_all(label_roots)
 
     if not found:
-        for mount_root in _iter_mount_roots_fallback() or []:
-            probe_mount(mount_root)
-            # Stop early if we've found all known shows.
-            if len(found) >= len(show_patterns):
-                break
+        probed = set(label_roots)
+        probe_all(r for r in _mount_roots_fallback_cached(probe_cache) if r not in probed)
 
     return found
 
 
-def _find_child_dir_case_insensitive(parent_dir, desired_name):
+def _find_child_dir_case_insensitive(parent_dir, desired_name, probe_cache=None):
     """Return the first child directory matching desired_name (case-insensitive)."""
     try:
-        if not parent_dir or not os.path.isdir(parent_dir):
+        if not parent_dir or not _isdir_cached(parent_dir, probe_cache):
             return None
-        desired = str(desired_name or '').strip().lower()
+        wanted = str(desired_name or '').strip()
+        desired = wanted.lower()
         if not desired:
             return None
 
-        for name in os.listdir(parent_dir):
+        # One isdir per likely spelling before listing the parent: on case-insensitive
+        # filesystems (NTFS, exFAT, APFS) the first probe always answers.
+        for cand in dict.fromkeys((wanted, desired, wanted.upper(), wanted.title())):
+            p = os.path.join(parent_dir, cand)
+            if _isdir_cached(p, probe_cache):
+                return p
+
+        # Child directories as (name, path); DirEntry.is_dir() answers from the
+        # listing itself, stat-ing only symlinks (which it follows, like isdir).
+        key = ('subdirs', parent_dir)
+        subdirs = probe_cache.get(key) if probe_cache is not None else None
+        if subdirs is None:
+            with os.scandir(parent_dir) as it:
+                subdirs = [(e.name, e.path) for e in it if e.is_dir()]
+            if probe_cache is not None:
+                probe_cache[key] = subdirs
+        for name, p in subdirs:
             if name.lower() == desired:
-                p = os.path.join(parent_dir, name)
-                if os.path.isdir(p):
-                    return p
+                return p
     except Exception:
         return None
     return None
 
 
-def auto_detect_tv_vibe_scripts_dir(volume_label='T7'):
+def auto_detect_tv_vibe_scripts_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for bump scripts/music on the same drive as episodes.
 
     Expected layout: <mount_root>/TV Vibe/scripts
     Returns the scripts folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        # Prefer the new top-level folder if present, but keep backward compatibility.
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             # Fast path for the expected exact casing.
             direct = os.path.join(root, 'TV Vibe', 'scripts')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
             # Case-insensitive fallback.
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            scripts_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'scripts')
-            if scripts_dir and os.path.isdir(scripts_dir):
+            scripts_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'scripts', probe_cache)
+            if scripts_dir and _isdir_cached(scripts_dir, probe_cache):
                 return scripts_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -1996,56 +2570,6 @@ def auto_detect_show_folders_web(mount_roots_override):
     if not roots:
         return {}
 
-    show_patterns = [
-        ("King of the Hill", [
-            os.path.join('Shows', 'King of the Hill', 'Episodes'),
-            os.path.join('Shows', 'King of the Hill', 'King of the Hill'),
-            os.path.join('Shows', 'King of the Hill'),
-            os.path.join('King of the Hill', 'Episodes'),
-            os.path.join('King of the Hill', 'King of the Hill'),
-            os.path.join('King of the Hill'),
-        ]),
-        ("Bob's Burgers", [
-            os.path.join('Shows', "Bob's Burgers", 'Episodesl'),
-            os.path.join('Shows', "Bob's Burgers", 'Episodes'),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgers", "Bob's Burgersl"),
-            os.path.join('Shows', "Bob's Burgers"),
-            os.path.join('Shows', "Bob's Burgersl"),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodesl'),
-            os.path.join('Shows', 'Bobs Burgers', 'Episodes'),
-            os.path.join('Shows', 'Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Shows', 'Bobs Burgers'),
-            os.path.join("Bob's Burgers", 'Episodesl'),
-            os.path.join("Bob's Burgers", 'Episodes'),
-            os.path.join("Bob's Burgers", "Bob's Burgers"),
-            os.path.join("Bob's Burgers", "Bob's Burgersl"),
-            os.path.join("Bob's Burgers"),
-            os.path.join("Bob's Burgersl"),
-            os.path.join('Bobs Burgers', 'Episodesl'),
-            os.path.join('Bobs Burgers', 'Episodes'),
-            os.path.join('Bobs Burgers', 'Bobs Burgers'),
-            os.path.join('Bobs Burgers'),
-        ]),
-        ("Squidbillies", [
-            os.path.join('Shows', 'Squidbillies', 'Episodes'),
-            os.path.join('Shows', 'Squidbillies'),
-            os.path.join('Squidbillies', 'Episodes'),
-            os.path.join('Squidbillies'),
-        ]),
-        ("Aqua Teen Hunger Force", [
-            os.path.join('Shows', 'Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Shows', 'Aqua Teen Hunger Force'),
-            os.path.join('Aqua Teen Hunger Force', 'Episodes'),
-            os.path.join('Aqua Teen Hunger Force'),
-            # Common abbreviation fallback
-            os.path.join('Shows', 'ATHF', 'Episodes'),
-            os.path.join('Shows', 'ATHF'),
-            os.path.join('ATHF', 'Episodes'),
-            os.path.join('ATHF'),
-        ]),
-    ]
-
     found = {}
     checked = set()
 
@@ -2060,12 +2584,12 @@ def auto_detect_show_folders_web(mount_roots_override):
         roots_to_probe.append(mount_root)
 
         for root in roots_to_probe:
-            for show_name, rels in show_patterns:
+            prefix = _norm_root_prefix(root)
+            for show_name, rels in _SHOW_PATTERNS:
                 if show_name in found:
                     continue
                 for rel in rels:
-                    candidate = os.path.join(root, rel)
-                    norm = os.path.normpath(candidate)
+                    norm = prefix + rel
                     if norm in checked:
                         continue
                     checked.add(norm)
@@ -2075,7 +2599,7 @@ def auto_detect_show_folders_web(mount_roots_override):
 
     for mount_root in roots:
         probe_mount(mount_root)
-        if len(found) >= len(show_patterns):
+        if len(found) >= len(_SHOW_PATTERNS):
             break
 
     return found
@@ -2275,7 +2799,7 @@ def auto_detect_tv_vibe_interstitials_dir_web(mount_roots_override):
     return None
 
 
-def auto_detect_tv_vibe_music_dir(volume_label='T7'):
+def auto_detect_tv_vibe_music_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for bump music on the same drive as episodes.
 
     Expected layout: <mount_root>/Sleepy Shows Data/TV Vibe/music
@@ -2283,36 +2807,27 @@ def auto_detect_tv_vibe_music_dir(volume_label='T7'):
     Returns the music folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             direct = os.path.join(root, 'TV Vibe', 'music')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            music_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'music')
-            if music_dir and os.path.isdir(music_dir):
+            music_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'music', probe_cache)
+            if music_dir and _isdir_cached(music_dir, probe_cache):
                 return music_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -2320,7 +2835,7 @@ def auto_detect_tv_vibe_music_dir(volume_label='T7'):
     return None
 
 
-def auto_detect_tv_vibe_images_dir(volume_label='T7'):
+def auto_detect_tv_vibe_images_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for bump images on the same drive as episodes.
 
     Expected layout: <mount_root>/Sleepy Shows Data/TV Vibe/images
@@ -2328,36 +2843,27 @@ def auto_detect_tv_vibe_images_dir(volume_label='T7'):
     Returns the images folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             direct = os.path.join(root, 'TV Vibe', 'images')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            images_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'images')
-            if images_dir and os.path.isdir(images_dir):
+            images_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'images', probe_cache)
+            if images_dir and _isdir_cached(images_dir, probe_cache):
                 return images_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -2365,7 +2871,7 @@ def auto_detect_tv_vibe_images_dir(volume_label='T7'):
     return None
 
 
-def auto_detect_tv_vibe_audio_fx_dir(volume_label='T7'):
+def auto_detect_tv_vibe_audio_fx_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for bump audio FX on the same drive as episodes.
 
     Expected layout: <mount_root>/Sleepy Shows Data/TV Vibe/audio
@@ -2373,36 +2879,27 @@ def auto_detect_tv_vibe_audio_fx_dir(volume_label='T7'):
     Returns the audio folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             direct = os.path.join(root, 'TV Vibe', 'audio')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            audio_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'audio')
-            if audio_dir and os.path.isdir(audio_dir):
+            audio_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'audio', probe_cache)
+            if audio_dir and _isdir_cached(audio_dir, probe_cache):
                 return audio_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -2410,7 +2907,7 @@ def auto_detect_tv_vibe_audio_fx_dir(volume_label='T7'):
     return None
 
 
-def auto_detect_tv_vibe_videos_dir(volume_label='T7'):
+def auto_detect_tv_vibe_videos_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for TV Vibe bump videos on the same drive as episodes.
 
     Expected layout: <mount_root>/Sleepy Shows Data/TV Vibe/videos
@@ -2418,36 +2915,27 @@ def auto_detect_tv_vibe_videos_dir(volume_label='T7'):
     Returns the videos folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             direct = os.path.join(root, 'TV Vibe', 'videos')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            videos_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'videos')
-            if videos_dir and os.path.isdir(videos_dir):
+            videos_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'videos', probe_cache)
+            if videos_dir and _isdir_cached(videos_dir, probe_cache):
                 return videos_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -2455,7 +2943,7 @@ def auto_detect_tv_vibe_videos_dir(volume_label='T7'):
     return None
 
 
-def auto_detect_tv_vibe_interstitials_dir(volume_label='T7'):
+def auto_detect_tv_vibe_interstitials_dir(volume_label='T7', probe_cache=None):
     """Best-effort detection for TV Vibe interludes on the same drive as episodes.
 
     Expected layout: <mount_root>/Sleepy Shows Data/TV Vibe/interludes
@@ -2463,46 +2951,37 @@ def auto_detect_tv_vibe_interstitials_dir(volume_label='T7'):
     Returns the interludes folder path if found, else None.
     """
     def probe_mount(mount_root):
-        if not mount_root or not os.path.isdir(mount_root):
-            return None
-
-        data_root = os.path.join(mount_root, 'Sleepy Shows Data')
-        roots_to_probe = []
-        if os.path.isdir(data_root):
-            roots_to_probe.append(data_root)
-        roots_to_probe.append(mount_root)
-
-        for root in roots_to_probe:
+        for root in _roots_to_probe(mount_root, probe_cache):
             # New naming
             direct = os.path.join(root, 'TV Vibe', 'interludes')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
             # Legacy naming
             direct = os.path.join(root, 'TV Vibe', 'interstitials')
-            if os.path.isdir(direct):
+            if _isdir_cached(direct, probe_cache):
                 return direct
 
-            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe')
+            tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
             if not tv_vibe_dir:
                 continue
 
-            inter_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'interludes')
-            if inter_dir and os.path.isdir(inter_dir):
+            inter_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'interludes', probe_cache)
+            if inter_dir and _isdir_cached(inter_dir, probe_cache):
                 return inter_dir
 
-            inter_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'interstitials')
-            if inter_dir and os.path.isdir(inter_dir):
+            inter_dir = _find_child_dir_case_insensitive(tv_vibe_dir, 'interstitials', probe_cache)
+            if inter_dir and _isdir_cached(inter_dir, probe_cache):
                 return inter_dir
 
         return None
 
-    for mount_root in _iter_mount_roots_for_label(volume_label) or []:
+    for mount_root in _mount_roots_for_label_cached(volume_label, probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
 
-    for mount_root in _iter_mount_roots_fallback() or []:
+    for mount_root in _mount_roots_fallback_cached(probe_cache):
         found = probe_mount(mount_root)
         if found:
             return found
@@ -2510,6 +2989,101 @@ def auto_detect_tv_vibe_interstitials_dir(volume_label='T7'):
     return None
 
 
+# TV Vibe children picked out by auto_detect_tv_vibe_subdirs; interludes is the
+# newer name for interstitials and wins when a root has both.
+_TV_VIBE_SUBDIR_NAMES = frozenset(('scripts', 'music', 'images', 'audio', 'interludes', 'interstitials'))
+
+
+def auto_detect_tv_vibe_subdirs(volume_label='T7', probe_cache=None) -> dict:
+    """Find all TV Vibe subfolders with one listing of each candidate TV Vibe folder.
+
+    Returns {'scripts', 'music', 'images', 'audio', 'interstitials'} -> path or None, using
+    the same root order as the single-folder detectors (first root that has a folder wins).
+    """
+    out = {}
+    keys = ('scripts', 'music', 'images', 'audio', 'interstitials')
+
+    def probe_mount(mount_root):
+        # Results for this mount only; mounts are probed concurrently and merged in order.
+        found_here = {}
+        for root in _roots_to_probe(mount_root, probe_cache):
+            # Fast path for the expected exact casing, then case-insensitive fallback.
+            tv_vibe_dir = os.path.join(root, 'TV Vibe')
+            if not _isdir_cached(tv_vibe_dir, probe_cache):
+                tv_vibe_dir = _find_child_dir_case_insensitive(root, 'TV Vibe', probe_cache)
+                if not tv_vibe_dir:
+                    continue
+
+            here = {}
+            try:
+                with os.scandir(tv_vibe_dir) as it:
+                    for entry in it:
+                        n = entry.name.lower()
+                        if n not in _TV_VIBE_SUBDIR_NAMES:
+                            continue
+                        # Exact (lowercase) casing beats a case-insensitive match.
+                        if n in here and entry.name != n:
+                            continue
+                        try:
+                            if entry.is_dir():
+                                here[n] = entry.path
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+            inter = here.get('interludes') or here.get('interstitials')
+            if inter:
+                here['interstitials'] = inter
+            for k in keys:
+                if k not in found_here and here.get(k):
+                    found_here[k] = here[k]
+        return found_here
+
+    def merge(found_here):
+        for k, path in found_here.items():
+            out.setdefault(k, path)
+
+    def all_found():
+        return len(out) >= len(keys)
+
+    def probe_all(mount_roots):
+        _map_mount_roots(probe_mount, mount_roots, merge, all_found)
+
+    label_roots = list(_mount_roots_for_label_cached(volume_label, probe_cache))
+    probe_all(label_roots)
+
+    if len(out) < len(keys):
+        probed = set(label_roots)
+        probe_all(r for r in _mount_roots_fallback_cached(probe_cache) if r not in probed)
+
+    return {k: out.get(k) for k in keys}
+
+
+def auto_detect_all(volume_label='T7', probe_cache=None):
+    """Run every drive detector used by auto-config against one shared probe cache.
+
+    Returns a dict with 'show_folders' plus the tv_vibe_* folder paths (None when missing).
+    """
+    if probe_cache is None:
+        probe_cache = {}
+    subdirs = auto_detect_tv_vibe_subdirs(volume_label=volume_label, probe_cache=probe_cache)
+    return {
+        'show_folders': auto_detect_show_folders(volume_label=volume_label, probe_cache=probe_cache),
+        'tv_vibe_scripts_dir': subdirs.get('scripts'),
+        'tv_vibe_music_dir': subdirs.get('music'),
+        'tv_vibe_images_dir': subdirs.get('images'),
+        'tv_vibe_audio_fx_dir': subdirs.get('audio'),
+        'tv_vibe_interstitials_dir': subdirs.get('interstitials'),
+    }
+
+
+@lru_cache(maxsize=4096)
+def _natural_sort_key_cached(name: str):
+    """natural_sort_key as a tuple, memoized: names like "Episodes" or "Season 1" recur across shows."""
+    return tuple(natural_sort_key(name))
+
+
 def _scan_episode_files(folder_path, *, use_cache: bool = True):
     """Return naturally sorted full paths of video files under folder_path.
 
@@ -2548,12 +3122,21 @@ def _scan_episode_files(folder_path, *, use_cache: bool = True):
     if manifest_results:
         return manifest_results
 
+    # POSIX: fwalk descends with openat() on directory fds instead of resolving
+    # each full path again. It refuses a symlinked top folder, so those keep os.walk.
+    if hasattr(os, 'fwalk') and not os.path.islink(folder_path):
+        walker = os.fwalk(folder_path)
+    else:
+        walker = os.walk(folder_path)
+
     try:
-        for root, dirs, files in os.walk(folder_path):
-            dirs.sort(key=natural_sort_key)
-            files.sort(key=natural_sort_key)
+        for root, dirs, files, *_dirfd in walker:
+            dirs.sort(key=_natural_sort_key_cached)
+            files.sort(key=_natural_sort_key_cached)
             for f in files:
-                if os.path.splitext(f)[1].lower() in VIDEO_EXTENSIONS:
+                # Same test as splitext (a leading dot is not an extension), minus the call.
+                dot = f.rfind('.')
+                if dot > 0 and f[dot + 1:].lower() in _VIDEO_EXTS_NO_DOT:
                     results.append(os.path.join(root, f))
     except Exception:
         return []
@@ -2607,15 +3190,55 @@ def _load_from_manifest(folder_path):
         return []
 
 
+# Parsed auto playlists keyed by path -> ((st_mtime_ns, st_size), data), so repeated
+# auto-config runs (startup, hotplug) skip re-parsing files nothing has touched.
+# Cached dicts are shared: callers must copy before modifying.
+_PLAYLIST_JSON_CACHE = {}
+
+
+def _load_playlist_json_cached(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        _PLAYLIST_JSON_CACHE.pop(path, None)
+        return None
+    sig = (st.st_mtime_ns, st.st_size)
+    hit = _PLAYLIST_JSON_CACHE.get(path)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except Exception:
+        _PLAYLIST_JSON_CACHE.pop(path, None)
+        return None
+    _PLAYLIST_JSON_CACHE[path] = (sig, data)
+    return data
+
+
+def _store_playlist_json(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    try:
+        st = os.stat(path)
+        _PLAYLIST_JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), data)
+    except OSError:
+        _PLAYLIST_JSON_CACHE.pop(path, None)
+
+
 def _write_auto_playlist_json(
     playlist_filename,
     episode_folder,
     default_shuffle_mode='standard',
     *,
     prefer_existing_playlist_paths: bool = False,
+    scanned_paths=None,
 ):
     """Create/update a playlist JSON under playlists/ for a given episodes folder.
 
+    scanned_paths, when given, is a fresh _scan_episode_files(episode_folder) result
+    and is used instead of scanning the folder again.
+
     Regeneration policy:
     - If the playlist file does not exist, create it.
     - If the playlist exists and its stored 'source_folder' still exists on disk, do nothing.
@@ -2628,13 +3251,7 @@ def _write_auto_playlist_json(
         os.makedirs(files_dir, exist_ok=True)
         playlist_path = os.path.join(files_dir, playlist_filename)
 
-        existing = None
-        if os.path.exists(playlist_path):
-            try:
-                with open(playlist_path, 'r') as f:
-                    existing = json.load(f)
-            except Exception:
-                existing = None
+        existing = _load_playlist_json_cached(playlist_path)
 
         def _season_from_path(p: str) -> int:
             try:
@@ -2741,7 +3358,10 @@ def _write_auto_playlist_json(
                 return True
 
             # Fresh scan (portable correctness over cached speed).
-            disk_paths = _scan_episode_files(src, use_cache=False)
+            if scanned_paths is not None and _norm_path_key(src) == _norm_path_key(episode_folder):
+                disk_paths = scanned_paths
+            else:
+                disk_paths = _scan_episode_files(src, use_cache=False)
             if not disk_paths:
                 return True
 
@@ -2984,8 +3604,7 @@ def _write_auto_playlist_json(
                 if _has_any_frequency_settings(defaults):
                     existing = dict(existing or {})
                     existing['frequency_settings'] = defaults
-                    with open(playlist_path, 'w') as f:
-                        json.dump(existing, f, indent=2)
+                    _store_playlist_json(playlist_path, existing)
                     return True
 
                 return False
@@ -2998,21 +3617,21 @@ def _write_auto_playlist_json(
         # Portable mode fix: when the external drive is present, we MUST rescan so
         # stale paths (e.g. /mnt/shows/...) get rewritten to the real mounted drive.
         eps = []
-        if bool(prefer_existing_playlist_paths):
+        if bool(prefer_existing_playlist_paths) and isinstance(existing, dict):
             try:
-                if os.path.exists(playlist_path):
-                    with open(playlist_path, 'r') as f:
-                        existing_data = json.load(f)
-                        for item in existing_data.get('playlist', []):
-                            if item.get('type') == 'video':
-                                eps.append(item.get('path'))
+                for item in existing.get('playlist', []):
+                    if item.get('type') == 'video':
+                        eps.append(item.get('path'))
             except Exception:
                 eps = []
 
         # Scan the detected episode folder when we don't have reusable entries.
         if not eps:
             # Portable mode: bypass cache to detect deletions.
-            eps = _scan_episode_files(episode_folder, use_cache=bool(prefer_existing_playlist_paths))
+            if scanned_paths is not None:
+                eps = list(scanned_paths)
+            else:
+                eps = _scan_episode_files(episode_folder, use_cache=bool(prefer_existing_playlist_paths))
             if not eps:
                 return False
 
@@ -3050,6 +3669,25 @@ def _write_auto_playlist_json(
         if not _has_any_frequency_settings(frequency_settings):
             frequency_settings = _default_frequency_settings_for(playlist_filename, eps)
 
+        # Fingerprint the episode list so an identical regeneration (e.g. Web mode
+        # reusing the existing entries every launch) doesn't rewrite the file.
+        h = hashlib.blake2b(digest_size=16)
+        for p in eps:
+            h.update(str(p).encode('utf-8', 'surrogatepass'))
+            h.update(b'\n')
+        content_hash = h.hexdigest()
+        try:
+            if (
+                isinstance(existing, dict)
+                and existing.get('content_hash') == content_hash
+                and existing.get('source_folder') == episode_folder
+                and existing.get('shuffle_mode') == shuffle_mode
+                and existing.get('frequency_settings') == frequency_settings
+            ):
+                return False
+        except Exception:
+            pass
+
         data = {
             'playlist': [{'type': 'video', 'path': p} for p in eps],
             'shuffle_default': (shuffle_mode != 'off'),
@@ -3057,9 +3695,9 @@ def _write_auto_playlist_json(
             'auto_generated': True,
             'source_folder': episode_folder,
             'frequency_settings': frequency_settings,
+            'content_hash': content_hash,
         }
-        with open(playlist_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        _store_playlist_json(playlist_path, data)
         return True
     except Exception:
         return False
@@ -3099,12 +3737,9 @@ class AutoConfigWorker(QObject):
                 result['tv_vibe_audio_fx_dir'] = auto_detect_tv_vibe_audio_fx_dir_web(roots)
                 result['tv_vibe_interstitials_dir'] = auto_detect_tv_vibe_interstitials_dir_web(roots)
             else:
-                show_folders = auto_detect_show_folders(volume_label=self.volume_label)
-                result['tv_vibe_scripts_dir'] = auto_detect_tv_vibe_scripts_dir(volume_label=self.volume_label)
-                result['tv_vibe_music_dir'] = auto_detect_tv_vibe_music_dir(volume_label=self.volume_label)
-                result['tv_vibe_images_dir'] = auto_detect_tv_vibe_images_dir(volume_label=self.volume_label)
-                result['tv_vibe_audio_fx_dir'] = auto_detect_tv_vibe_audio_fx_dir(volume_label=self.volume_label)
-                result['tv_vibe_interstitials_dir'] = auto_detect_tv_vibe_interstitials_dir(volume_label=self.volume_label)
+                detected = auto_detect_all(volume_label=self.volume_label)
+                show_folders = detected.pop('show_folders') or {}
+                result.update(detected)
             sources = []
             for key in ("King of the Hill", "Bob's Burgers", "Squidbillies", "Aqua Teen Hunger Force"):
                 p = show_folders.get(key)
@@ -3133,33 +3768,19 @@ class AutoConfigWorker(QObject):
                 result['episodes'] = pm.episodes
 
             updated = False
-            if show_folders.get("Bob's Burgers"):
-                updated = _write_auto_playlist_json(
-                    "Bob's Burgers.json",
-                    show_folders["Bob's Burgers"],
-                    default_shuffle_mode='standard',
-                    prefer_existing_playlist_paths=bool(roots),
-                ) or updated
-            if show_folders.get("King of the Hill"):
-                updated = _write_auto_playlist_json(
-                    "King of the Hill.json",
-                    show_folders["King of the Hill"],
-                    default_shuffle_mode='standard',
-                    prefer_existing_playlist_paths=bool(roots),
-                ) or updated
-            if show_folders.get("Squidbillies"):
-                updated = _write_auto_playlist_json(
-                    "Squidbillies.json",
-                    show_folders["Squidbillies"],
-                    default_shuffle_mode='standard',
-                    prefer_existing_playlist_paths=bool(roots),
-                ) or updated
-            if show_folders.get("Aqua Teen Hunger Force"):
+            for show_name in ("Bob's Burgers", "King of the Hill", "Squidbillies", "Aqua Teen Hunger Force"):
+                folder = show_folders.get(show_name)
+                if not folder:
+                    continue
+                # Portable mode: one fresh scan serves both the staleness check and
+                # the rewrite inside _write_auto_playlist_json.
+                eps = None if roots else _scan_episode_files(folder, use_cache=False)
                 updated = _write_auto_playlist_json(
-                    "Aqua Teen Hunger Force.json",
-                    show_folders["Aqua Teen Hunger Force"],
+                    f"{show_name}.json",
+                    folder,
                     default_shuffle_mode='standard',
                     prefer_existing_playlist_paths=bool(roots),
+                    scanned_paths=eps,
                 ) or updated
             result['playlists_updated'] = bool(updated)
         except Exception:
@@ -3181,12 +3802,24 @@ class ShowCardButton(QPushButton):
     available button size.
     """
 
+    # Quiet period after the last resize before the smooth (bilinear) rescale.
+    SMOOTH_RESCALE_DELAY_MS = 60
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._orig_pixmap = None
+        # (w, h, transform) of the icon currently set, to skip redundant rescales.
+        self._scaled_key = None
+        # While the window is being dragged, rescale with FastTransformation and
+        # only do the smooth pass once resizing pauses.
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._update_scaled_icon)
 
     def set_original_pixmap(self, pixmap: QPixmap):
         self._orig_pixmap = pixmap if (pixmap is not None and not pixmap.isNull()) else None
+        self._scaled_key = None
         self._update_scaled_icon()
 
     def minimumSizeHint(self):
@@ -3197,21 +3830,28 @@ class ShowCardButton(QPushButton):
 
     def resizeEvent(self, event):
         try:
-            self._update_scaled_icon()
+            if self._update_scaled_icon(Qt.FastTransformation):
+                self._smooth_timer.start()
         except Exception:
             pass
         return super().resizeEvent(event)
 
-    def _update_scaled_icon(self):
+    def _update_scaled_icon(self, transform=Qt.SmoothTransformation):
         pm = self._orig_pixmap
         if pm is None or pm.isNull():
-            return
+            return False
         # Scale to the current button size; keep aspect ratio.
         w = max(1, int(self.width()))
         h = max(1, int(self.height()))
-        scaled = pm.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Nothing to do if the icon already matches this size (a smooth icon is
+        # never downgraded to a fast preview of the same size).
+        if self._scaled_key in ((w, h, transform), (w, h, Qt.SmoothTransformation)):
+            return False
+        scaled = pm.scaled(w, h, Qt.KeepAspectRatio, transform)
         self.setIcon(QIcon(scaled))
         self.setIconSize(scaled.size())
+        self._scaled_key = (w, h, transform)
+        return True
 
 class WelcomeScreen(QWidget):
     def __init__(self, main_window):
@@ -3232,6 +3872,24 @@ class WelcomeScreen(QWidget):
         self._footer_icon_items = []
         self._footer_composites = []
         self._footer_checkbox_target_size = None
+        # stars.png scaled to the current width; rescaled only when the width changes.
+        self._stars_scaled = None
+        self._stars_scaled_width = -1
+        # Background gradient brush for the current height.
+        self._bg_brush = None
+        self._bg_brush_h = -1
+        # Checkbox pixmaps composed per checked state, and icons per (state, w, h).
+        self._chk_composites = {}
+        self._chk_icons = {}
+        # Header art is rescaled with FastTransformation during a resize drag and
+        # smoothly once the size has been stable for a moment.
+        self._smooth_rescale_timer = QTimer(self)
+        self._smooth_rescale_timer.setSingleShot(True)
+        self._smooth_rescale_timer.setInterval(ShowCardButton.SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_rescale_timer.timeout.connect(self._apply_smooth_rescale)
+        # (size, transform) the clouds/logo were last scaled with.
+        self._clouds_scaled_key = None
+        self._logo_scaled_key = None
         self.setup_ui()
 
     def minimumSizeHint(self):
@@ -3240,19 +3898,26 @@ class WelcomeScreen(QWidget):
         
     def paintEvent(self, event):
         painter = QPainter(self)
-        grad = QLinearGradient(0, 0, 0, self.height())
-        # Fade to black faster: Top is black, Middle is Black, Bottom is Blue
-        grad.setColorAt(0, Qt.black)
-        grad.setColorAt(0.6, Qt.black) # Stay black until 60% down
-        grad.setColorAt(1, QColor("#0e1a77"))
-        painter.fillRect(self.rect(), grad)
+        h = self.height()
+        if self._bg_brush_h != h:
+            grad = QLinearGradient(0, 0, 0, h)
+            # Fade to black faster: Top is black, Middle is Black, Bottom is Blue
+            grad.setColorAt(0, Qt.black)
+            grad.setColorAt(0.6, Qt.black) # Stay black until 60% down
+            grad.setColorAt(1, QColor("#0e1a77"))
+            self._bg_brush = QBrush(grad)
+            self._bg_brush_h = h
+        painter.fillRect(self.rect(), self._bg_brush)
         
         # Draw Stars (Stretched/Scaled to fill width)
-        stars = QPixmap(get_asset_path("stars.png"))
-        if not stars.isNull():
-             scaled_stars = stars.scaledToWidth(self.width(), Qt.SmoothTransformation)
-             y_pos = 80
-             painter.drawPixmap(0, y_pos, scaled_stars)
+        w = self.width()
+        if self._stars_scaled_width != w:
+            stars = _asset_pixmap("stars.png")
+            self._stars_scaled = None if stars.isNull() else stars.scaledToWidth(w, Qt.SmoothTransformation)
+            self._stars_scaled_width = w
+        if self._stars_scaled is not None:
+            y_pos = 80
+            painter.drawPixmap(0, y_pos, self._stars_scaled)
 
     def setup_ui(self):
         # Use absolute positioning for header elements (Logo, Clouds)
@@ -3276,8 +3941,7 @@ class WelcomeScreen(QWidget):
             btn = ShowCardButton()
             
             # Store original pixmap for resizing later
-            path = get_asset_path(icon_name)
-            pix = QPixmap(path)
+            pix = _asset_pixmap(icon_name)
             btn.setProperty("original_pixmap", pix)
             try:
                 btn.set_original_pixmap(pix)
@@ -3351,7 +4015,7 @@ class WelcomeScreen(QWidget):
         def create_img_btn(filename, callback):
             btn = QPushButton()
             path = get_asset_path(filename)
-            pix = QPixmap(path)
+            pix = _asset_pixmap(filename)
             
             if not pix.isNull():
                 # Sized by _update_footer_graphics_scale() based on available width.
@@ -3401,8 +4065,7 @@ class WelcomeScreen(QWidget):
             layout.addWidget(chk)
 
             # Text Label (Image Button)
-            path = get_asset_path(text_img_name)
-            pix = QPixmap(path)
+            pix = _asset_pixmap(text_img_name)
 
             txt_btn = QPushButton()
             if not pix.isNull():
@@ -3454,7 +4117,7 @@ class WelcomeScreen(QWidget):
         
         # 4. Clouds (Absolute Positioned, Top)
         self.lbl_clouds = QLabel(self)
-        self.lbl_clouds.setProperty("original_pixmap", QPixmap(get_asset_path("clouds.png")))
+        self.lbl_clouds.setProperty("original_pixmap", _asset_pixmap("clouds.png"))
         self.lbl_clouds.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.lbl_clouds.setStyleSheet("background: transparent;") # Crucial for gradient visibility
         # Don't hard-code a width here; let resizeEvent size it to the window.
@@ -3462,7 +4125,7 @@ class WelcomeScreen(QWidget):
         
         # 5. Logo (Absolute Positioned, Top Center)
         self.lbl_logo = QLabel(self)
-        self.lbl_logo.setProperty("original_pixmap", QPixmap(get_asset_path("sleepy-shows-logo.png")))
+        self.lbl_logo.setProperty("original_pixmap", _asset_pixmap("sleepy-shows-logo.png"))
         self.lbl_logo.setStyleSheet("background: transparent;")
         self.lbl_logo.setAlignment(Qt.AlignCenter)
         self.lbl_logo.setGeometry(0, 0, 0, 0)
@@ -3510,23 +4173,53 @@ class WelcomeScreen(QWidget):
         btn._pending = bool(pending)
         overlay.setGeometry(btn.rect())
 
-        if pending:
-            overlay.setVisible(True)
-            spinner.start()
-        else:
-            spinner.stop()
-            overlay.setVisible(False)
+        if pending:
+            overlay.setVisible(True)
+            spinner.start()
+        else:
+            spinner.stop()
+            overlay.setVisible(False)
+
+    def resizeEvent(self, event):
+        w = event.size().width()
+        h = event.size().height()
+
+        if self._layout_header_art(w, h, Qt.FastTransformation):
+            self._smooth_rescale_timer.start()
+
+        # 3. Keep pending overlays in sync with their buttons.
+        for btn in self.show_btns:
+            overlay = getattr(btn, '_pending_overlay', None)
+            if overlay is not None:
+                overlay.setGeometry(btn.rect())
+
+        # 4. Scale footer graphics so they fit the current width.
+        try:
+            self._update_footer_graphics_scale()
+        except Exception:
+            pass
+        
+        super().resizeEvent(event)
+
+    def _apply_smooth_rescale(self):
+        self._layout_header_art(self.width(), self.height(), Qt.SmoothTransformation)
 
-    def resizeEvent(self, event):
-        w = event.size().width()
-        h = event.size().height()
-        
+    def _layout_header_art(self, w, h, transform):
+        """Scale and place the clouds and logo; returns True if anything was rescaled.
+
+        A pixmap already scaled to the same target size is kept (a smooth one is
+        never replaced by a fast preview of the same size).
+        """
+        rescaled = False
         # 1. Resize Clouds to span width
         if hasattr(self, 'lbl_clouds'):
             orig_clouds = self.lbl_clouds.property("original_pixmap")
             if orig_clouds and not orig_clouds.isNull():
-                scaled = orig_clouds.scaledToWidth(w, Qt.SmoothTransformation)
-                self.lbl_clouds.setPixmap(scaled)
+                if self._clouds_scaled_key not in ((w, transform), (w, Qt.SmoothTransformation)):
+                    self.lbl_clouds.setPixmap(orig_clouds.scaledToWidth(w, transform))
+                    self._clouds_scaled_key = (w, transform)
+                    rescaled = True
+                scaled = self.lbl_clouds.pixmap()
                 self.lbl_clouds.setGeometry(0, 0, w, scaled.height())
                 
         # 2. Position Logo (Much Bigger)
@@ -3537,55 +4230,64 @@ class WelcomeScreen(QWidget):
                  # Keep an upper bound for large monitors, but always allow it to shrink.
                  logo_w = int(min(600, max(220, w * 0.55)))
                  logo_h = int(max(120, h * 0.22))
-                 scaled_logo = orig_logo.scaled(logo_w, logo_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                 self.lbl_logo.setPixmap(scaled_logo)
+                 if self._logo_scaled_key not in ((logo_w, logo_h, transform),
+                                                  (logo_w, logo_h, Qt.SmoothTransformation)):
+                     self.lbl_logo.setPixmap(orig_logo.scaled(logo_w, logo_h, Qt.KeepAspectRatio, transform))
+                     self._logo_scaled_key = (logo_w, logo_h, transform)
+                     rescaled = True
+                 scaled_logo = self.lbl_logo.pixmap()
                  # Center X, Top Y (e.g. 20px down)
                  x_pos = (w - scaled_logo.width()) // 2
                  self.lbl_logo.setGeometry(x_pos, 20, scaled_logo.width(), scaled_logo.height())
+        return rescaled
 
-        # 3. Keep pending overlays in sync with their buttons.
-        for btn in self.show_btns:
-            overlay = getattr(btn, '_pending_overlay', None)
-            if overlay is not None:
-                overlay.setGeometry(btn.rect())
-
-        # 4. Scale footer graphics so they fit the current width.
-        try:
-            self._update_footer_graphics_scale()
-        except Exception:
-            pass
         
-        super().resizeEvent(event)
+    def _checkbox_composite(self, checked: bool):
+        """checkbox.png with the check/ex overlay, composed once per state."""
+        composite = self._chk_composites.get(checked)
+        if composite is None:
+            base = _asset_pixmap("checkbox.png")
+            if base.isNull():
+                return None
 
-        
-    def update_checkbox(self, btn, checked, target_size: QSize | None = None):
-        base = QPixmap(get_asset_path("checkbox.png"))
-        if base.isNull(): return
-        
-        if target_size is None:
-            target_size = base.size()
+            composite = QPixmap(base.size())
+            composite.fill(Qt.transparent)
 
-        result = QPixmap(base.size())
-        result.fill(Qt.transparent)
-        
-        painter = QPainter(result)
-        painter.drawPixmap(0, 0, base)
-        
-        overlay_name = "check.png" if checked else "ex.png"
-        overlay = QPixmap(get_asset_path(overlay_name))
-        
-        if not overlay.isNull():
-            # Center overlay
-            ox = (base.width() - overlay.width()) // 2
-            oy = (base.height() - overlay.height()) // 2
-            painter.drawPixmap(ox, oy, overlay)
-            
-        painter.end()
+            painter = QPainter(composite)
+            painter.drawPixmap(0, 0, base)
+
+            overlay_name = "check.png" if checked else "ex.png"
+            overlay = _asset_pixmap(overlay_name)
+
+            if not overlay.isNull():
+                # Center overlay
+                ox = (base.width() - overlay.width()) // 2
+                oy = (base.height() - overlay.height()) // 2
+                painter.drawPixmap(ox, oy, overlay)
+
+            painter.end()
+            self._chk_composites[checked] = composite
+        return composite
+
+    def update_checkbox(self, btn, checked, target_size: QSize | None = None):
+        checked = bool(checked)
+        composite = self._checkbox_composite(checked)
+        if composite is None: return
 
-        scaled = result.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        btn.setIcon(QIcon(scaled))
-        btn.setIconSize(scaled.size())
-        btn.setFixedSize(scaled.size())
+        if target_size is None:
+            target_size = composite.size()
+
+        # Toggles and footer rescales only ever need a few (state, size) icons.
+        key = (checked, target_size.width(), target_size.height())
+        cached = self._chk_icons.get(key)
+        if cached is None:
+            scaled = composite.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cached = (QIcon(scaled), scaled.size())
+            self._chk_icons[key] = cached
+        icon, size = cached
+        btn.setIcon(icon)
+        btn.setIconSize(size)
+        btn.setFixedSize(size)
 
     def _update_footer_graphics_scale(self):
         if self._footer_widget is None or self._footer_layout is None:
@@ -3905,7 +4607,8 @@ class EditModeWidget(QWidget):
         except Exception:
             files = []
 
-        files = sorted([f for f in files if isinstance(f, str)], key=natural_sort_key)
+        files = [f for f in files if isinstance(f, str)]
+        files.sort(key=natural_sort_key)
         for f in files:
             item = QListWidgetItem(f)
             item.setData(Qt.UserRole, os.path.join('playlists', f))
@@ -3979,7 +4682,8 @@ class EditModeWidget(QWidget):
                 n = 0
             if n > 0:
                 season_nums[int(n)] = True
-        season_nums = sorted(list(season_nums.keys()))
+        season_nums = list(season_nums)
+        season_nums.sort()
 
         season_keys = [f"season:{n}" for n in season_nums]
 
@@ -4197,10 +4901,10 @@ class EditModeWidget(QWidget):
             if isinstance(item, dict):
                 itype = item.get('type', 'video')
                 if itype == 'video':
-                    name = os.path.basename(item['path'])
+                    name = item.get('name') or os.path.basename(item['path'])
                     self.playlist_list.addItem(f"{i+1}. {name}")
                 elif itype == 'interstitial':
-                    name = os.path.basename(item['path'])
+                    name = item.get('name') or os.path.basename(item['path'])
                     self.playlist_list.addItem(f"{i+1}. [IL] {name}")
                 elif itype == 'bump':
                    self.playlist_list.addItem(f"{i+1}. [BUMP] {os.path.basename(item.get('audio', 'Unknown'))}")
@@ -4402,8 +5106,12 @@ class PlayModeWidget(QWidget):
         side_layout.addWidget(self.playlists_list_widget)
         
         side_layout.addWidget(QLabel("Current Playlist Episodes:"))
-        self.episode_list_widget = QListWidget()
-        self.episode_list_widget.itemDoubleClicked.connect(self.play_episode_from_list)
+        # Model/view list: one string per row instead of a QListWidgetItem per episode.
+        self.episode_list_widget = QListView()
+        self.episode_list_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._episode_model = QStringListModel(self.episode_list_widget)
+        self.episode_list_widget.setModel(self._episode_model)
+        self.episode_list_widget.doubleClicked.connect(self.play_episode_from_list)
         side_layout.addWidget(self.episode_list_widget)
         
         side_refresh_btn = QPushButton("Refresh Playlists")
@@ -4427,7 +5135,8 @@ class PlayModeWidget(QWidget):
         self.controls_widget.setObjectName("controls_widget")
         # Single-row controls bar; we dynamically shrink controls on resize.
         self.controls_widget.setFixedHeight(180)
-        self.controls_widget.setStyleSheet("background-color: #1a1a1a;")
+        self.controls_widget.setProperty("overlay", "false")
+        self.controls_widget.setStyleSheet(_CONTROLS_QSS)
         controls_layout = QVBoxLayout(self.controls_widget)
         
         # Sliders Row
@@ -4596,31 +5305,7 @@ class PlayModeWidget(QWidget):
         self.slider_vol.setValue(100)
         self.slider_vol.setFixedWidth(150)
         self.slider_vol.setFixedHeight(50)
-        self.slider_vol.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                border: 1px solid #444;
-                height: 10px;
-                background: #333;
-                margin: 0px;
-                border-radius: 5px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {THEME_COLOR};
-                border-radius: 5px;
-            }}
-            QSlider::add-page:horizontal {{
-                background: #555;
-                border-radius: 5px;
-            }}
-            QSlider::handle:horizontal {{
-                width: 24px;
-                height: 24px;
-                margin: -7px 0;
-                background: white;
-                border: none;
-                border-radius: 12px;
-            }}
-        """)
+        self.slider_vol.setStyleSheet(_VOL_SLIDER_QSS)
         self.slider_vol.valueChanged.connect(self.main_window.set_volume)
         right_layout.addWidget(self.slider_vol)
 
@@ -4952,6 +5637,22 @@ class PlayModeWidget(QWidget):
         except Exception:
             pass
 
+    def _set_controls_overlay_style(self, enabled):
+        value = "true" if enabled else "false"
+        w = self.controls_widget
+        if w.property("overlay") == value:
+            return
+        w.setProperty("overlay", value)
+        # Re-polish instead of setStyleSheet(): the rules are already parsed, only
+        # the selector match changes (descendants inherit via the `QWidget` rule).
+        for child in [w] + w.findChildren(QWidget):
+            try:
+                child.style().unpolish(child)
+                child.style().polish(child)
+            except Exception:
+                pass
+        w.update()
+
     def set_controls_overlay(self, enabled):
         if enabled:
             # Remove from layout, reparent to video stack/container (done by main window mostly, 
@@ -4960,8 +5661,7 @@ class PlayModeWidget(QWidget):
             self.controls_widget.setParent(self.main_window.video_container) # Parent to video container to act as overlay
             self.controls_widget.show()
             self.controls_widget.raise_()
-             # Colors/Style for overlay?
-            self.controls_widget.setStyleSheet("background-color: rgba(26, 26, 26, 200);") # Semi transparent?
+            self._set_controls_overlay_style(True) # Semi transparent
 
             # Overlay mode changes parent/geometry; recalc widths after the event loop settles.
             try:
@@ -4971,7 +5671,7 @@ class PlayModeWidget(QWidget):
         else:
             self.controls_widget.setParent(self.video_area) # Make child of video area again
             self.video_layout.addWidget(self.controls_widget)
-            self.controls_widget.setStyleSheet("background-color: #1a1a1a;") # Solid
+            self._set_controls_overlay_style(False) # Solid
 
             # Reinserted into layout; recalc widths after relayout.
             try:
@@ -5005,19 +5705,23 @@ class PlayModeWidget(QWidget):
                 pass
             self.playlists_list_widget.addItem(item)
 
+    @staticmethod
+    def _episode_display_name(item):
+        if isinstance(item, dict):
+            if item.get('type') == 'bump':
+                return "[BUMP] " + os.path.basename(item.get('audio', 'Audio'))
+            return item.get('name') or os.path.basename(item.get('path', 'Unknown'))
+        return os.path.basename(item)
+
     def refresh_episode_list(self):
-        self.episode_list_widget.clear()
-        current = self.main_window.playlist_manager.current_playlist
-        for i, item in enumerate(current):
-             if isinstance(item, dict):
-                 name = os.path.basename(item.get('path', 'Unknown'))
-                 if item.get('type') == 'bump':
-                     name = "[BUMP] " + os.path.basename(item.get('audio', 'Audio'))
-             else:
-                 name = os.path.basename(item)
-             
-             prefix = "> " if i == self.main_window.playlist_manager.current_index else ""
-             self.episode_list_widget.addItem(f"{prefix}{name}")
+        pm = self.main_window.playlist_manager
+        current = pm.current_playlist
+        cur_idx = pm.current_index
+        display_name = self._episode_display_name
+        self._episode_model.setStringList([
+            f"{'> ' if i == cur_idx else ''}{display_name(item)}"
+            for i, item in enumerate(current)
+        ])
 
     def load_selected_playlist(self, item):
         filename = None
@@ -5043,9 +5747,8 @@ class PlayModeWidget(QWidget):
                 filename = filename + '.json'
         self.main_window.load_playlist(os.path.join("playlists", filename), auto_play=True)
 
-    def play_episode_from_list(self, item):
-        idx = self.episode_list_widget.row(item)
-        self.main_window.play_index(idx)
+    def play_episode_from_list(self, index):
+        self.main_window.play_index(index.row())
 
 
 # --- Main Window ---
@@ -5389,11 +6092,37 @@ class MainWindow(QMainWindow):
         self.sleep_timer_active = False
 
         # Sleep timer countdown is paused unless a show is actively playing.
+        # While counting down, the remaining time is derived from an absolute
+        # monotonic deadline; while paused it is frozen in sleep_remaining_ms.
         self.sleep_remaining_ms = 0
-        self._sleep_last_tick = None
-        self.sleep_countdown_timer = QTimer(self)
-        self.sleep_countdown_timer.setInterval(1000)
-        self.sleep_countdown_timer.timeout.connect(self._on_sleep_countdown_tick)
+        self._sleep_deadline_monotonic = None
+        # (remaining_min, active) last written to the sleep widgets.
+        self._sleep_ui_rendered = None
+        # Play-mode sleep button; cached once PlayModeWidget exists.
+        self._btn_sleep_timer = None
+        # Sleep dropdown checkmarks (loaded once, shared by every popup).
+        self._sleep_check_icon = QIcon(get_asset_path("check.png"))
+        self._sleep_empty_icon = QIcon()
+        self._mpv = None
+        # The action timer is armed once for the full remaining time and fires
+        # the sleep action directly. The UI timer is re-armed for the next
+        # displayed-minute boundary; the UI only shows whole minutes so a coarse
+        # timer is plenty.
+        self._sleep_action_timer = QTimer(self)
+        self._sleep_action_timer.setSingleShot(True)
+        self._sleep_action_timer.setTimerType(Qt.PreciseTimer)
+        self._sleep_action_timer.timeout.connect(self._on_sleep_deadline)
+        self._sleep_ui_timer = QTimer(self)
+        self._sleep_ui_timer.setSingleShot(True)
+        self._sleep_ui_timer.setTimerType(Qt.CoarseTimer)
+        self._sleep_ui_timer.timeout.connect(self._on_sleep_countdown_tick)
+        # Re-check shortly after play starts (mpv may not report playing yet).
+        # Static singleShot() would use a precise timer for <2s intervals.
+        self._sleep_resume_retry_timer = QTimer(self)
+        self._sleep_resume_retry_timer.setSingleShot(True)
+        self._sleep_resume_retry_timer.setTimerType(Qt.CoarseTimer)
+        self._sleep_resume_retry_timer.setInterval(200)
+        self._sleep_resume_retry_timer.timeout.connect(self._resume_sleep_countdown_if_needed)
         
         # Mouse Hover Timer
         self.hover_timer = QTimer(self)
@@ -5420,22 +6149,34 @@ class MainWindow(QMainWindow):
 
         self.bump_timer = QTimer(self)
         self.bump_timer.setSingleShot(True)
+        self.bump_timer.setTimerType(Qt.CoarseTimer)
         self.bump_timer.timeout.connect(self.advance_bump_card)
         self.current_bump_script = None
         self.current_card_index = 0
 
         # When bumps are enabled, forward navigation detours through a bump first.
-        # We store the intended next index here while the bump plays.
-        self._pending_next_index = None
-        self._pending_next_record_history = True
+        # We store the intended (next index, record_history) here while the bump plays.
+        self._pending_next = None
         
         self.is_seeking = False
-        self.total_duration = 0
+        self.total_duration = 0.0
         self._last_time_pos = None
+        # Last values pushed to the seek slider / time label (-1 forces a refresh).
+        self._last_seeker_percent = -1
+        self._last_seeker_sec = -1
+        self._last_time_label_text = None
         self._play_start_monotonic = None
         self._played_since_start = False
         self._advancing_from_eof = False
         self._skip_penalty_applied_for_start = None
+        self._last_play_target = None
+        self._handled_eof_for_index = None
+        self._handled_eof_for_bump_key = None
+
+        # Bump playback state (read on every playback tick, so always present).
+        self._in_bump_playback = False
+        self._current_bump_is_video = False
+        self._current_bump_video_path = None
 
         # Fullscreen transition/state helpers (Windows reliability).
         self._pre_fullscreen_geometry = None
@@ -5492,9 +6233,11 @@ class MainWindow(QMainWindow):
         self._keep_awake_timer.start()
 
         # Playback watchdog: some MPV setups do not reliably deliver end-file events.
-        # This ensures we still auto-advance when a file reaches EOF.
+        # EOF is normally picked up from mpv's eof-reached/idle-active observers
+        # (player.eofDetected); this slow poll is only a safety net.
         self.playback_watchdog = QTimer(self)
-        self.playback_watchdog.setInterval(500)
+        self.playback_watchdog.setInterval(2000)
+        self.playback_watchdog.setTimerType(Qt.CoarseTimer)
         self.playback_watchdog.timeout.connect(self._check_playback_end)
         self.playback_watchdog.start()
 
@@ -5517,6 +6260,8 @@ class MainWindow(QMainWindow):
         
         self.player = MpvPlayer(self.video_container)
         container_layout.addWidget(self.player)
+        # Cached for hot paths (sleep countdown, seeker); None if mpv failed to init.
+        self._mpv = getattr(self.player, 'mpv', None)
 
         # Audio-only MPV instance used for bump sound effects.
         self.fx_player = MpvAudioPlayer()
@@ -5613,10 +6358,7 @@ class MainWindow(QMainWindow):
         self.bump_video_overlay_label = QLabel(self.video_container)
         self.bump_video_overlay_label.setAlignment(Qt.AlignCenter)
         self.bump_video_overlay_label.setWordWrap(True)
-        try:
-            self.bump_video_overlay_label.setFont(QFont(str(self._bump_font_family), int(self._bump_font_px)))
-        except Exception:
-            self.bump_video_overlay_label.setFont(QFont("Arial", 28, QFont.Bold))
+        self.bump_video_overlay_label.setFont(_bump_font(self._bump_font_family, self._bump_font_px))
         self.bump_video_overlay_label.setStyleSheet(
             "background-color: rgba(12, 12, 12, 190); color: white; padding: 20px;"
         )
@@ -5631,6 +6373,7 @@ class MainWindow(QMainWindow):
         self._episode_overlay_hide_timer = QTimer(self)
         self._episode_overlay_hide_timer.setSingleShot(True)
         self._episode_overlay_hide_timer.timeout.connect(self._on_episode_overlay_hide_timeout)
+        self._overlay_title_shown = None
         
         # We need to manually position this because it's an overlay
         self.video_container.installEventFilter(self)
@@ -5644,18 +6387,30 @@ class MainWindow(QMainWindow):
 
                 # Windows: native hook so F fullscreen works even with mpv native focus.
                 try:
-                    if sys.platform.startswith('win'):
+                    if _IS_WIN:
                         self._win_fullscreen_key_filter = _WinFullscreenKeyFilter(self)
                         app.installNativeEventFilter(self._win_fullscreen_key_filter)
                 except Exception:
                     pass
+
+                # Windows: forget cached drive letters/labels when a volume is (un)plugged.
+                try:
+                    if _IS_WIN:
+                        self._win_device_change_filter = _WinDeviceChangeFilter()
+                        app.installNativeEventFilter(self._win_device_change_filter)
+                except Exception:
+                    pass
         except Exception:
             pass
 
+        self._install_power_event_hooks()
+
         # mpv callbacks can occur off the GUI thread; always queue into Qt's main loop.
         self.player.positionChanged.connect(self.update_seeker, Qt.QueuedConnection)
         self.player.durationChanged.connect(self.update_duration, Qt.QueuedConnection)
         self.player.playbackFinished.connect(self.on_playback_finished, Qt.QueuedConnection)
+        # Event-driven EOF check; _check_playback_end applies the bump/dedup guards.
+        self.player.eofDetected.connect(self._check_playback_end, Qt.QueuedConnection)
         try:
             self.player.endFileReason.connect(self.on_mpv_end_file_reason, Qt.QueuedConnection)
         except Exception:
@@ -5670,7 +6425,7 @@ class MainWindow(QMainWindow):
         # If MPV failed to initialize, its error can occur before signal wiring and be invisible.
         # Surface it once here so playback failures aren't "silent".
         try:
-            if getattr(self.player, 'mpv', None) is None:
+            if self._mpv is None:
                 init_err = getattr(self.player, '_init_error', None)
                 if init_err:
                     QTimer.singleShot(0, lambda: self.on_player_error(str(init_err)))
@@ -5692,19 +6447,13 @@ class MainWindow(QMainWindow):
         self.lbl_bump_text = QLabel("")
         self.lbl_bump_text.setAlignment(Qt.AlignCenter)
         self.lbl_bump_text.setWordWrap(True)
-        try:
-            self.lbl_bump_text.setFont(QFont(str(self._bump_font_family), int(self._bump_font_px)))
-        except Exception:
-            self.lbl_bump_text.setFont(QFont("Arial", 28, QFont.Bold))
+        self.lbl_bump_text.setFont(_bump_font(self._bump_font_family, self._bump_font_px))
         self.lbl_bump_text.setStyleSheet("color: white;")
 
         self.lbl_bump_text_top = QLabel("")
         self.lbl_bump_text_top.setAlignment(Qt.AlignCenter)
         self.lbl_bump_text_top.setWordWrap(True)
-        try:
-            self.lbl_bump_text_top.setFont(QFont(str(self._bump_font_family), int(self._bump_font_px)))
-        except Exception:
-            self.lbl_bump_text_top.setFont(QFont("Arial", 28, QFont.Bold))
+        self.lbl_bump_text_top.setFont(_bump_font(self._bump_font_family, self._bump_font_px))
         self.lbl_bump_text_top.setStyleSheet("color: white;")
 
         self.bump_image_view = BumpImageView(self.bump_widget)
@@ -5713,10 +6462,7 @@ class MainWindow(QMainWindow):
         self.lbl_bump_text_bottom = QLabel("")
         self.lbl_bump_text_bottom.setAlignment(Qt.AlignCenter)
         self.lbl_bump_text_bottom.setWordWrap(True)
-        try:
-            self.lbl_bump_text_bottom.setFont(QFont(str(self._bump_font_family), int(self._bump_font_px)))
-        except Exception:
-            self.lbl_bump_text_bottom.setFont(QFont("Arial", 28, QFont.Bold))
+        self.lbl_bump_text_bottom.setFont(_bump_font(self._bump_font_family, self._bump_font_px))
         self.lbl_bump_text_bottom.setStyleSheet("color: white;")
 
         bump_layout.addWidget(self.lbl_bump_text)
@@ -5787,9 +6533,9 @@ class MainWindow(QMainWindow):
 
     def _is_actively_playing(self) -> bool:
         try:
-            if not hasattr(self, 'player') or not self.player or not getattr(self.player, 'mpv', None):
+            if self._mpv is None:
                 return False
-            mpv = self.player.mpv
+            mpv = self._mpv
             if bool(getattr(mpv, 'core_idle', True)):
                 return False
             if bool(getattr(mpv, 'pause', False)):
@@ -5953,8 +6699,8 @@ class MainWindow(QMainWindow):
             pos_s = None
         if pos_s is None:
             try:
-                if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                    pos_s = getattr(self.player.mpv, 'time_pos', None)
+                if self._mpv is not None:
+                    pos_s = getattr(self._mpv, 'time_pos', None)
             except Exception:
                 pos_s = None
 
@@ -5965,8 +6711,8 @@ class MainWindow(QMainWindow):
             dur_s = None
         if not dur_s:
             try:
-                if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                    dur_s = getattr(self.player.mpv, 'duration', None)
+                if self._mpv is not None:
+                    dur_s = getattr(self._mpv, 'duration', None)
             except Exception:
                 dur_s = None
 
@@ -6150,7 +6896,7 @@ class MainWindow(QMainWindow):
             items = list(st.get('playlist_items') or [])
             if items:
                 try:
-                    pm.current_playlist = items
+                    pm.current_playlist = annotate_display_names(items)
                 except Exception:
                     pm.current_playlist = []
                 try:
@@ -6228,7 +6974,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         try:
-            if sys.platform.startswith('win'):
+            if _IS_WIN:
                 s = os.path.normcase(s)
         except Exception:
             pass
@@ -6597,10 +7343,9 @@ class MainWindow(QMainWindow):
             if os.path.exists(manifest_path):
                 # Manifest exists - use configured web_files_root or default
                 if not str(getattr(self, 'web_files_root', '') or '').strip():
-                    system = platform.system().lower()
-                    if system.startswith('win'):
+                    if _IS_WIN:
                         self.web_files_root = r'Z:\\Sleepy Shows Data'
-                    elif system == 'darwin':
+                    elif _IS_MAC:
                         self.web_files_root = '/Volumes/shows/Sleepy Shows Data'
                     else:
                         self.web_files_root = '/mnt/shows/Sleepy Shows Data'
@@ -6615,10 +7360,9 @@ class MainWindow(QMainWindow):
                 if detected:
                     self.web_files_root = detected
                 else:
-                    system = platform.system().lower()
-                    if system.startswith('win'):
+                    if _IS_WIN:
                         self.web_files_root = r'Z:\\Sleepy Shows Data'
-                    elif system == 'darwin':
+                    elif _IS_MAC:
                         self.web_files_root = '/Volumes/shows/Sleepy Shows Data'
                     else:
                         self.web_files_root = '/mnt/shows/Sleepy Shows Data'
@@ -6679,11 +7423,7 @@ class MainWindow(QMainWindow):
             label = 'T7'
 
         candidates: list[str] = []
-        system = ''
-        try:
-            system = platform.system().lower()
-        except Exception:
-            system = ''
+        system = _PLATFORM
 
         # Universal likely locations (fast checks only).
         candidates.extend([
@@ -7338,13 +8078,14 @@ class MainWindow(QMainWindow):
                 itype = item.get('type', 'video')
                 if itype not in ('video', 'interstitial'):
                     return None
-                path = item.get('path') or ''
+                # Playlist items carry a cached basename (annotate_display_names).
+                name = item.get('name') or os.path.basename(item.get('path') or '')
             else:
-                path = str(item or '')
+                name = os.path.basename(str(item or ''))
 
-            if not path:
+            if not name:
                 return None
-            return os.path.splitext(os.path.basename(path))[0]
+            return os.path.splitext(name)[0]
         except Exception:
             return None
 
@@ -7375,9 +8116,14 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            self.overlay_label.setText(title)
-            self.overlay_label.setVisible(True)
-            self.overlay_label.raise_()
+            if title != self._overlay_title_shown:
+                self._overlay_title_shown = title
+                self.overlay_label.setText(title)
+            # Only show/restack on the hidden -> shown transition; repeated
+            # pause/unpause would otherwise re-raise an already visible label.
+            if self.overlay_label.isHidden():
+                self.overlay_label.setVisible(True)
+                self.overlay_label.raise_()
         except Exception:
             return
 
@@ -7459,7 +8205,7 @@ class MainWindow(QMainWindow):
             ass = s
 
         try:
-            mpv = getattr(getattr(self, 'player', None), 'mpv', None)
+            mpv = self._mpv
             if mpv is None:
                 return
             # mpv command: show-text <string> [duration-ms]
@@ -7556,8 +8302,8 @@ class MainWindow(QMainWindow):
         cur_ms = 0
         try:
             pos = getattr(self, '_last_time_pos', None)
-            if pos is None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                pos = getattr(self.player.mpv, 'time_pos', None)
+            if pos is None and self._mpv is not None:
+                pos = getattr(self._mpv, 'time_pos', None)
             if pos is not None:
                 cur_ms = int(round(float(pos) * 1000.0))
         except Exception:
@@ -7663,8 +8409,8 @@ class MainWindow(QMainWindow):
         start_timer = False
         # If paused, keep shown.
         # If playing, start timer to hide.
-        if hasattr(self, 'player') and self.player.mpv:
-             if not self.player.mpv.pause and not self.player.mpv.core_idle:
+        if self._mpv is not None:
+             if not self._mpv.pause and not self._mpv.core_idle:
                  start_timer = True
         
         self.play_mode_widget.controls_widget.setVisible(True)
@@ -7697,8 +8443,8 @@ class MainWindow(QMainWindow):
             return
 
         # Only hide if playing
-        if hasattr(self, 'player') and self.player.mpv:
-            if not self.player.mpv.pause and not self.player.mpv.core_idle:
+        if self._mpv is not None:
+            if not self._mpv.pause and not self._mpv.core_idle:
                  # Check if cursor is over controls?
                  # If over controls, don't hide.
                  controls_gm = self.play_mode_widget.controls_widget.geometry()
@@ -7722,9 +8468,9 @@ class MainWindow(QMainWindow):
         # Failsafe: if we are in fullscreen, playing, and controls are visible
         # check if it's been > 3 seconds since last activity.
         if self.isFullScreen() and self.play_mode_widget.controls_widget.isVisible():
-            if hasattr(self, 'player') and self.player.mpv:
+            if self._mpv is not None:
                  # Check playing state
-                 is_playing = (not self.player.mpv.pause) and (not self.player.mpv.core_idle)
+                 is_playing = (not self._mpv.pause) and (not self._mpv.core_idle)
                  if is_playing:
                      diff = time.time() - self.last_activity_time
                      if diff > 3.5: # 3.5s threshold (slightly larger than hover)
@@ -7999,7 +8745,7 @@ class MainWindow(QMainWindow):
         
         # --- Custom Menu Bar ---
         self.menu_bar_widget = QWidget()
-        self.menu_bar_widget.setStyleSheet("background-color: #2b2b2b; border-bottom: 2px solid #1a1a1a;")
+        self.menu_bar_widget.setStyleSheet(_MENU_BAR_QSS)
         self.menu_bar_widget.setFixedHeight(35)
         mb_layout = QHBoxLayout(self.menu_bar_widget)
         mb_layout.setContentsMargins(10, 0, 10, 0)
@@ -8024,6 +8770,7 @@ class MainWindow(QMainWindow):
         # 2. Play Mode
         self.play_mode_widget = PlayModeWidget(self)
         self.mode_stack.addWidget(self.play_mode_widget)
+        self._btn_sleep_timer = self.play_mode_widget.btn_sleep_timer
 
         # 3. Bumps (Global)
         self.bumps_mode_widget = BumpsModeWidget(self)
@@ -8033,6 +8780,9 @@ class MainWindow(QMainWindow):
         self.video_stack = QStackedWidget()
         self.video_stack.addWidget(self.video_container)
         self.video_stack.addWidget(self.bump_widget)
+        # Cached "bump view is showing" flag for the playback hot paths.
+        self._on_bump_surface = False
+        self.video_stack.currentChanged.connect(self._on_video_stack_changed)
         
         # Replace placeholder in PlayModeWidget layout
         # Finding the layout directly
@@ -8119,41 +8869,29 @@ class MainWindow(QMainWindow):
         layout.addStretch(1) # Push menus to left, fill rest
 
         # Mode buttons on top-right (replaces Mode dropdown)
-        mode_btn_style = f"""
-            QPushButton {{
-                color: #e0e0e0;
-                background: transparent;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 5px 12px;
-                border: 1px solid transparent;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background: #444;
-            }}
-            QPushButton:checked {{
-                background: {THEME_COLOR};
-                border-color: {THEME_COLOR};
-            }}
-        """
-
         self.btn_mode_welcome = QPushButton("HOME")
         self.btn_mode_play = QPushButton("PLAY")
         self.btn_mode_edit = QPushButton("EDIT")
         self.btn_mode_bumps = QPushButton("SETTINGS")
 
-        for btn in (self.btn_mode_welcome, self.btn_mode_play, self.btn_mode_edit, self.btn_mode_bumps):
-            btn.setStyleSheet(mode_btn_style)
+        # Styling comes from the menu bar's stylesheet (_MENU_BAR_QSS) via the
+        # `mode` property; the group handles exclusivity.
+        self._mode_btn_group = QButtonGroup(self)
+        self._mode_btn_group.setExclusive(True)
+        # Button ids are the mode_stack indices, so idClicked feeds set_mode directly.
+        for btn, mode_index in (
+            (self.btn_mode_welcome, 0),
+            (self.btn_mode_play, 2),
+            (self.btn_mode_edit, 1),
+            (self.btn_mode_bumps, 3),
+        ):
+            btn.setProperty("mode", "true")
             btn.setCursor(Qt.PointingHandCursor)
             btn.setCheckable(True)
-            btn.setAutoExclusive(True)
+            self._mode_btn_group.addButton(btn, mode_index)
             layout.addWidget(btn)
 
-        self.btn_mode_welcome.clicked.connect(lambda _=False: self.set_mode(0))
-        self.btn_mode_play.clicked.connect(lambda _=False: self.set_mode(2))
-        self.btn_mode_edit.clicked.connect(lambda _=False: self.set_mode(1))
-        self.btn_mode_bumps.clicked.connect(lambda _=False: self.set_mode(3))
+        self._mode_btn_group.idClicked.connect(self.set_mode)
         
         # Ensure status label exists
         if not hasattr(self, 'lbl_sleep_status'):
@@ -8162,18 +8900,10 @@ class MainWindow(QMainWindow):
             # status bar might be hidden in full screen, but we add to layout if we want custom
             self.statusBar().addPermanentWidget(self.lbl_sleep_status)
 
-    def show_sleep_timer_dropdown(self, anchor_widget=None):
-        # If called from clicked(bool), ignore the boolean argument.
-        if isinstance(anchor_widget, bool):
-            anchor_widget = None
-
-        # Create a custom popup widget simulate a dropdown
-        if hasattr(self, 'sleep_dropdown') and self.sleep_dropdown and self.sleep_dropdown.isVisible():
-            self.sleep_dropdown.close()
-            return
-            
-        self.sleep_dropdown = QWidget(self, Qt.Popup)
-        self.sleep_dropdown.setStyleSheet("""
+    def _build_sleep_dropdown(self):
+        """Create the sleep timer popup once; show_sleep_timer_dropdown() reuses it."""
+        dropdown = QWidget(self, Qt.Popup)
+        dropdown.setStyleSheet("""
             QWidget { background-color: #333; border: 1px solid #111; }
             QPushButton { 
                 text-align: left; 
@@ -8186,63 +8916,62 @@ class MainWindow(QMainWindow):
             QPushButton:hover { background-color: #0e1a77; }
         """)
         
-        layout = QVBoxLayout(self.sleep_dropdown)
+        layout = QVBoxLayout(dropdown)
         layout.setContentsMargins(0, 5, 0, 5)
         layout.setSpacing(0)
         
-        # State Checking
-        is_active = bool(self.sleep_timer_active)
-        active_mins = int(self.current_sleep_minutes) if hasattr(self, 'current_sleep_minutes') else 0
-        
-        # Cache icons so update_sleep_menu_state() can reuse them.
-        self._sleep_check_icon = QIcon(get_asset_path("check.png"))
-        self._sleep_empty_icon = QIcon()
-
-        check_icon = self._sleep_check_icon
         empty_icon = self._sleep_empty_icon
 
-        # Track buttons so we can update checkmarks while the dropdown is open.
+        # Track buttons so checkmarks can be toggled instead of rebuilding the popup.
         self._sleep_dropdown_buttons = {}
         
-        # Helper to add item
-        def add_item(text, is_checked, callback, minutes_value=None):
+        # Helper to add item (0 minutes == Off)
+        def add_item(text, minutes_value):
             btn = QPushButton(text)
-            if is_checked:
-                btn.setIcon(check_icon)
-            else:
-                btn.setIcon(empty_icon) # Keep alignment
-
-            if minutes_value is not None:
-                self._sleep_dropdown_buttons[int(minutes_value)] = btn
-
-            # clicked(bool) -> ignore the bool
-            btn.clicked.connect(lambda _=False: callback())
-            btn.clicked.connect(lambda _=False: self.sleep_dropdown.close())
+            btn.setIcon(empty_icon) # Keep alignment
+            self._sleep_dropdown_buttons[int(minutes_value)] = btn
+            btn.clicked.connect(partial(self._on_sleep_dropdown_choice, int(minutes_value)))
             layout.addWidget(btn)
 
         # 1. Off
-        add_item("Off", not is_active, lambda: self.cancel_sleep_timer(), minutes_value=0)
+        add_item("Off", 0)
         
         # 2. Durations
-        durations = [30, 60, 90, 120, 180]
-        for mins in durations:
-            if mins == 90:
-                label = "1.5 Hours"
-            elif mins % 60 == 0:
-                h = mins // 60
-                label = f"{h} Hour" if h == 1 else f"{h} Hours"
-            else:
-                label = f"{mins} Minutes"
-                
-            is_checked = is_active and (mins == active_mins)
-            add_item(label, is_checked, lambda m=mins: self.start_sleep_timer(m), minutes_value=mins)
+        for mins, label in _SLEEP_DURATIONS:
+            add_item(label, mins)
+
+        dropdown.resize(200, dropdown.sizeHint().height())
+        self.sleep_dropdown = dropdown
+        return dropdown
+
+    def _on_sleep_dropdown_choice(self, minutes, _checked=False):
+        if minutes <= 0:
+            self.cancel_sleep_timer()
+        else:
+            self.start_sleep_timer(minutes)
+        self.sleep_dropdown.close()
+
+    def show_sleep_timer_dropdown(self, anchor_widget=None):
+        # If called from clicked(bool), ignore the boolean argument.
+        if isinstance(anchor_widget, bool):
+            anchor_widget = None
+
+        # Custom popup widget to simulate a dropdown; built on first use.
+        if hasattr(self, 'sleep_dropdown') and self.sleep_dropdown and self.sleep_dropdown.isVisible():
+            self.sleep_dropdown.close()
+            return
+        if getattr(self, 'sleep_dropdown', None) is None:
+            self._build_sleep_dropdown()
+        self._sync_sleep_dropdown_checks()
             
         # Position it
         anchor = anchor_widget if anchor_widget is not None else self.btn_sleep_timer
-        self.sleep_dropdown.resize(200, self.sleep_dropdown.sizeHint().height())
 
-        global_bottom_left = anchor.mapToGlobal(anchor.rect().bottomLeft())
-        global_top_left = anchor.mapToGlobal(anchor.rect().topLeft())
+        # One parent-chain walk; both corners are offsets from the origin.
+        origin = anchor.mapToGlobal(QPoint(0, 0))
+        r = anchor.rect()
+        global_bottom_left = QPoint(origin.x() + r.left(), origin.y() + r.bottom())
+        global_top_left = QPoint(origin.x() + r.left(), origin.y() + r.top())
 
         # Default: open downward. If it would go off-screen, open upward.
         screen = anchor.screen() if hasattr(anchor, 'screen') else None
@@ -8312,12 +9041,17 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"DEBUG: cycle_sleep_timer_quick failed: {e}")
 
-    # Old method removed as logic is now inside show_sleep_timer_dropdown
     def update_sleep_menu_state(self):
+        # Only relevant while the dropdown is visible; it re-syncs when shown.
         try:
-            # Only relevant while the dropdown is visible.
             if not hasattr(self, 'sleep_dropdown') or not self.sleep_dropdown or not self.sleep_dropdown.isVisible():
                 return
+        except Exception:
+            return
+        self._sync_sleep_dropdown_checks()
+
+    def _sync_sleep_dropdown_checks(self):
+        try:
             if not hasattr(self, '_sleep_dropdown_buttons') or not isinstance(self._sleep_dropdown_buttons, dict):
                 return
 
@@ -8351,41 +9085,69 @@ class MainWindow(QMainWindow):
         self.statusBar().addPermanentWidget(self.lbl_sleep_status)
 
     def _is_show_playing(self):
+        mpv = self._mpv
+        if mpv is None:
+            return False
         try:
-            if not hasattr(self, 'player') or not self.player or not self.player.mpv:
-                return False
-            mpv = self.player.mpv
-            paused = bool(getattr(mpv, 'pause', True))
-            core_idle = bool(getattr(mpv, 'core_idle', True))
             # Keep this consistent with existing UI logic (show_controls/hide_controls).
-            return (not paused) and (not core_idle)
+            return (not mpv.pause) and (not mpv.core_idle)
         except Exception:
             return False
 
+    def _sleep_remaining_ms_now(self):
+        deadline = self._sleep_deadline_monotonic
+        if deadline is None:
+            return int(self.sleep_remaining_ms)
+        return max(0, int((deadline - _sleep_clock()) * 1000))
+
     def _sleep_remaining_minutes(self):
-        if not self.sleep_timer_active or self.sleep_remaining_ms <= 0:
+        remaining_ms = self._sleep_remaining_ms_now()
+        if not self.sleep_timer_active or remaining_ms <= 0:
             return 0
         # Show remaining as minutes (ceiling)
-        return max(1, int((self.sleep_remaining_ms + 59999) // 60000))
+        return max(1, int((remaining_ms + 59999) // 60000))
 
     def _update_sleep_timer_ui(self):
         self._ensure_sleep_status_label()
 
-        if not self.sleep_timer_active:
-            self.lbl_sleep_status.setText("")
-            if hasattr(self, 'play_mode_widget') and hasattr(self.play_mode_widget, 'btn_sleep_timer'):
-                self.play_mode_widget.btn_sleep_timer.setText("SLEEP\nOFF")
+        # Only touch the widgets when the rendered state actually changes.
+        active = bool(self.sleep_timer_active)
+        remaining_min = self._sleep_remaining_minutes() if active else -1
+        if (remaining_min, active) == self._sleep_ui_rendered:
             return
 
-        remaining_min = self._sleep_remaining_minutes()
-        self.lbl_sleep_status.setText(f"Sleep in {remaining_min}m")
-        if hasattr(self, 'play_mode_widget') and hasattr(self.play_mode_widget, 'btn_sleep_timer'):
-            self.play_mode_widget.btn_sleep_timer.setText(f"SLEEP\n{remaining_min}m")
+        if not active:
+            status_text = ""
+            btn_text = "SLEEP\nOFF"
+        else:
+            status_text = f"Sleep in {remaining_min}m"
+            btn_text = f"SLEEP\n{remaining_min}m"
+
+        if self.lbl_sleep_status.text() != status_text:
+            self.lbl_sleep_status.setText(status_text)
+        btn = self._btn_sleep_timer
+        if btn is not None:
+            # setText() relayouts/repaints even when the text is identical.
+            if btn.text() != btn_text:
+                btn.setText(btn_text)
+            self._sleep_ui_rendered = (remaining_min, active)
 
     def _pause_sleep_countdown(self):
-        self._sleep_last_tick = None
-        if self.sleep_countdown_timer.isActive():
-            self.sleep_countdown_timer.stop()
+        # Freeze the remaining time; the deadline is re-derived on resume.
+        if self._sleep_deadline_monotonic is not None:
+            self.sleep_remaining_ms = self._sleep_remaining_ms_now()
+            self._sleep_deadline_monotonic = None
+        self._sleep_action_timer.stop()
+        self._sleep_ui_timer.stop()
+
+    def _arm_sleep_ui_timer(self):
+        remaining_ms = self._sleep_remaining_ms_now()
+        # Minutes are displayed rounded up, so the label changes whenever the
+        # remaining time crosses a multiple of 60s. The last minute is covered
+        # by the action timer.
+        delay_ms = (remaining_ms % 60000) or 60000
+        if delay_ms < remaining_ms:
+            self._sleep_ui_timer.start(delay_ms)
 
     def _resume_sleep_countdown_if_needed(self):
         if not self.sleep_timer_active or self.sleep_remaining_ms <= 0:
@@ -8394,9 +9156,12 @@ class MainWindow(QMainWindow):
         if not self._is_show_playing():
             self._pause_sleep_countdown()
             return
-        if not self.sleep_countdown_timer.isActive():
-            self._sleep_last_tick = time.monotonic()
-            self.sleep_countdown_timer.start()
+        if self._sleep_deadline_monotonic is None:
+            self._sleep_deadline_monotonic = _sleep_clock() + (self.sleep_remaining_ms / 1000.0)
+        if not self._sleep_action_timer.isActive():
+            self._sleep_action_timer.start(max(1, self._sleep_remaining_ms_now()))
+        if not self._sleep_ui_timer.isActive():
+            self._arm_sleep_ui_timer()
 
     def _on_sleep_countdown_tick(self):
         if not self.sleep_timer_active:
@@ -8409,22 +9174,92 @@ class MainWindow(QMainWindow):
             self._update_sleep_timer_ui()
             return
 
-        now = time.monotonic()
-        if self._sleep_last_tick is None:
-            self._sleep_last_tick = now
+        # Remaining time is a pure function of the clock, so late or skipped
+        # ticks can't accumulate drift.
+        self.sleep_remaining_ms = self._sleep_remaining_ms_now()
+        self._update_sleep_timer_ui()
+        self._arm_sleep_ui_timer()
+
+    def _on_sleep_deadline(self):
+        # Qt timers may count time spent suspended; the sleep clock is the
+        # source of truth, so re-arm if the deadline hasn't really passed.
+        remaining_ms = self._sleep_remaining_ms_now()
+        if self._sleep_deadline_monotonic is not None and remaining_ms > 1000:
+            self._sleep_action_timer.start(remaining_ms)
+            self.sleep_remaining_ms = remaining_ms
             self._update_sleep_timer_ui()
             return
+        self._sleep_ui_timer.stop()
+        self.sleep_remaining_ms = 0
+        self._sleep_deadline_monotonic = None
+        if self.sleep_timer_active:
+            self.on_sleep_timer()
 
-        elapsed_ms = int((now - self._sleep_last_tick) * 1000)
-        self._sleep_last_tick = now
-        if elapsed_ms <= 0:
-            self._update_sleep_timer_ui()
+    def _install_power_event_hooks(self):
+        """Best-effort suspend/resume notifications for the sleep countdown."""
+        app = QApplication.instance()
+        if app is None:
             return
 
-        self.sleep_remaining_ms = max(0, int(self.sleep_remaining_ms) - elapsed_ms)
-        self._update_sleep_timer_ui()
-        if self.sleep_remaining_ms <= 0:
-            self.on_sleep_timer()
+        try:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+        except Exception:
+            pass
+
+        if _IS_WIN:
+            try:
+                self._win_power_event_filter = _WinPowerEventFilter(self)
+                app.installNativeEventFilter(self._win_power_event_filter)
+            except Exception:
+                pass
+        elif _PLATFORM == 'linux':
+            # systemd-logind emits PrepareForSleep(true) before suspend and
+            # PrepareForSleep(false) after wake.
+            try:
+                from PySide6.QtDBus import QDBusConnection
+
+                bus = QDBusConnection.systemBus()
+                if bus.isConnected():
+                    bus.connect(
+                        'org.freedesktop.login1',
+                        '/org/freedesktop/login1',
+                        'org.freedesktop.login1.Manager',
+                        'PrepareForSleep',
+                        self,
+                        SLOT('_on_prepare_for_sleep(bool)'),
+                    )
+            except Exception:
+                pass
+
+    @Slot(bool)
+    def _on_prepare_for_sleep(self, going_to_sleep):
+        if going_to_sleep:
+            self._on_system_suspend()
+        else:
+            self._on_system_resume()
+
+    def _on_video_stack_changed(self, index):
+        self._on_bump_surface = (index == 1)
+
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationActive:
+            self._resume_sleep_countdown_if_needed()
+
+    def _on_system_suspend(self):
+        # Freeze the remaining time so nothing elapses while suspended.
+        self._pause_sleep_countdown()
+        try:
+            self._log_event('system_suspend', sleep_remaining_ms=int(self.sleep_remaining_ms))
+        except Exception:
+            pass
+
+    def _on_system_resume(self):
+        try:
+            self._log_event('system_resume', sleep_remaining_ms=int(self.sleep_remaining_ms))
+        except Exception:
+            pass
+        # Re-arms both sleep timers from the frozen remaining time.
+        self._resume_sleep_countdown_if_needed()
 
     def start_sleep_timer(self, minutes):
         try:
@@ -8441,7 +9276,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self.sleep_remaining_ms = int(minutes * 60 * 1000)
-            self._sleep_last_tick = None
+            self._sleep_deadline_monotonic = None
             
             print(f"DEBUG: Start Timer {minutes}m")
 
@@ -8472,6 +9307,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self.sleep_remaining_ms = 0
+            self._sleep_deadline_monotonic = None
             self._pause_sleep_countdown()
             self._update_sleep_timer_ui()
             
@@ -8589,31 +9425,49 @@ class MainWindow(QMainWindow):
             self.populate_library_cumulative(structure)
 
     def populate_library_cumulative(self, full_structure):
-        self.edit_mode_widget.library_tree.clear()
-        
-        for source_path, groups in full_structure.items():
-            source_root = QTreeWidgetItem(self.edit_mode_widget.library_tree)
-            base = os.path.basename(source_path)
-            parent = os.path.basename(os.path.dirname(source_path))
-            if base.lower() in ('episodes', 'episodesl') and parent:
-                source_name = f"{parent}/{base}"
-            else:
-                source_name = base or source_path
-            source_root.setText(0, f"[{source_name}]")
-            
-            for group, items in groups.items():
-                if group == "Root":
-                    parent = source_root
+        tree = self.edit_mode_widget.library_tree
+        # Build detached items and insert them in bulk so the tree doesn't
+        # relayout/repaint per insert.
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.clear()
+            roots = []
+            for source_path, groups in full_structure.items():
+                source_root = QTreeWidgetItem()
+                base = os.path.basename(source_path)
+                parent = os.path.basename(os.path.dirname(source_path))
+                if base.lower() in ('episodes', 'episodesl') and parent:
+                    source_name = f"{parent}/{base}"
                 else:
-                    parent = QTreeWidgetItem(source_root)
-                    parent.setText(0, group)
-                    
-                for item in items:
-                    child = QTreeWidgetItem(parent)
-                    child.setText(0, item['name'])
-                    child.setData(0, Qt.UserRole, item['path'])
-                    
-        self.edit_mode_widget.library_tree.expandAll()
+                    source_name = base or source_path
+                source_root.setText(0, f"[{source_name}]")
+
+                group_nodes = []
+                for group, items in groups.items():
+                    children = []
+                    for item in items:
+                        child = QTreeWidgetItem()
+                        child.setText(0, item['name'])
+                        child.setData(0, Qt.UserRole, item['path'])
+                        children.append(child)
+
+                    if group == "Root":
+                        group_nodes.extend(children)
+                    else:
+                        group_node = QTreeWidgetItem()
+                        group_node.setText(0, group)
+                        group_node.addChildren(children)
+                        group_nodes.append(group_node)
+
+                source_root.addChildren(group_nodes)
+                roots.append(source_root)
+
+            tree.addTopLevelItems(roots)
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+        tree.expandAll()
 
     def clear_library(self):
         self.playlist_manager.clear_library()
@@ -8870,21 +9724,20 @@ class MainWindow(QMainWindow):
                 pass
 
     def add_dropped_items(self, items):
+        # Iterative depth-first walk (reversed pushes keep tree order).
         candidates = []
-        def recurse(tree_item):
+        stack = list(reversed(items))
+        while stack:
+            tree_item = stack.pop()
             path = tree_item.data(0, Qt.UserRole)
             if path:
                 candidates.append(path)
             else:
-                for i in range(tree_item.childCount()):
-                    recurse(tree_item.child(i))
+                stack.extend(tree_item.child(i) for i in range(tree_item.childCount() - 1, -1, -1))
 
-        for item in items:
-            recurse(item)
-            
-        for path in candidates:
-            # Basic append
-            self.playlist_manager.current_playlist.append({'type': 'video', 'path': path})
+        self.playlist_manager.current_playlist.extend(
+            {'type': 'video', 'path': path, 'name': os.path.basename(path)} for path in candidates
+        )
             
         self.edit_mode_widget.refresh_playlist_list()
 
@@ -8894,10 +9747,11 @@ class MainWindow(QMainWindow):
 
     def remove_from_playlist(self):
         lst = self.edit_mode_widget.playlist_list
-        rows = sorted([lst.row(item) for item in lst.selectedItems()], reverse=True)
-        for row in rows:
-            if row < len(self.playlist_manager.current_playlist):
-                del self.playlist_manager.current_playlist[row]
+        rows = frozenset(lst.row(item) for item in lst.selectedItems())
+        if rows:
+            # Single filtering pass; slice-assign so the list object is kept.
+            current = self.playlist_manager.current_playlist
+            current[:] = [it for i, it in enumerate(current) if i not in rows]
         self.edit_mode_widget.refresh_playlist_list()
 
     def show_playlist_context_menu(self, pos):
@@ -8943,7 +9797,7 @@ class MainWindow(QMainWindow):
         
         self.edit_mode_widget.refresh_playlist_list()
         
-        if self.playlist_manager.current_playlist and not self.player.mpv.core_idle:
+        if self.playlist_manager.current_playlist and not self._mpv.core_idle:
              pass 
 
     def set_shuffle_mode(self, mode, update_ui=True):
@@ -8973,18 +9827,18 @@ class MainWindow(QMainWindow):
                 filename += ".json"
             
             data = {
-                'playlist': [
+                # 'name' is a runtime cache (annotate_display_names); keep it out of the file.
+                'playlist': strip_display_names(
                     item for item in self.playlist_manager.current_playlist
                     if not (isinstance(item, dict) and item.get('type') == 'bump')
-                ],
+                ),
                 # Backward-compatible boolean (standard shuffle == True)
                 'shuffle_default': (self.playlist_manager.shuffle_mode != 'off'),
                 # Preferred persisted value
                 'shuffle_mode': self.playlist_manager.shuffle_mode,
                 'frequency_settings': self.playlist_manager.get_frequency_settings_for_save(),
             }
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            playlist_io.save_playlist_json(filename, data)
             self.current_playlist_filename = filename
             QMessageBox.information(self, "Success", "Playlist saved!")
             self.play_mode_widget.refresh_playlists()
@@ -8996,7 +9850,7 @@ class MainWindow(QMainWindow):
             # Clear the working playlist after save so the user can build a new one.
             # If media is currently loaded in the player, don't clear to avoid breaking playback.
             try:
-                core_idle = bool(getattr(getattr(self.player, 'mpv', None), 'core_idle', True))
+                core_idle = bool(getattr(self._mpv, 'core_idle', True))
             except Exception:
                 core_idle = True
             if core_idle:
@@ -9071,7 +9925,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
                 
-                self.playlist_manager.current_playlist = data.get('playlist', [])
+                self.playlist_manager.current_playlist = annotate_display_names(data.get('playlist', []))
                 self.playlist_manager.reset_playback_state()
 
                 # Restore shuffle mode (string preferred, bool fallback)
@@ -9144,7 +9998,7 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
 
-                self.playlist_manager.current_playlist = data.get('playlist', [])
+                self.playlist_manager.current_playlist = annotate_display_names(data.get('playlist', []))
                 self.playlist_manager.reset_playback_state()
 
                 mode = data.get('shuffle_mode', None)
@@ -9191,12 +10045,14 @@ class MainWindow(QMainWindow):
 
         # Keep file consistent with current editor state.
         try:
-            data['playlist'] = [
+            data['playlist'] = strip_display_names(
                 item for item in self.playlist_manager.current_playlist
                 if not (isinstance(item, dict) and item.get('type') == 'bump')
-            ]
+            )
             data['shuffle_default'] = (self.playlist_manager.shuffle_mode != 'off')
             data['shuffle_mode'] = self.playlist_manager.shuffle_mode
+            # The entries no longer match the auto-generated fingerprint.
+            data.pop('content_hash', None)
         except Exception:
             pass
 
@@ -9213,7 +10069,9 @@ class MainWindow(QMainWindow):
         except Exception:
             playlists = []
 
-        choices = ["Clear All"] + sorted([p for p in playlists if isinstance(p, str)], key=natural_sort_key)
+        choices = [p for p in playlists if isinstance(p, str)]
+        choices.sort(key=natural_sort_key)
+        choices.insert(0, "Clear All")
         choice, ok = QInputDialog.getItem(self, "Clear Viewing History", "Choose what to clear:", choices, 0, False)
         if not ok or not choice:
             return
@@ -9285,7 +10143,7 @@ class MainWindow(QMainWindow):
                 self.playlist_manager.clear_frequency_settings()
             except Exception:
                 pass
-            self.playlist_manager.current_playlist = [{'type': 'video', 'path': path}]
+            self.playlist_manager.current_playlist = [{'type': 'video', 'path': path, 'name': os.path.basename(path)}]
             self.playlist_manager.current_index = 0
             self.edit_mode_widget.refresh_playlist_list()
             self.play_mode_widget.refresh_episode_list()
@@ -9346,14 +10204,17 @@ class MainWindow(QMainWindow):
             self.stop_bump_playback()
             pm.current_index = index
             item = pm.current_playlist[index]
+            # Resolve the item kind once; legacy string items have no type.
+            is_dict_item = isinstance(item, dict)
+            itype = item.get('type', 'video') if is_dict_item else None
 
             # Global bump gate: when enabled, play a bump before any episode playback,
             # including the first episode (even if we're starting mid-queue).
             if (
                 self.bumps_enabled
                 and not bypass_bump_gate
-                and self.video_stack.currentIndex() != 1
-                and getattr(self, '_pending_next_index', None) is None
+                and not self._on_bump_surface
+                and self._pending_next is None
             ):
                 try:
                     is_episode = pm.is_episode_item(item)
@@ -9370,13 +10231,12 @@ class MainWindow(QMainWindow):
 
                     # If no eligible bump exists (e.g., no music long enough), just play.
                     if bump_item:
-                        self._pending_next_index = int(index)
-                        self._pending_next_record_history = bool(record_history)
+                        self._pending_next = (int(index), bool(record_history))
                         self._play_bump_with_optional_interstitial(bump_item)
                         return
 
             # Global bumps are optional. If disabled, skip bump items.
-            if isinstance(item, dict) and item.get('type') == 'bump' and not self.bumps_enabled:
+            if itype == 'bump' and not self.bumps_enabled:
                 QTimer.singleShot(0, self.play_next)
                 return
 
@@ -9393,6 +10253,8 @@ class MainWindow(QMainWindow):
                 pass
             self._play_start_monotonic = time.monotonic()
             self._played_since_start = False
+            # update_seeker keeps this fresh from here on; Prev relies on it.
+            self._last_time_pos = 0.0
 
             # Record playback history for Prev navigation.
             if record_history:
@@ -9411,10 +10273,10 @@ class MainWindow(QMainWindow):
             # We can't easily highlight the sidebar list without refreshing or sophisticated mapping, 
             # so just refresh the sidebar list to show ">" indicator
             self.play_mode_widget.refresh_episode_list()
-            self.play_mode_widget.episode_list_widget.setCurrentRow(index)
+            pmw = self.play_mode_widget
+            pmw.episode_list_widget.setCurrentIndex(pmw._episode_model.index(index))
             
-            if isinstance(item, dict):
-                itype = item.get('type', 'video')
+            if is_dict_item:
                 if itype == 'video' or itype == 'interstitial':
                     path = item['path']
                     self.video_stack.setCurrentIndex(0)
@@ -9447,14 +10309,14 @@ class MainWindow(QMainWindow):
                     self.player.play(target)
                     self._played_since_start = True
                     prefix = "[IL]" if itype == 'interstitial' else ""
-                    self.setWindowTitle(f"Sleepy Shows - {prefix} {os.path.basename(path)}")
+                    self.setWindowTitle(f"Sleepy Shows - {prefix} {item.get('name') or os.path.basename(path)}")
                     try:
                         self._log_event('play_start', kind=itype, source_path=str(path or ''), target=str(target or ''), index=int(index))
                     except Exception:
                         pass
                     self._sync_keep_awake()
                     self._resume_sleep_countdown_if_needed()
-                    QTimer.singleShot(200, self._resume_sleep_countdown_if_needed)
+                    self._sleep_resume_retry_timer.start()
                 elif itype == 'bump':
                     try:
                         self._activate_prefetched_bump_assets(int(index))
@@ -9499,7 +10361,7 @@ class MainWindow(QMainWindow):
                      pass
                  self._sync_keep_awake()
                  self._resume_sleep_countdown_if_needed()
-                 QTimer.singleShot(200, self._resume_sleep_countdown_if_needed)
+                 self._sleep_resume_retry_timer.start()
         
         if not suppress_ui:
             self.show_controls()
@@ -9585,7 +10447,7 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             try:
-                self.total_duration = 0
+                self.total_duration = 0.0
             except Exception:
                 pass
 
@@ -9816,7 +10678,7 @@ class MainWindow(QMainWindow):
             pass
         try:
             self._resume_sleep_countdown_if_needed()
-            QTimer.singleShot(200, self._resume_sleep_countdown_if_needed)
+            self._sleep_resume_retry_timer.start()
         except Exception:
             pass
 
@@ -10206,12 +11068,12 @@ class MainWindow(QMainWindow):
         out = []
         for folder in folders:
             try:
-                for name in os.listdir(folder):
-                    full = os.path.join(folder, name)
-                    if not os.path.isfile(full):
-                        continue
-                    if os.path.splitext(name)[1].lower() in audio_exts:
-                        out.append(full)
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if not entry.is_file():
+                            continue
+                        if os.path.splitext(entry.name)[1].lower() in audio_exts:
+                            out.append(entry.path)
             except Exception:
                 continue
 
@@ -10310,9 +11172,9 @@ class MainWindow(QMainWindow):
         pm = self.playlist_manager
 
         # Determine where playback will resume after this bump.
-        pending = getattr(self, '_pending_next_index', None)
+        pending = self._pending_next
         if pending is not None:
-            start = int(pending) + 1
+            start = pending[0] + 1
         else:
             start = int(getattr(pm, 'current_index', -1) or -1) + 1
 
@@ -10454,9 +11316,9 @@ class MainWindow(QMainWindow):
         try:
             if not bool(getattr(self, '_bump_music_cut_active', False)):
                 prev = getattr(self, '_bump_fx_interrupt_prev_mute', None)
-                if prev is not None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
+                if prev is not None and self._mpv is not None:
                     try:
-                        self.player.mpv.mute = bool(prev)
+                        self._mpv.mute = bool(prev)
                     except Exception:
                         pass
         except Exception:
@@ -10490,11 +11352,11 @@ class MainWindow(QMainWindow):
 
         self._bump_outro_audio_exclusive = True
         try:
-            if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
+            if self._mpv is not None:
                 if not bool(getattr(self, '_bump_music_cut_active', False)):
-                    self._bump_music_cut_prev_mute = bool(getattr(self.player.mpv, 'mute', False))
+                    self._bump_music_cut_prev_mute = bool(getattr(self._mpv, 'mute', False))
                 self._bump_music_cut_active = True
-                self.player.mpv.mute = True
+                self._mpv.mute = True
         except Exception:
             pass
 
@@ -10577,19 +11439,19 @@ class MainWindow(QMainWindow):
             if mix == 'cut':
                 # Permanently mute bump music for the remainder of the bump.
                 try:
-                    if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
+                    if self._mpv is not None:
                         if not bool(getattr(self, '_bump_music_cut_active', False)):
-                            self._bump_music_cut_prev_mute = bool(getattr(self.player.mpv, 'mute', False))
+                            self._bump_music_cut_prev_mute = bool(getattr(self._mpv, 'mute', False))
                         self._bump_music_cut_active = True
-                        self.player.mpv.mute = True
+                        self._mpv.mute = True
                 except Exception:
                     pass
 
             if mix == 'interrupt':
                 try:
-                    if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                        self._bump_fx_interrupt_prev_mute = bool(getattr(self.player.mpv, 'mute', False))
-                        self.player.mpv.mute = True
+                    if self._mpv is not None:
+                        self._bump_fx_interrupt_prev_mute = bool(getattr(self._mpv, 'mute', False))
+                        self._mpv.mute = True
                 except Exception:
                     self._bump_fx_interrupt_prev_mute = None
 
@@ -10620,12 +11482,10 @@ class MainWindow(QMainWindow):
          if self.current_card_index >= len(self.current_bump_script):
              self.lbl_bump_text.setText("")
              self.stop_bump_playback()
-             pending = getattr(self, '_pending_next_index', None)
+             pending = self._pending_next
              if pending is not None:
-                 idx = int(pending)
-                 record_history = bool(getattr(self, '_pending_next_record_history', True))
-                 self._pending_next_index = None
-                 self._pending_next_record_history = True
+                 idx, record_history = pending
+                 self._pending_next = None
                  self._advancing_from_bump_end = True
                  try:
                      self.play_index(idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=True)
@@ -10911,9 +11771,9 @@ class MainWindow(QMainWindow):
         # Restore bump music mute state if a "cut" was applied.
         try:
             prev = getattr(self, '_bump_music_cut_prev_mute', None)
-            if prev is not None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
+            if prev is not None and self._mpv is not None:
                 try:
-                    self.player.mpv.mute = bool(prev)
+                    self._mpv.mute = bool(prev)
                 except Exception:
                     pass
         except Exception:
@@ -10957,7 +11817,7 @@ class MainWindow(QMainWindow):
         # If player is idle but we have a playlist, start playing
         idle = False
         try:
-             idle = self.player.mpv.idle_active
+             idle = self._mpv.idle_active
         except:
              idle = True # assume
              
@@ -11011,8 +11871,8 @@ class MainWindow(QMainWindow):
 
         # If the player is idle (no active file), don't apply a penalty.
         try:
-            if hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                if bool(getattr(self.player.mpv, 'core_idle', True)):
+            if self._mpv is not None:
+                if bool(getattr(self._mpv, 'core_idle', True)):
                     return False
         except Exception:
             pass
@@ -11036,11 +11896,11 @@ class MainWindow(QMainWindow):
         # If duration is unknown, we still treat manual navigation/stop as a cut-off.
         try:
             pos = self._last_time_pos
-            if pos is None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                pos = getattr(self.player.mpv, 'time_pos', None)
+            if pos is None and self._mpv is not None:
+                pos = getattr(self._mpv, 'time_pos', None)
             dur = self.total_duration
-            if (dur is None or float(dur) <= 0) and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                dur = getattr(self.player.mpv, 'duration', None)
+            if (dur is None or float(dur) <= 0) and self._mpv is not None:
+                dur = getattr(self._mpv, 'duration', None)
 
             if pos is not None and dur is not None and float(dur) > 0:
                 if float(pos) >= (float(dur) - 0.15):
@@ -11090,6 +11950,9 @@ class MainWindow(QMainWindow):
 
     def play_next(self):
         pm = self.playlist_manager
+        play_index = self.play_index
+        stop_bump = self.stop_bump_playback
+        on_bump_surface = self._on_bump_surface
 
         # One-shot bypass used when a bump has just ended and we want to advance
         # without immediately triggering the global bump gate again.
@@ -11117,14 +11980,13 @@ class MainWindow(QMainWindow):
             pass
 
         # If a bump-gated next is pending and the user hits Next again, skip the bump.
-        if getattr(self, '_pending_next_index', None) is not None and self.video_stack.currentIndex() == 1:
-            idx = int(self._pending_next_index)
-            record_history = bool(getattr(self, '_pending_next_record_history', True))
-            self._pending_next_index = None
-            self._pending_next_record_history = True
-            self.stop_bump_playback()
+        pending = self._pending_next
+        if on_bump_surface and pending is not None:
+            idx, record_history = pending
+            self._pending_next = None
+            stop_bump()
             # User explicitly skipped the bump; do not suppress UI.
-            self.play_index(idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=False)
+            play_index(idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=False)
             return
 
         next_idx = -1
@@ -11157,7 +12019,7 @@ class MainWindow(QMainWindow):
         try:
             next_item = pm.current_playlist[next_idx]
             if isinstance(next_item, dict) and next_item.get('type') == 'bump':
-                self.play_index(next_idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=bool(suppress_ui))
+                play_index(next_idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=bool(suppress_ui))
                 return
         except Exception:
             pass
@@ -11166,8 +12028,9 @@ class MainWindow(QMainWindow):
         if (
             self.bumps_enabled
             and (not bypass_bump_gate_once)
-            and self.video_stack.currentIndex() != 1
-            and not bool(getattr(self, '_in_bump_playback', False))
+            and (not on_bump_surface)
+            and (not self._in_bump_playback)
+            and pm.bump_manager.has_bumps()
         ):
             bump_item = None
             try:
@@ -11176,13 +12039,12 @@ class MainWindow(QMainWindow):
                 bump_item = None
 
             if bump_item:
-                self._pending_next_index = int(next_idx)
-                self._pending_next_record_history = bool(record_history)
-                self.stop_bump_playback()
+                self._pending_next = (int(next_idx), bool(record_history))
+                stop_bump()
                 self._play_bump_with_optional_interstitial(bump_item)
                 return
 
-        self.play_index(next_idx, record_history=record_history, suppress_ui=bool(suppress_ui))
+        play_index(next_idx, record_history=record_history, suppress_ui=bool(suppress_ui))
 
     def _fallback_previous_episode_index(self) -> int:
         pm = getattr(self, 'playlist_manager', None)
@@ -11223,8 +12085,7 @@ class MainWindow(QMainWindow):
 
         # If we were in bump playback or a bump-gated transition, cancel it.
         try:
-            self._pending_next_index = None
-            self._pending_next_record_history = True
+            self._pending_next = None
         except Exception:
             pass
         try:
@@ -11271,9 +12132,7 @@ class MainWindow(QMainWindow):
         # First press goes to start of current episode if we're not near the beginning.
         try:
             pos = self._last_time_pos
-            if pos is None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                pos = getattr(self.player.mpv, 'time_pos', None)
-            if pos is not None and float(pos) > 3.0:
+            if pos is not None and pos > 3.0:
                 self.player.seek(0)
                 return
         except Exception:
@@ -11281,8 +12140,7 @@ class MainWindow(QMainWindow):
 
         # If we were in bump playback or a bump-gated transition, cancel it.
         try:
-            self._pending_next_index = None
-            self._pending_next_record_history = True
+            self._pending_next = None
         except Exception:
             pass
         try:
@@ -11315,9 +12173,7 @@ class MainWindow(QMainWindow):
         # 1) First press goes to start of current episode if we're not near the beginning.
         try:
             pos = self._last_time_pos
-            if pos is None and hasattr(self, 'player') and self.player and getattr(self.player, 'mpv', None):
-                pos = getattr(self.player.mpv, 'time_pos', None)
-            if pos is not None and float(pos) > 3.0:
+            if pos is not None and pos > 3.0:
                 self.player.seek(0)
                 return
         except Exception:
@@ -11343,7 +12199,7 @@ class MainWindow(QMainWindow):
     def on_playback_finished(self):
         # Ignore mpv EOF during bump scripts; bump_timer controls the bump sequence.
         try:
-            if self.video_stack.currentIndex() == 1 and self.current_bump_script:
+            if self._on_bump_surface and self.current_bump_script:
                 return
         except Exception:
             pass
@@ -11361,12 +12217,10 @@ class MainWindow(QMainWindow):
                     pass
 
                 # Honor bump-gated pending next index first.
-                pending = getattr(self, '_pending_next_index', None)
+                pending = self._pending_next
                 if pending is not None:
-                    idx = int(pending)
-                    record_history = bool(getattr(self, '_pending_next_record_history', True))
-                    self._pending_next_index = None
-                    self._pending_next_record_history = True
+                    idx, record_history = pending
+                    self._pending_next = None
                     try:
                         self.play_index(idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=True)
                     except Exception:
@@ -11457,12 +12311,10 @@ class MainWindow(QMainWindow):
                     pass
 
                 # Honor bump-gated pending next index first.
-                pending = getattr(self, '_pending_next_index', None)
+                pending = self._pending_next
                 if pending is not None:
-                    idx = int(pending)
-                    record_history = bool(getattr(self, '_pending_next_record_history', True))
-                    self._pending_next_index = None
-                    self._pending_next_record_history = True
+                    idx, record_history = pending
+                    self._pending_next = None
                     try:
                         self.play_index(idx, record_history=record_history, bypass_bump_gate=True, suppress_ui=True)
                     except Exception:
@@ -11737,12 +12589,9 @@ class MainWindow(QMainWindow):
         
     def on_seek_end(self):
         val = self.play_mode_widget.slider_seek.value()
-        # Calculate target time
-        if self.total_duration > 0:
-            pct = max(0.0, min(100.0, float(val)))
-            target = (pct / 100.0) * float(self.total_duration)
-            self.player.seek(target)
+        self.player.seek_percent(max(0, min(100, val)))
         self.is_seeking = False
+        self._last_seeker_percent = -1
 
     def seek_relative(self, offset):
         if self.player:
@@ -11752,199 +12601,148 @@ class MainWindow(QMainWindow):
         # Called by sliderMoved (dragging and our ClickableSlider click-to-position).
         # Seek immediately so timeline clicks work.
         try:
-            if self.total_duration > 0:
-                pct = max(0.0, min(100.0, float(val)))
-                target = (pct / 100.0) * float(self.total_duration)
-                self.player.seek(target)
+            self.player.seek_percent(max(0, min(100, val)))
+            self._last_seeker_percent = -1
         except Exception:
             return
 
     def update_seeker(self, time_pos):
+        # Hot path: called on every mpv time-pos change. Keep attribute lookups
+        # to plain instance reads and bind what we touch more than once.
+        mpv = self._mpv
+        if mpv is None:
+            return
+
         # If the sleep timer is enabled, start/resume countdown only once
         # playback is actually progressing.
-        if getattr(self, 'sleep_timer_active', False):
+        if self.sleep_timer_active:
             self._resume_sleep_countdown_if_needed()
 
         self._last_time_pos = time_pos
 
         # Progress tracking for missing-media stall detection.
-        try:
-            now = float(time.monotonic())
-            self._time_pos_last_update_mono = now
-        except Exception:
-            now = 0.0
-        try:
-            prev = getattr(self, '_time_pos_last_value', None)
-        except Exception:
-            prev = None
+        now = time.monotonic()
+        self._time_pos_last_update_mono = now
+        prev = self._time_pos_last_value
         try:
             cur = float(time_pos) if time_pos is not None else None
         except Exception:
             cur = None
-        try:
-            self._time_pos_last_value = cur
-        except Exception:
-            pass
-        try:
-            if now and cur is not None:
-                if prev is None or abs(float(cur) - float(prev)) >= 0.25:
-                    self._time_pos_last_progress_mono = now
-        except Exception:
-            pass
+        self._time_pos_last_value = cur
+        if cur is not None and (prev is None or abs(cur - prev) >= 0.25):
+            self._time_pos_last_progress_mono = now
 
         try:
             self._persist_resume_state(force=False, reason='time_pos')
         except Exception:
             pass
 
-        if not self.is_seeking and self.total_duration > 0:
-            dur = float(self.total_duration)
-            pos = float(time_pos) if time_pos is not None else 0.0
-
+        # mpv reports time-pos far more often than the slider (100 steps) or the
+        # time label (1s resolution) can change; only push actual changes to Qt.
+        dur = self.total_duration
+        pos = cur or 0.0
+        if not self.is_seeking and dur > 0:
             # mpv often reports time-pos that never exactly equals duration,
             # so snap to 100% when we're effectively at the end.
-            if pos >= max(0.0, dur - 0.10):
-                percent = 100
-            else:
-                ratio = 0.0 if dur <= 0 else max(0.0, min(1.0, pos / dur))
-                percent = int(round(ratio * 100.0))
+            percent = 100 if pos + 0.10 >= dur else max(0, int(pos * 100.0 / dur))
 
-            self.play_mode_widget.slider_seek.setValue(percent)
-            
-        self.update_time_label(time_pos, self.total_duration)
+            if percent != self._last_seeker_percent:
+                self._last_seeker_percent = percent
+                set_seek_value = self.play_mode_widget.slider_seek.setValue
+                set_seek_value(percent)
+
+        sec = int(pos)
+        if sec != self._last_seeker_sec:
+            self._last_seeker_sec = sec
+            self.update_time_label(time_pos, dur)
 
     def _check_playback_end(self):
         # Runs on the Qt thread.
+        mpv = self._mpv
+        if mpv is None or self._advancing_from_eof:
+            return
+        pm = self.playlist_manager
         try:
-            if not hasattr(self, 'player') or not self.player or not getattr(self.player, 'mpv', None):
-                return
-
             # Don't auto-advance during bump scripts; bump_timer controls progression.
-            try:
-                if self.video_stack.currentIndex() == 1 and self.current_bump_script:
-                    return
-            except Exception:
-                pass
+            if self.current_bump_script and self._on_bump_surface:
+                return
 
-            if not self.playlist_manager.current_playlist:
+            if not pm.current_playlist:
                 return
 
             # Bump-video playback isn't tied to playlist indices. Track EOF separately.
-            is_bump_video = False
-            try:
-                is_bump_video = bool(getattr(self, '_in_bump_playback', False)) and bool(getattr(self, '_current_bump_is_video', False))
-            except Exception:
-                is_bump_video = False
+            is_bump_video = bool(self._in_bump_playback) and bool(self._current_bump_is_video)
 
-            idx = self.playlist_manager.current_index
+            idx = pm.current_index
             if (idx is None or idx < 0) and (not is_bump_video):
                 return
 
+            play_start = self._play_start_monotonic
+            key = None
             if not is_bump_video:
                 # Only handle EOF once per index.
                 if self._handled_eof_for_index == idx:
                     return
             else:
-                try:
-                    vpath = str(getattr(self, '_current_bump_video_path', '') or '').strip()
-                except Exception:
-                    vpath = ''
-                try:
-                    key = (str(vpath), float(getattr(self, '_play_start_monotonic', 0.0) or 0.0))
-                except Exception:
-                    key = (str(vpath), 0.0)
-                try:
-                    if getattr(self, '_handled_eof_for_bump_key', None) == key:
-                        return
-                except Exception:
-                    pass
+                vpath = str(self._current_bump_video_path or '').strip()
+                key = (vpath, float(play_start or 0.0))
+                if self._handled_eof_for_bump_key == key:
+                    return
 
             # Avoid firing immediately after starting a file.
-            if self._play_start_monotonic is not None:
-                if (time.monotonic() - self._play_start_monotonic) < 0.75:
-                    return
+            now = time.monotonic()
+            if play_start is not None and (now - play_start) < 0.75:
+                return
 
-            mpv = self.player.mpv
+            # One read of each mpv property per tick (python-mpv returns bools/None).
+            eof_reached = mpv.eof_reached
+            core_idle = mpv.core_idle
+            paused = mpv.pause
 
             # Missing-media stall detection: if playback appears to be active but
             # time-pos isn't advancing and the current target disappeared, enter
             # recovery immediately (avoid permanent gray screen).
-            try:
-                # Don't interfere while we are already waiting for reconnect.
-                if getattr(self, '_missing_media_waiting_for_target', None):
-                    pass
-                else:
-                    core_idle_now = bool(getattr(mpv, 'core_idle', False))
-                    paused_now = bool(getattr(mpv, 'pause', True))
-                    if (not core_idle_now) and (not paused_now) and (not is_bump_video):
-                        last_prog = float(getattr(self, '_time_pos_last_progress_mono', 0.0) or 0.0)
-                        if last_prog:
-                            stall_s = float(time.monotonic()) - last_prog
-                            if stall_s > float(getattr(self, '_missing_media_stall_timeout_s', 2.5) or 2.5):
-                                target = str(getattr(self, '_last_play_target', '') or '').strip()
-                                if target:
-                                    try:
-                                        if not os.path.exists(target):
-                                            self._maybe_start_missing_media_recovery(reason='watchdog_stall')
-                                    except Exception:
-                                        pass
-            except Exception:
-                pass
-
-            # Prefer mpv's eof flag if available.
-            eof_reached = False
-            try:
-                eof_reached = bool(getattr(mpv, 'eof_reached'))
-            except Exception:
-                eof_reached = False
+            # Don't interfere while we are already waiting for reconnect.
+            if (
+                (not self._missing_media_waiting_for_target)
+                and (not core_idle)
+                and (not paused)
+                and (not is_bump_video)
+            ):
+                last_prog = self._time_pos_last_progress_mono
+                if last_prog and (now - last_prog) > self._missing_media_stall_timeout_s:
+                    target = str(self._last_play_target or '').strip()
+                    if target and not os.path.exists(target):
+                        self._maybe_start_missing_media_recovery(reason='watchdog_stall')
 
             # Fallback: if time-pos is basically duration and mpv is idle/paused.
             pos = self._last_time_pos
             dur = self.total_duration
             if not dur:
-                try:
-                    dur = float(getattr(mpv, 'duration') or 0)
-                except Exception:
-                    dur = 0
-
-            core_idle = False
-            paused = True
-            try:
-                core_idle = bool(getattr(mpv, 'core_idle'))
-            except Exception:
-                core_idle = False
-            try:
-                paused = bool(getattr(mpv, 'pause'))
-            except Exception:
-                paused = True
+                dur = mpv.duration or 0.0
 
-            pos_at_end = False
-            if dur and pos is not None:
-                try:
-                    pos_at_end = float(pos) >= (float(dur) - 0.15)
-                except Exception:
-                    pos_at_end = False
+            pos_at_end = bool(dur) and pos is not None and pos >= dur - 0.15
 
-            should_advance = False
-            if eof_reached:
-                should_advance = True
-            elif self._played_since_start and pos_at_end and (core_idle or paused):
-                should_advance = True
+            should_advance = eof_reached or (self._played_since_start and pos_at_end and (core_idle or paused))
 
-            if should_advance:
-                if not is_bump_video:
-                    self._handled_eof_for_index = idx
-                else:
-                    try:
-                        self._handled_eof_for_bump_key = key
-                    except Exception:
-                        pass
-                QTimer.singleShot(0, self.on_playback_finished)
+            if not should_advance:
+                return
+            if not is_bump_video:
+                self._handled_eof_for_index = idx
+            else:
+                self._handled_eof_for_bump_key = key
         except Exception:
             return
 
+        # Already on the Qt thread; advance directly. The dedup keys above are
+        # set first, and _advancing_from_eof blocks re-entry during play_next.
+        self.on_playback_finished()
+
     def update_duration(self, duration):
-        self.total_duration = duration
+        # Stored as float once so per-tick consumers never re-coerce.
+        self.total_duration = float(duration or 0.0)
+        self._last_seeker_percent = -1
+        self._last_seeker_sec = -1
         self.update_time_label(0, duration) # Reset current? or keep
 
         try:
@@ -11985,23 +12783,27 @@ class MainWindow(QMainWindow):
             pass
 
     def update_time_label(self, current, total):
-        def fmt(s):
-            m, s = divmod(int(s), 60)
-            h, m = divmod(m, 60)
-            if h > 0: return f"{h}:{m:02d}:{s:02d}"
-            return f"{m:02d}:{s:02d}"
-        self.play_mode_widget.lbl_current_time.setText(f"{fmt(current)} / {fmt(total)}")
+        text = f"{_fmt_time(current or 0)} / {_fmt_time(total or 0)}"
+        if text != self._last_time_label_text:
+            self._last_time_label_text = text
+            self.play_mode_widget.lbl_current_time.setText(text)
 
     def on_sleep_timer(self):
         try:
             self._set_stop_reason('sleep_timer_fired')
         except Exception:
             pass
-        self.stop_playback()
-        self.set_mode(0) # Go to Welcome
+        # Batch the stop / mode switch / timer reset into a single repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            self.stop_playback()
+            self.set_mode(0) # Go to Welcome
 
-        # Ensure internal state + UI reflects Off after timer fires.
-        self.cancel_sleep_timer()
+            # Ensure internal state + UI reflects Off after timer fires.
+            self.cancel_sleep_timer()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def closeEvent(self, event):
         try:
@@ -12037,7 +12839,7 @@ if __name__ == "__main__":
     # On Windows, ensure the process is DPI-aware so Qt sees the real screen
     # geometry and our percent-of-screen sizing matches the user's resolution.
     try:
-        if platform.system().lower().startswith('win'):
+        if _IS_WIN:
             import ctypes
             try:
                 # Per-monitor v2 DPI awareness (best on modern Windows).
@@ -8,6 +8,7 @@ class MpvPlayer(QWidget):
     positionChanged = Signal(float)
     durationChanged = Signal(float)
     playbackFinished = Signal()
+    eofDetected = Signal()
     errorOccurred = Signal(str)
     endFileReason = Signal(str)
     playbackPaused = Signal(bool)
@@ -98,10 +99,6 @@ class MpvPlayer(QWidget):
 
         return
 
-    @Slot(float)
-    def _emit_position(self, value: float):
-        self.positionChanged.emit(float(value))
-
     @Slot(float)
     def _emit_duration(self, value: float):
         self.durationChanged.emit(float(value))
@@ -114,6 +111,10 @@ class MpvPlayer(QWidget):
     def _emit_finished(self):
         self.playbackFinished.emit()
 
+    @Slot()
+    def _emit_eof_detected(self):
+        self.eofDetected.emit()
+
     @Slot(str)
     def _emit_end_file_reason(self, reason: str):
         try:
@@ -216,11 +217,14 @@ class MpvPlayer(QWidget):
                     pass
 
             # Setup event callbacks
+            # time-pos is the only high-frequency property. Emit straight from the
+            # mpv thread: receivers connect with Qt.QueuedConnection, so this is a
+            # single hop into the GUI loop rather than invokeMethod + re-emit.
             @self.mpv.property_observer('time-pos')
             def time_observer(_name, value):
                 if value is not None:
                     try:
-                        QMetaObject.invokeMethod(self, "_emit_position", Qt.QueuedConnection, Q_ARG(float, float(value)))
+                        self.positionChanged.emit(float(value))
                     except Exception:
                         pass
 
@@ -239,6 +243,24 @@ class MpvPlayer(QWidget):
                 except Exception:
                     pass
 
+            # EOF detection without polling: mpv flips eof-reached (keep-open) or
+            # idle-active (file unloaded) when a file runs out. Consumers dedupe.
+            @self.mpv.property_observer('eof-reached')
+            def eof_observer(_name, value):
+                if value:
+                    try:
+                        QMetaObject.invokeMethod(self, "_emit_eof_detected", Qt.QueuedConnection)
+                    except Exception:
+                        pass
+
+            @self.mpv.property_observer('idle-active')
+            def idle_observer(_name, value):
+                if value:
+                    try:
+                        QMetaObject.invokeMethod(self, "_emit_eof_detected", Qt.QueuedConnection)
+                    except Exception:
+                        pass
+
             # NOTE: We use property observer for mouse position to detect hover
             @self.mpv.property_observer('mouse-pos')
             def mouse_pos_observer(_name, value):
@@ -334,6 +356,11 @@ class MpvPlayer(QWidget):
     def seek_relative(self, offset):
         if self.mpv:
             self.mpv.seek(offset, reference="relative")
+
+    def seek_percent(self, percent):
+        # Let mpv resolve the target against its own duration.
+        if self.mpv:
+            self.mpv.seek(percent, reference="absolute-percent")
             
     def set_volume(self, volume):
         if self.mpv:
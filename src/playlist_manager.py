@@ -49,6 +49,31 @@ def get_local_playlists_dir() -> str:
     except Exception:
         return os.path.join(os.getcwd(), 'playlists')
 
+def annotate_display_names(items):
+    """Cache each path item's basename under 'name' so playback/UI code can skip re-deriving it.
+
+    Always recomputed from 'path', so a stale 'name' from an older file can't stick.
+    """
+    for item in items:
+        if isinstance(item, dict):
+            path = item.get('path')
+            if path:
+                item['name'] = os.path.basename(path)
+            else:
+                item.pop('name', None)
+    return items
+
+
+def strip_display_names(items):
+    """Return items without the runtime 'name' cache, for writing playlist JSON."""
+    out = []
+    for item in items:
+        if isinstance(item, dict) and 'name' in item:
+            item = {k: v for k, v in item.items() if k != 'name'}
+        out.append(item)
+    return out
+
+
 def natural_sort_key(s):
     """
     Splits string into a list of integers and text chunks.
@@ -1529,7 +1554,7 @@ class PlaylistManager:
         
         for i, ep_path in enumerate(pool):
             # Add Episode
-            final_list.append({'type': 'video', 'path': ep_path})
+            final_list.append({'type': 'video', 'path': ep_path, 'name': os.path.basename(ep_path)})
             
             if i < len(pool) - 1: # Gap exists
                 # Determine injection
@@ -1543,7 +1568,7 @@ class PlaylistManager:
                     choice = random.choice(candidates)
                     if choice == 'int':
                         inte = self.get_next_interstitial_path() or random.choice(self.interstitials)
-                        final_list.append({'type': 'interstitial', 'path': inte})
+                        final_list.append({'type': 'interstitial', 'path': inte, 'name': os.path.basename(inte)})
                     elif choice == 'bump':
                         bump_obj = self.bump_manager.get_next_bump()
                         if bump_obj:
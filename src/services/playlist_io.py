@@ -3,6 +3,11 @@ import os
 import re
 from dataclasses import dataclass
 
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 
 _URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://')
 
@@ -39,10 +44,51 @@ def load_playlist_json(source_path: str) -> PlaylistLoadResult:
     if not os.path.exists(src):
         raise FileNotFoundError(src)
 
-    with open(src, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(src, 'rb') as f:
+        raw = f.read()
+    data = _loads(raw)
 
     if not isinstance(data, dict):
         raise RuntimeError('Invalid playlist file format (expected JSON object).')
 
     return PlaylistLoadResult(source_path=src, data=data)
+
+
+def save_playlist_json(dest_path: str, data: dict) -> None:
+    """Write a playlist JSON file atomically (temp file + os.replace)."""
+    dst = str(dest_path or '')
+    if not dst:
+        raise RuntimeError('No playlist file provided.')
+
+    payload = _dumps(data)
+    tmp = dst + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, dst)
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+        raise
+
+
+def _loads(raw: bytes):
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            # orjson is stricter than json (e.g. NaN); fall back before failing.
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dumps(data) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2).encode('utf-8')